@@ -1172,15 +1172,16 @@ def run_jacoco_analysis(path: str = None):
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir, exist_ok=True)
 
+            # Serialize once; the same JSON is saved and embedded in the AI prompt
+            json_str = json.dumps(formatted_result, indent=2, ensure_ascii=False)
             with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(formatted_result, f, indent=2, ensure_ascii=False)
+                f.write(json_str)
 
             console.print(
                 f"[green]Results saved to:[/green] [bold]{output_file}[/bold]"
             )
 
             # Generate AI prompt for unit test generation
-            json_str = json.dumps(formatted_result, indent=2, ensure_ascii=False)
             ai_prompt = generate_jacoco_ai_prompt(formatted_result, json_str)
 
             console.print()
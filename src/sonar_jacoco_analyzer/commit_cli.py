@@ -751,8 +751,7 @@ def run_local_workflow(config: CommitConfig):
         show_error(str(e))
 
         # Offer to show unstaged changes
-        unstaged = git_ops.get_unstaged_changes()
-        untracked = git_ops.get_untracked_files()
+        unstaged, untracked = git_ops.get_working_tree_changes()
 
         if unstaged or untracked:
             console.print()
@@ -768,7 +767,7 @@ def run_local_workflow(config: CommitConfig):
         return
 
     # Get and display staged changes
-    staged = git_ops.get_staged_changes()
+    staged = git_ops.get_staged_changes(include_diff=True)
     metrics = git_ops.analyze_change_complexity()
     display_staged_changes(staged, metrics)
 
@@ -797,92 +796,94 @@ def run_local_workflow(config: CommitConfig):
         show_error(str(e))
         return
 
-    # Generate commit message(s)
-    if groups_to_process:
-        # Generate messages for each group
-        with console.status("[cyan]Generating commit messages...[/cyan]"):
-            commits = generator.generate_split_commits(groups_to_process)
-
-        for i, (group, commit) in enumerate(zip(groups_to_process, commits), 1):
-            console.print(f"\n[bold]Commit {i}/{len(commits)}: {group.name}[/bold]")
-            diff_summary = (
-                f"Files: {group.file_count} | "
-                f"Changes: +{group.total_additions} -{group.total_deletions}"
-            )
-            display_commit_preview(commit, diff_summary)
-
-        console.print()
-        console.print(
-            "[yellow]Please manually stage and commit each group.[/yellow]"
-        )
-        console.print("[dim]The suggested messages are shown above.[/dim]")
-    else:
-        # Generate single commit message
-        file_paths = [f.file_path for f in staged.files]
-
-        with console.status("[cyan]Generating commit message with AI...[/cyan]"):
-            try:
-                commit = generator.generate_commit_message(
-                    diff_content=staged.diff_content,
-                    file_paths=file_paths,
+    # Generate commit message(s); regeneration reuses the generator until done
+    with generator:
+        if groups_to_process:
+            # Generate messages for each group
+            with console.status("[cyan]Generating commit messages...[/cyan]"):
+                commits = generator.generate_split_commits(groups_to_process)
+
+            for i, (group, commit) in enumerate(zip(groups_to_process, commits), 1):
+                console.print(f"\n[bold]Commit {i}/{len(commits)}: {group.name}[/bold]")
+                diff_summary = (
+                    f"Files: {group.file_count} | "
+                    f"Changes: +{group.total_additions} -{group.total_deletions}"
                 )
-            except CommitGeneratorError as e:
-                show_error(f"Failed to generate commit message: {e}")
-                return
-
-        diff_summary = (
-            f"Files: {metrics.total_files} | "
-            f"Changes: +{staged.total_additions} -{staged.total_deletions}"
-        )
+                display_commit_preview(commit, diff_summary)
 
-        while True:
-            display_commit_preview(commit, diff_summary)
-
-            choice = request_user_approval()
+            console.print()
+            console.print(
+                "[yellow]Please manually stage and commit each group.[/yellow]"
+            )
+            console.print("[dim]The suggested messages are shown above.[/dim]")
+        else:
+            # Generate single commit message
+            file_paths = [f.file_path for f in staged.files]
+
+            with console.status("[cyan]Generating commit message with AI...[/cyan]"):
+                try:
+                    commit = generator.generate_commit_message(
+                        diff_content=staged.diff_content,
+                        file_paths=file_paths,
+                    )
+                except CommitGeneratorError as e:
+                    show_error(f"Failed to generate commit message: {e}")
+                    return
 
-            if choice == "approve":
-                # Create the commit
-                result = git_ops.create_commit(commit.formatted_message)
-                if result.success:
-                    display_commit_result(git_ops, result.sha)
-                else:
-                    show_error(result.error or "Commit failed")
-                break
+            diff_summary = (
+                f"Files: {metrics.total_files} | "
+                f"Changes: +{staged.total_additions} -{staged.total_deletions}"
+            )
 
-            elif choice == "edit":
-                edited = edit_commit_message(commit.formatted_message)
-                # Update the commit object
-                commit.formatted_message = edited
-                # Re-display for final approval
-                continue
-
-            elif choice == "regenerate":
-                feedback = Prompt.ask(
-                    "[bold]Any feedback for regeneration?[/bold]",
-                    default="",
-                )
-                with console.status("[cyan]Regenerating commit message...[/cyan]"):
-                    try:
-                        if feedback:
-                            commit = generator.regenerate_with_feedback(
-                                commit.formatted_message,
-                                feedback,
-                                staged.diff_content,
-                                file_paths,
-                            )
-                        else:
-                            commit = generator.generate_commit_message(
-                                staged.diff_content, file_paths
-                            )
-                    except CommitGeneratorError as e:
-                        show_error(f"Regeneration failed: {e}")
-                        continue
-                continue
-
-            else:  # cancel
-                console.print()
-                console.print("[dim]Commit cancelled. No changes were made.[/dim]")
-                break
+            while True:
+                display_commit_preview(commit, diff_summary)
+
+                choice = request_user_approval()
+
+                if choice == "approve":
+                    # Create the commit
+                    result = git_ops.create_commit(commit.formatted_message)
+                    if result.success:
+                        display_commit_result(git_ops, result.sha)
+                    else:
+                        show_error(result.error or "Commit failed")
+                    break
+
+                elif choice == "edit":
+                    edited = edit_commit_message(commit.formatted_message)
+                    # Update the commit object
+                    commit.formatted_message = edited
+                    # Re-display for final approval
+                    continue
+
+                elif choice == "regenerate":
+                    feedback = Prompt.ask(
+                        "[bold]Any feedback for regeneration?[/bold]",
+                        default="",
+                    )
+                    with console.status("[cyan]Regenerating commit message...[/cyan]"):
+                        try:
+                            if feedback:
+                                commit = generator.regenerate_with_feedback(
+                                    commit.formatted_message,
+                                    feedback,
+                                    staged.diff_content,
+                                    file_paths,
+                                )
+                            else:
+                                # Ask the API again rather than returning the cached message
+                                commit = generator.generate_commit_message(
+                                    staged.diff_content, file_paths, use_cache=False
+                                )
+                        except CommitGeneratorError as e:
+                            show_error(f"Regeneration failed: {e}")
+                            continue
+                    continue
+
+                else:  # cancel
+                    console.print()
+                    console.print("[dim]Commit cancelled. No changes were made.[/dim]")
+                    break
 
 
 def run_github_workflow(config: CommitConfig):
@@ -965,7 +966,8 @@ def run_github_workflow(config: CommitConfig):
         show_error(str(e))
         return
 
-    with console.status("[cyan]Generating commit message with AI...[/cyan]"):
+    # The generator is only needed for this one request
+    with generator, console.status("[cyan]Generating commit message with AI...[/cyan]"):
         try:
             context = {
                 "existing_messages": [c.message for c in commits[:3]],
@@ -1256,8 +1258,7 @@ def run_quick_commit(config: CommitConfig):
         show_error(str(e))
 
         # Show unstaged/untracked files hint
-        unstaged = git_ops.get_unstaged_changes()
-        untracked = git_ops.get_untracked_files()
+        unstaged, untracked = git_ops.get_working_tree_changes()
 
         if unstaged or untracked:
             console.print()
@@ -1273,7 +1274,7 @@ def run_quick_commit(config: CommitConfig):
         return False
 
     # Get staged changes
-    staged = git_ops.get_staged_changes()
+    staged = git_ops.get_staged_changes(include_diff=True)
     metrics = git_ops.analyze_change_complexity()
 
     # Show brief summary
@@ -1291,7 +1292,8 @@ def run_quick_commit(config: CommitConfig):
     # Generate commit message
     file_paths = [f.file_path for f in staged.files]
 
-    with console.status("[cyan]Generating commit message...[/cyan]"):
+    # The generator is only needed for this one request
+    with generator, console.status("[cyan]Generating commit message...[/cyan]"):
         try:
             commit = generator.generate_commit_message(
                 diff_content=staged.diff_content,
@@ -1420,7 +1422,8 @@ def run_gitlab_workflow(config: CommitConfig):
         show_error(str(e))
         return
 
-    with console.status("[cyan]Generating commit message with AI...[/cyan]"):
+    # The generator is only needed for this one request
+    with generator, console.status("[cyan]Generating commit message with AI...[/cyan]"):
         try:
             context = {
                 "existing_messages": [c.message for c in commits[:3]],
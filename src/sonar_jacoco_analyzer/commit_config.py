@@ -15,18 +15,24 @@ class CommitConfig:
 
     # GitHub settings
     github_token: Optional[str] = None
-    github_per_page: int = 30
+    github_per_page: int = 100
 
     # GitLab settings
     gitlab_token: Optional[str] = None
     gitlab_url: str = "https://gitlab.com"
-    gitlab_per_page: int = 30
+    gitlab_per_page: int = 100
 
     # OpenAI settings
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4o"
     openai_temperature: float = 0.3
     openai_max_tokens: int = 1024
+    openai_context_window: int = 128000
+    openai_stream: bool = True
+
+    # Response cache settings (only used when openai_temperature == 0)
+    llm_cache: str = "memory"
+    llm_cache_ttl: int = 86400
 
     # Commit splitting settings
     max_commit_size: int = 200
@@ -61,16 +67,21 @@ class CommitConfig:
         return cls(
             # GitHub settings
             github_token=os.getenv("GITHUB_TOKEN"),
-            github_per_page=int(os.getenv("GITHUB_PER_PAGE", "30")),
+            github_per_page=int(os.getenv("GITHUB_PER_PAGE", "100")),
             # GitLab settings
             gitlab_token=os.getenv("GITLAB_TOKEN"),
             gitlab_url=os.getenv("GITLAB_URL", "https://gitlab.com"),
-            gitlab_per_page=int(os.getenv("GITLAB_PER_PAGE", "30")),
+            gitlab_per_page=int(os.getenv("GITLAB_PER_PAGE", "100")),
             # OpenAI settings
             openai_api_key=os.getenv("OPENAI_API_KEY"),
             openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
             openai_temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.3")),
             openai_max_tokens=int(os.getenv("OPENAI_MAX_TOKENS", "1024")),
+            openai_context_window=int(os.getenv("OPENAI_CONTEXT_WINDOW", "128000")),
+            openai_stream=os.getenv("OPENAI_STREAM", "true").lower() in ("true", "1", "yes"),
+            # Response cache
+            llm_cache=os.getenv("LLM_CACHE", "memory").lower(),
+            llm_cache_ttl=int(os.getenv("LLM_CACHE_TTL", "86400")),
             # Commit splitting
             max_commit_size=int(os.getenv("MAX_COMMIT_SIZE", "200")),
             complexity_threshold=int(os.getenv("COMPLEXITY_THRESHOLD", "50")),
@@ -111,10 +122,18 @@ class CommitConfig:
         if not 0.0 <= self.openai_temperature <= 2.0:
             errors.append("OPENAI_TEMPERATURE must be between 0.0 and 2.0.")
 
+        # Validate context window leaves room for the completion
+        if self.openai_context_window <= self.openai_max_tokens:
+            errors.append("OPENAI_CONTEXT_WINDOW must be greater than OPENAI_MAX_TOKENS.")
+
         # Validate max_commit_size
         if self.max_commit_size < 10:
             errors.append("MAX_COMMIT_SIZE must be at least 10.")
 
+        # Validate response cache backend
+        if self.llm_cache not in ("memory", "disk", "off"):
+            errors.append("LLM_CACHE must be one of: memory, disk, off.")
+
         return len(errors) == 0, errors
 
     def validate_github(self) -> tuple[bool, List[str]]:
@@ -177,6 +196,10 @@ class CommitConfig:
             "openai_model": self.openai_model,
             "openai_temperature": self.openai_temperature,
             "openai_max_tokens": self.openai_max_tokens,
+            "openai_context_window": self.openai_context_window,
+            "openai_stream": self.openai_stream,
+            "llm_cache": self.llm_cache,
+            "llm_cache_ttl": self.llm_cache_ttl,
             "max_commit_size": self.max_commit_size,
             "complexity_threshold": self.complexity_threshold,
             "has_github_token": bool(self.github_token),
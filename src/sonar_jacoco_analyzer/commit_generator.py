@@ -2,12 +2,18 @@
 OpenAI-powered commit message generation.
 """
 
+import hashlib
 import json
 import os
+import random
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional
 
-from openai import OpenAI, OpenAIError
+from openai import DefaultHttpxClient, OpenAI, OpenAIError, Timeout
+from openai import APIConnectionError, APITimeoutError
+from openai import RateLimitError as OpenAIRateLimitError
 
 from .commit_config import CommitConfig, get_openai_prompt_config
 from .conventional_commit import (
@@ -17,7 +23,59 @@ from .conventional_commit import (
     ScopeExtractor,
     CommitTypeDetector,
 )
-from .commit_splitter import SplitGroup
+from .commit_splitter import FileCategory, SplitGroup
+from .llm_cache import LLMCache, create_llm_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Transient OpenAI errors that are worth retrying with backoff
+_RETRYABLE_ERRORS = (OpenAIRateLimitError, APIConnectionError, APITimeoutError)
+
+# Human-readable names for git status codes in group summaries
+_STATUS_MAP = {"A": "added", "M": "modified", "D": "deleted", "R": "renamed"}
+
+# Tokens reserved for the non-diff part of the user message (file list, context)
+_USER_MESSAGE_OVERHEAD_TOKENS = 512
+
+# Character limit used to truncate diffs when no tokenizer is available
+_MAX_DIFF_CHARS = 8000
+
+# Shared tiktoken encodings, keyed by model name
+_ENCODINGS: Dict[str, object] = {}
+
+
+@lru_cache(maxsize=1024)
+def _format_commit_message(
+    commit_type: CommitType,
+    subject: str,
+    scope: Optional[str],
+    body: Optional[str],
+    breaking: bool,
+    breaking_description: Optional[str],
+) -> str:
+    """Format a commit message, reusing the result for repeated responses."""
+    return CommitMessageFormatter.create_commit_message(
+        commit_type=commit_type,
+        subject=subject,
+        scope=scope,
+        body=body,
+        breaking=breaking,
+        breaking_description=breaking_description,
+    )
 
 
 @dataclass
@@ -47,14 +105,15 @@ class GeneratedCommit:
         breaking_description = data.get("breaking_description")
 
         # Format the message
-        formatted = CommitMessageFormatter.create_commit_message(
-            commit_type=commit_type,
-            subject=subject,
-            scope=scope,
-            body=body,
-            breaking=breaking,
-            breaking_description=breaking_description,
-        )
+        try:
+            formatted = _format_commit_message(
+                commit_type, subject, scope, body, breaking, breaking_description
+            )
+        except TypeError:
+            # Unhashable values in a malformed response cannot be cached
+            formatted = _format_commit_message.__wrapped__(
+                commit_type, subject, scope, body, breaking, breaking_description
+            )
 
         return cls(
             type=commit_type,
@@ -67,6 +126,52 @@ class GeneratedCommit:
         )
 
 
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _json_loads(content: str):
+    """
+    Parse JSON, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to handle the latter.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _get_encoding(model: str):
+    """
+    Get the tiktoken encoding for a model, loading it at most once per process.
+
+    Args:
+        model: OpenAI model name.
+
+    Returns:
+        The encoding, or None if tiktoken is not installed or cannot load it.
+    """
+    if tiktoken is None:
+        return None
+
+    if model not in _ENCODINGS:
+        try:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            # Encoding files are downloaded on first use; fall back when offline
+            encoding = None
+        _ENCODINGS[model] = encoding
+
+    return _ENCODINGS[model]
+
+
 class CommitGeneratorError(Exception):
     """Base exception for commit generator errors."""
 
@@ -94,6 +199,16 @@ class InvalidResponseError(CommitGeneratorError):
 class CommitGenerator:
     """Generates commit messages using OpenAI."""
 
+    # Retry settings for transient API failures (exponential backoff with jitter)
+    MAX_ATTEMPTS = 6
+    RETRY_MIN_WAIT = 1.0
+    RETRY_MAX_WAIT = 60.0
+
+    # Small groups in these categories get a template message without an API call
+    TRIVIAL_CATEGORIES = frozenset({FileCategory.DOCS, FileCategory.CONFIG, FileCategory.STYLE})
+    TRIVIAL_MAX_LINES = 20
+    TRIVIAL_MAX_FILES = 3
+
     def __init__(self, config: Optional[CommitConfig] = None):
         """
         Initialize the commit generator.
@@ -108,14 +223,39 @@ class CommitGenerator:
                 "OpenAI API key is required. Set OPENAI_API_KEY environment variable."
             )
 
-        self.client = OpenAI(api_key=self.config.openai_api_key)
+        # One pooled keep-alive connection is reused for every call this
+        # generator makes; with h2 installed requests share it over HTTP/2
+        self._http_client = DefaultHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=Timeout(60.0, connect=5.0),
+        )
+        # _call_chat does its own retries; SDK retries would multiply the attempts
+        self.client = OpenAI(
+            api_key=self.config.openai_api_key, http_client=self._http_client, max_retries=0
+        )
         self.prompt_config = get_openai_prompt_config()
+        self.cache = create_llm_cache(self.config.llm_cache, self.config.llm_cache_ttl)
+        self._system_message = self._build_system_message()
+
+        self._enc = _get_encoding(self.config.openai_model)
+        self._sys_tokens = len(self._enc.encode(self._system_message)) if self._enc else 0
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http_client.close()
+
+    def __enter__(self) -> "CommitGenerator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def generate_commit_message(
         self,
         diff_content: str,
         file_paths: List[str],
         context: Optional[Dict] = None,
+        use_cache: bool = True,
     ) -> GeneratedCommit:
         """
         Generate a commit message for the given diff.
@@ -124,50 +264,167 @@ class CommitGenerator:
             diff_content: Git diff content.
             file_paths: List of changed file paths.
             context: Optional additional context.
+            use_cache: Reuse a cached response for an identical request. Pass
+                False when explicitly asking for a new message; the fresh
+                response still replaces the cached one.
 
         Returns:
             GeneratedCommit with the generated message.
         """
-        # Truncate diff if too large
-        max_diff_length = 8000
-        if len(diff_content) > max_diff_length:
-            diff_content = diff_content[:max_diff_length] + "\n... (truncated)"
-
         # Build the prompt
-        messages = self._build_messages(diff_content, file_paths, context)
+        messages = self._build_messages(self._truncate_diff(diff_content), file_paths, context)
+
+        # Reuse earlier responses for identical requests when output is deterministic
+        cache_key = None
+        if self.cache is not None and self.config.openai_temperature == 0:
+            cache_key = LLMCache.make_key({
+                "model": self.config.openai_model,
+                "messages": messages,
+                "temp": self.config.openai_temperature,
+                "max_tokens": self.config.openai_max_tokens,
+            })
+            cached = self.cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                return GeneratedCommit.from_dict(cached)
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.config.openai_model,
-                messages=messages,
-                temperature=self.config.openai_temperature,
-                max_tokens=self.config.openai_max_tokens,
-                response_format={"type": "json_object"},
-            )
-
-            # Parse response
-            content = response.choices[0].message.content
+            content = self._call_chat(messages)
             if not content:
                 raise InvalidResponseError("Empty response from API")
 
-            data = json.loads(content)
+            data = _json_loads(content)
+            if cache_key is not None:
+                self.cache.set(cache_key, data)
             return GeneratedCommit.from_dict(data)
 
         except json.JSONDecodeError as e:
             raise InvalidResponseError(f"Failed to parse API response as JSON: {e}")
         except OpenAIError as e:
-            if "rate_limit" in str(e).lower():
+            if isinstance(e, OpenAIRateLimitError) or "rate_limit" in str(e).lower():
                 raise RateLimitError("OpenAI API rate limit exceeded. Please try again later.")
             raise APIError(f"OpenAI API error: {e}")
 
-    def _build_messages(
-        self,
-        diff_content: str,
-        file_paths: List[str],
-        context: Optional[Dict] = None,
-    ) -> List[Dict[str, str]]:
-        """Build the messages for the OpenAI API call."""
-        # System message
+    def _truncate_diff(self, diff_content: str) -> str:
+        """
+        Truncate diff content that is too large to send to the API.
+
+        With tiktoken available the diff is cut at the token budget left in
+        the model's context window after the system prompt, the rest of the
+        user message and the completion. Otherwise a fixed character limit
+        is used.
+        """
+        if self._enc is None:
+            if len(diff_content) > _MAX_DIFF_CHARS:
+                diff_content = diff_content[:_MAX_DIFF_CHARS] + "\n... (truncated)"
+            return diff_content
+
+        budget = max(
+            self.config.openai_context_window
+            - self._sys_tokens
+            - _USER_MESSAGE_OVERHEAD_TOKENS
+            - self.config.openai_max_tokens,
+            0,
+        )
+        # Byte-level BPE tokens cover at least one UTF-8 byte each (but CJK
+        # text or emoji can take several tokens per character), so diffs no
+        # longer in bytes than the budget always fit. The character count is
+        # a lower bound on the byte count, and equal to it for ASCII.
+        if len(diff_content) <= budget and (
+            diff_content.isascii() or len(diff_content.encode("utf-8")) <= budget
+        ):
+            return diff_content
+
+        tokens = self._enc.encode(diff_content, disallowed_special=())
+        if len(tokens) > budget:
+            diff_content = self._enc.decode(tokens[:budget]) + "\n... (truncated)"
+        return diff_content
+
+    def _call_chat(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """
+        Call the chat completions API, retrying transient failures.
+
+        Rate-limit, connection and timeout errors are retried with exponential
+        backoff and jitter. The last error is re-raised once all attempts fail.
+
+        Args:
+            messages: Messages for the chat completion.
+
+        Returns:
+            The response message content.
+        """
+        stream = self.config.openai_stream
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.config.openai_model,
+                    messages=messages,
+                    temperature=self.config.openai_temperature,
+                    max_tokens=self.config.openai_max_tokens,
+                    response_format={"type": "json_object"},
+                    stream=stream,
+                )
+                break
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                time.sleep(self._retry_delay(e, attempt))
+
+        if stream:
+            return self._read_stream(response)
+        return response.choices[0].message.content
+
+    def _read_stream(self, stream) -> str:
+        """
+        Accumulate streamed content until a complete JSON object has arrived.
+
+        The stream is closed as soon as the object is complete, so trailing
+        output tokens (e.g. whitespace padding in JSON mode) are not awaited.
+        """
+        decoder = json.JSONDecoder()
+        parts: List[str] = []
+
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+
+                # Only a closing brace can complete the object
+                if "}" in delta:
+                    try:
+                        decoder.raw_decode("".join(parts).lstrip())
+                        break
+                    except json.JSONDecodeError:
+                        continue
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+        return "".join(parts)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Compute the wait before the next attempt, honoring Retry-After."""
+        ceiling = min(self.RETRY_MAX_WAIT, self.RETRY_MIN_WAIT * 2 ** attempt)
+        delay = random.uniform(self.RETRY_MIN_WAIT, ceiling)
+
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.RETRY_MAX_WAIT))
+            except ValueError:
+                pass
+
+        return delay
+
+    def _build_system_message(self) -> str:
+        """Build the system message from the prompt configuration."""
         system_message = (
             f"{self.prompt_config['system_role']}\n\n"
             f"{self.prompt_config['format_instructions']}\n\n"
@@ -178,39 +435,61 @@ class CommitGenerator:
         examples_text = "\nExamples:\n"
         for example in self.prompt_config["examples"][:2]:
             examples_text += f"\nDiff description: {example['diff']}\n"
-            examples_text += f"Response: {json.dumps(example['response'], indent=2)}\n"
+            examples_text += f"Response: {_json_dumps(example['response'], indent=True)}\n"
 
-        system_message += examples_text
+        return system_message + examples_text
 
-        # User message
-        user_content = f"Generate a commit message for the following changes:\n\n"
+    def _build_messages(
+        self,
+        diff_content: str,
+        file_paths: List[str],
+        context: Optional[Dict] = None,
+    ) -> List[Dict[str, str]]:
+        """Build the messages for the OpenAI API call."""
+        # System message is identical for every call, so it is built once
+        system_message = self._system_message
+
+        # User message starts with the parts that are the same for every call
+        # in a run, so repeated calls share the longest possible prompt prefix
+        parts = [
+            "Generate a commit message for the following changes:\n",
+            self._build_context_text(context),
+        ]
 
         # Add file list
-        user_content += "Changed files:\n"
-        for path in file_paths[:20]:  # Limit to first 20 files
-            user_content += f"  - {path}\n"
+        parts.append("\nChanged files:\n")
+        parts.extend(f"  - {path}\n" for path in file_paths[:20])  # Limit to first 20 files
         if len(file_paths) > 20:
-            user_content += f"  ... and {len(file_paths) - 20} more files\n"
-
-        # Add context if provided
-        if context:
-            if context.get("project_type"):
-                user_content += f"\nProject type: {context['project_type']}"
-            if context.get("language"):
-                user_content += f"\nPrimary language: {context['language']}"
-            if context.get("existing_messages"):
-                user_content += "\nRecent commit messages for style reference:\n"
-                for msg in context["existing_messages"][:3]:
-                    user_content += f"  - {msg[:100]}\n"
+            parts.append(f"  ... and {len(file_paths) - 20} more files\n")
 
         # Add diff
-        user_content += f"\nDiff content:\n```\n{diff_content}\n```"
+        parts.append(f"\nDiff content:\n```\n{diff_content}\n```")
+        user_content = "".join(parts)
 
         return [
             {"role": "system", "content": system_message},
             {"role": "user", "content": user_content},
         ]
 
+    def _build_context_text(self, context: Optional[Dict] = None) -> str:
+        """Build the project context section of the user message."""
+        if not context:
+            return ""
+
+        lines = []
+        if context.get("project_type"):
+            lines.append(f"Project type: {context['project_type']}")
+        if context.get("language"):
+            lines.append(f"Primary language: {context['language']}")
+        if context.get("existing_messages"):
+            lines.append("Recent commit messages for style reference:")
+            for msg in context["existing_messages"][:3]:
+                lines.append(f"  - {msg[:100]}")
+
+        if not lines:
+            return ""
+        return "\n" + "\n".join(lines) + "\n"
+
     def generate_split_commits(
         self, groups: List[SplitGroup], context: Optional[Dict] = None
     ) -> List[GeneratedCommit]:
@@ -225,40 +504,176 @@ class CommitGenerator:
             List of GeneratedCommit objects.
         """
         commits = []
+        # Groups with identical prompts share a single API call
+        generated: Dict[bytes, GeneratedCommit] = {}
 
         for group in groups:
+            # Small docs/config/style groups are described well by the template
+            if self._is_trivial(group):
+                commits.append(self._create_fallback_commit(group))
+                continue
+
             file_paths = [f.file_path for f in group.files]
 
             # Build a mini-diff representation for the group
             diff_summary = self._build_group_diff_summary(group)
 
+            key = hashlib.sha256(
+                (diff_summary + "\n" + "\n".join(file_paths)).encode()
+            ).digest()
+            if key in generated:
+                commits.append(generated[key])
+                continue
+
             try:
                 commit = self.generate_commit_message(
                     diff_content=diff_summary,
                     file_paths=file_paths,
                     context=context,
                 )
-                commits.append(commit)
             except CommitGeneratorError:
                 # Fallback to a basic commit message
-                fallback = self._create_fallback_commit(group)
-                commits.append(fallback)
+                commit = self._create_fallback_commit(group)
+
+            generated[key] = commit
+            commits.append(commit)
+
+        return commits
+
+    def _is_trivial(self, group: SplitGroup) -> bool:
+        """Check whether a group is small enough to skip the API call."""
+        return (
+            group.category in self.TRIVIAL_CATEGORIES
+            and group.total_lines <= self.TRIVIAL_MAX_LINES
+            and group.file_count <= self.TRIVIAL_MAX_FILES
+        )
+
+    def generate_split_commits_batch(
+        self,
+        groups: List[SplitGroup],
+        context: Optional[Dict] = None,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> List[GeneratedCommit]:
+        """
+        Generate commit messages for split groups using the OpenAI Batch API.
+
+        All group prompts are submitted as a single batch job, which is cheaper
+        and has higher rate limits than individual calls but may take up to
+        24 hours to complete. As in generate_split_commits, trivial groups get
+        a template message without being submitted, and groups without a
+        usable result fall back to a basic commit message.
+
+        Args:
+            groups: List of split groups.
+            context: Optional additional context.
+            poll_interval: Seconds to wait between batch status checks.
+            timeout: Maximum seconds to wait for the batch, after which it is
+                cancelled. None waits indefinitely.
+
+        Returns:
+            List of GeneratedCommit objects, in the same order as groups.
+
+        Raises:
+            APIError: If the batch cannot be submitted or does not complete.
+        """
+        lines = []
+        for i, group in enumerate(groups):
+            if self._is_trivial(group):
+                continue
+            file_paths = [f.file_path for f in group.files]
+            diff_summary = self._truncate_diff(self._build_group_diff_summary(group))
+            lines.append(_json_dumps({
+                "custom_id": f"grp-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.config.openai_model,
+                    "messages": self._build_messages(diff_summary, file_paths, context),
+                    "temperature": self.config.openai_temperature,
+                    "max_tokens": self.config.openai_max_tokens,
+                    "response_format": {"type": "json_object"},
+                },
+            }))
+
+        if not lines:
+            return [self._create_fallback_commit(group) for group in groups]
+
+        try:
+            input_file = self.client.files.create(
+                file=("split_commits.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+
+            started = time.monotonic()
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if timeout is not None and time.monotonic() - started > timeout:
+                    # Stop the abandoned batch so it is not billed
+                    try:
+                        self.client.batches.cancel(batch.id)
+                    except OpenAIError:
+                        pass
+                    raise APIError(f"Batch {batch.id} did not complete within {timeout} seconds.")
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise APIError(f"Batch {batch.id} ended with status: {batch.status}")
+
+            output = self.client.files.content(batch.output_file_id).text
+        except OpenAIError as e:
+            raise APIError(f"OpenAI Batch API error: {e}")
+
+        results = self._parse_batch_output(output)
+
+        commits = []
+        for i, group in enumerate(groups):
+            data = results.get(f"grp-{i}")
+            if data is not None:
+                commits.append(GeneratedCommit.from_dict(data))
+            else:
+                commits.append(self._create_fallback_commit(group))
 
         return commits
 
+    def _parse_batch_output(self, output: str) -> Dict[str, dict]:
+        """Map batch custom_id values to parsed commit message data."""
+        results = {}
+
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = _json_loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                results[record["custom_id"]] = _json_loads(content)
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+                continue
+
+        return results
+
     def _build_group_diff_summary(self, group: SplitGroup) -> str:
         """Build a diff summary for a group of files."""
-        summary = f"Category: {group.category.value}\n"
-        summary += f"Description: {group.description}\n"
-        summary += f"Total lines: +{group.total_additions} -{group.total_deletions}\n"
-        summary += "\nFiles:\n"
-
-        for f in group.files:
-            status_map = {"A": "added", "M": "modified", "D": "deleted", "R": "renamed"}
-            status = status_map.get(f.status, f.status)
-            summary += f"  - {f.file_path} ({status}, +{f.additions} -{f.deletions})\n"
+        parts = [
+            f"Category: {group.category.value}\n",
+            f"Description: {group.description}\n",
+            f"Total lines: +{group.total_additions} -{group.total_deletions}\n",
+            "\nFiles:\n",
+        ]
+        parts.extend(
+            f"  - {f.file_path} ({_STATUS_MAP.get(f.status, f.status)}, +{f.additions} -{f.deletions})\n"
+            for f in group.files
+        )
 
-        return summary
+        return "".join(parts)
 
     def _create_fallback_commit(self, group: SplitGroup) -> GeneratedCommit:
         """Create a fallback commit message when generation fails."""
@@ -321,7 +736,7 @@ class CommitGenerator:
         # Add previous message and feedback
         messages.append({
             "role": "assistant",
-            "content": json.dumps({
+            "content": _json_dumps({
                 "type": "chore",
                 "scope": None,
                 "subject": previous_message.split("\n")[0],
@@ -336,19 +751,11 @@ class CommitGenerator:
         })
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.config.openai_model,
-                messages=messages,
-                temperature=self.config.openai_temperature,
-                max_tokens=self.config.openai_max_tokens,
-                response_format={"type": "json_object"},
-            )
-
-            content = response.choices[0].message.content
+            content = self._call_chat(messages)
             if not content:
                 raise InvalidResponseError("Empty response from API")
 
-            data = json.loads(content)
+            data = _json_loads(content)
             return GeneratedCommit.from_dict(data)
 
         except Exception as e:
@@ -373,8 +780,8 @@ def generate_commit_message(
     Returns:
         GeneratedCommit with the generated message.
     """
-    generator = CommitGenerator(config)
-    return generator.generate_commit_message(diff_content, file_paths, context)
+    with CommitGenerator(config) as generator:
+        return generator.generate_commit_message(diff_content, file_paths, context)
 
 
 def validate_conventional_commit(message: str) -> tuple[bool, List[str]]:
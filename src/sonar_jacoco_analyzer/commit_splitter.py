@@ -7,6 +7,8 @@ into smaller, logical commits.
 
 import os
 import re
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Set
@@ -14,6 +16,14 @@ from typing import Dict, List, Optional, Set
 from .git_operations import FileChange, StagedChanges, ChangeMetrics
 from .conventional_commit import CommitType, CommitTypeDetector
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Common root directories that do not name a component
+_SKIP_DIRS = frozenset({"src", "lib", "pkg", "app", "internal", "cmd"})
+
 
 class FileCategory(Enum):
     """Categories of files based on their purpose."""
@@ -39,11 +49,11 @@ class SplitGroup:
     total_additions: int = 0
     total_deletions: int = 0
     rationale: str = ""
+    total_lines: int = field(init=False, default=0)
 
-    @property
-    def total_lines(self) -> int:
-        """Total lines changed in this group."""
-        return self.total_additions + self.total_deletions
+    def __post_init__(self):
+        """Precompute the total lines changed in this group."""
+        self.total_lines = self.total_additions + self.total_deletions
 
     @property
     def file_count(self) -> int:
@@ -134,6 +144,16 @@ class FileCategorizer:
         ],
     }
 
+    # Each category's patterns compiled into a single case-insensitive alternation
+    _COMPILED_PATTERNS = [
+        (category, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE))
+        for category, patterns in CATEGORY_PATTERNS.items()
+    ]
+
+    # Lazily compiled Hyperscan database used by categorize_batch
+    _hyperscan_database = None
+    _hyperscan_failed = False
+
     # File extensions that indicate source code
     SOURCE_EXTENSIONS = {
         ".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".go", ".rs",
@@ -153,18 +173,89 @@ class FileCategorizer:
             FileCategory for the file.
         """
         # Check patterns in order of specificity
-        for category, patterns in cls.CATEGORY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, file_path, re.IGNORECASE):
-                    return category
+        for category, regex in cls._COMPILED_PATTERNS:
+            if regex.search(file_path):
+                return category
+
+        return cls._categorize_by_extension(file_path)
 
-        # Check file extension for source files
+    @classmethod
+    def _categorize_by_extension(cls, file_path: str) -> FileCategory:
+        """Categorize a file that matched no pattern by its extension."""
         ext = os.path.splitext(file_path)[1].lower()
         if ext in cls.SOURCE_EXTENSIONS:
             return FileCategory.SOURCE
 
         return FileCategory.OTHER
 
+    @classmethod
+    def categorize_batch(cls, file_paths: List[str]) -> List[FileCategory]:
+        """
+        Categorize many files at once.
+
+        When the optional hyperscan package is installed, all category patterns
+        are matched against each path in a single multi-pattern scan. Otherwise
+        each path is categorized with the compiled Python regexes.
+
+        Args:
+            file_paths: Paths to the files.
+
+        Returns:
+            FileCategory for each file, in the same order.
+        """
+        database = cls._get_hyperscan_database()
+        if database is None:
+            return [cls.categorize(path) for path in file_paths]
+
+        categories = [category for category, _ in cls._COMPILED_PATTERNS]
+
+        def on_match(pattern_id, start, end, flags, best):
+            # Pattern ids are category indexes; the lowest one has precedence
+            if pattern_id < best[0]:
+                best[0] = pattern_id
+
+        results = []
+        for path in file_paths:
+            best = [len(categories)]
+            database.scan(path.encode("utf-8"), match_event_handler=on_match, context=best)
+            if best[0] < len(categories):
+                results.append(categories[best[0]])
+            else:
+                results.append(cls._categorize_by_extension(path))
+
+        return results
+
+    @classmethod
+    def _get_hyperscan_database(cls):
+        """Compile the category patterns into a Hyperscan database once."""
+        if hyperscan is None or cls._hyperscan_failed:
+            return None
+
+        if cls._hyperscan_database is None:
+            expressions = []
+            ids = []
+            for index, patterns in enumerate(cls.CATEGORY_PATTERNS.values()):
+                for pattern in patterns:
+                    expressions.append(pattern.encode("utf-8"))
+                    ids.append(index)
+
+            flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+            try:
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=expressions,
+                    ids=ids,
+                    elements=len(expressions),
+                    flags=[flags] * len(expressions),
+                )
+            except hyperscan.error:
+                # Unsupported pattern or platform: use the Python regexes instead
+                cls._hyperscan_failed = True
+                return None
+            cls._hyperscan_database = database
+
+        return cls._hyperscan_database
+
 
 class ComponentDetector:
     """Detects logical components from file paths."""
@@ -193,18 +284,19 @@ class ComponentDetector:
     @classmethod
     def _extract_component(cls, path: str) -> str:
         """Extract component name from a file path."""
-        parts = path.split("/")
+        # Top-level files have no directory to inspect
+        if "/" not in path:
+            return os.path.splitext(path)[0]
 
-        # Skip common root directories
-        skip_dirs = {"src", "lib", "pkg", "app", "internal", "cmd"}
+        parts = path.split("/")
 
-        # Find the meaningful directory
+        # Find the meaningful directory, skipping common root directories
         for i, part in enumerate(parts):
-            if part.lower() in skip_dirs:
+            if part.lower() in _SKIP_DIRS:
                 if i + 1 < len(parts) - 1:  # Not the last directory
-                    return parts[i + 1]
+                    return sys.intern(parts[i + 1])
             elif part not in (".", "..") and i < len(parts) - 1:
-                return part
+                return sys.intern(part)
 
         # Fallback to filename without extension
         if parts:
@@ -244,8 +336,13 @@ class CommitSplitter:
         Returns:
             SplitProposal with recommendations.
         """
+        # Categorize every file once for both the split check and grouping
+        categories = FileCategorizer.categorize_batch(
+            [f.file_path for f in staged_changes.files]
+        )
+
         # Check if split is needed
-        should_split = self._should_split(staged_changes, metrics)
+        should_split = self._should_split(staged_changes, metrics, categories)
 
         if not should_split:
             return SplitProposal(
@@ -256,7 +353,7 @@ class CommitSplitter:
             )
 
         # Generate split groups
-        groups = self._generate_groups(staged_changes)
+        groups = self._generate_groups(staged_changes, categories)
 
         # Filter out empty groups and single-file trivial groups
         groups = [g for g in groups if g.file_count > 0]
@@ -281,7 +378,10 @@ class CommitSplitter:
         )
 
     def _should_split(
-        self, staged_changes: StagedChanges, metrics: ChangeMetrics
+        self,
+        staged_changes: StagedChanges,
+        metrics: ChangeMetrics,
+        categories: List[FileCategory],
     ) -> bool:
         """Determine if changes should be split."""
         # Check total lines changed
@@ -294,10 +394,7 @@ class CommitSplitter:
             return True
 
         # Check for mixed change types (e.g., source + tests + docs)
-        categories = set()
-        for f in staged_changes.files:
-            category = FileCategorizer.categorize(f.file_path)
-            categories.add(category)
+        distinct_categories = set(categories)
 
         # If we have multiple unrelated categories, suggest split
         unrelated_categories = {
@@ -305,21 +402,22 @@ class CommitSplitter:
             FileCategory.TEST,
             FileCategory.DOCS,
         }
-        if len(categories.intersection(unrelated_categories)) >= 2:
+        if len(distinct_categories.intersection(unrelated_categories)) >= 2:
             return True
 
         return False
 
-    def _generate_groups(self, staged_changes: StagedChanges) -> List[SplitGroup]:
+    def _generate_groups(
+        self, staged_changes: StagedChanges, categories: List[FileCategory]
+    ) -> List[SplitGroup]:
         """Generate logical groups for splitting."""
         groups = []
 
         # Group by category first
-        category_files: Dict[FileCategory, List[FileChange]] = {}
-        for f in staged_changes.files:
-            category = FileCategorizer.categorize(f.file_path)
-            if category not in category_files:
-                category_files[category] = []
+        category_files: Dict[FileCategory, List[FileChange]] = defaultdict(list)
+        for f, category in zip(staged_changes.files, categories):
+            # Paths are reused as keys across groups, scopes and prompts
+            f.file_path = sys.intern(f.file_path)
             category_files[category].append(f)
 
         # Create groups for each category
@@ -345,13 +443,13 @@ class CommitSplitter:
     ) -> List[SplitGroup]:
         """Split files by their logical component."""
         groups = []
-        file_paths = [f.file_path for f in files]
-        file_map = {f.file_path: f for f in files}
 
-        components = ComponentDetector.detect_component(file_paths)
+        # Bucket the file changes directly instead of mapping paths back to files
+        components: Dict[str, List[FileChange]] = defaultdict(list)
+        for f in files:
+            components[ComponentDetector._extract_component(f.file_path)].append(f)
 
-        for component, paths in components.items():
-            component_files = [file_map[p] for p in paths]
+        for component, component_files in components.items():
             group = self._create_group(
                 component_files, category, component_name=component
             )
@@ -366,8 +464,11 @@ class CommitSplitter:
         component_name: Optional[str] = None,
     ) -> SplitGroup:
         """Create a SplitGroup from files."""
-        total_additions = sum(f.additions for f in files)
-        total_deletions = sum(f.deletions for f in files)
+        total_additions = 0
+        total_deletions = 0
+        for f in files:
+            total_additions += f.additions
+            total_deletions += f.deletions
 
         # Determine suggested commit type
         file_paths = [f.file_path for f in files]
@@ -6,9 +6,25 @@ https://www.conventionalcommits.org/en/v1.0.0/
 """
 
 import re
+import sys
+import textwrap
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import FrozenSet, List, Optional, Tuple
+
+
+# Value types use __slots__ where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Scope names allowed by ConventionalCommit.validate
+_SCOPE_FORMAT_RE = re.compile(r"^[a-z][a-z0-9-]*$")
+
+# Body lines that start a footer (trailers and issue references)
+_FOOTER_LINE_RE = re.compile(
+    r"^(?:[\w-]+(?:-by)?:\s|(?:Fixes|Closes|Resolves)\s+#\d+)", re.IGNORECASE
+)
 
 
 class CommitType(Enum):
@@ -34,19 +50,27 @@ class CommitType(Enum):
     @classmethod
     def from_string(cls, type_str: str) -> Optional["CommitType"]:
         """Get CommitType from string name."""
-        type_str = type_str.lower()
-        for commit_type in cls:
-            if commit_type.type_name == type_str:
-                return commit_type
-        return None
+        return _COMMIT_TYPES_BY_NAME.get(type_str.lower())
 
     @classmethod
     def all_types(cls) -> List[str]:
         """Get all valid type names."""
-        return [ct.type_name for ct in cls]
+        return list(_COMMIT_TYPE_NAMES)
+
+    @classmethod
+    def all_types_set(cls) -> FrozenSet[str]:
+        """Get all valid type names as a set for membership checks."""
+        return _COMMIT_TYPE_NAME_SET
+
+
+# Lookup tables built once the enum members exist. They live at module level
+# because attribute lookups on an Enum class go through the enum metaclass.
+_COMMIT_TYPES_BY_NAME = {ct.type_name: ct for ct in CommitType}
+_COMMIT_TYPE_NAMES = tuple(_COMMIT_TYPES_BY_NAME)
+_COMMIT_TYPE_NAME_SET = frozenset(_COMMIT_TYPE_NAMES)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ConventionalCommit:
     """Represents a conventional commit message."""
 
@@ -68,20 +92,21 @@ class ConventionalCommit:
             header += "!"
         header += f": {self.subject}"
 
-        # Build the full message
+        has_breaking_footer = self.breaking and self.breaking_description
+        if not (self.body or has_breaking_footer or self.footer):
+            return header
+
+        # Build the full message, separating each section with a blank line
         parts = [header]
 
         if self.body:
-            parts.append("")  # Blank line
-            parts.append(self.body)
+            parts += ("", self.body)
 
-        if self.breaking and self.breaking_description:
-            parts.append("")
-            parts.append(f"BREAKING CHANGE: {self.breaking_description}")
+        if has_breaking_footer:
+            parts += ("", f"BREAKING CHANGE: {self.breaking_description}")
 
         if self.footer:
-            parts.append("")
-            parts.append(self.footer)
+            parts += ("", self.footer)
 
         return "\n".join(parts)
 
@@ -94,16 +119,19 @@ class ConventionalCommit:
         """
         errors = []
 
+        subject = self.subject
+
         # Validate subject length
-        if len(self.subject) > 50:
-            errors.append(f"Subject line too long ({len(self.subject)} chars). Maximum is 50 characters.")
+        if len(subject) > 50:
+            errors.append(f"Subject line too long ({len(subject)} chars). Maximum is 50 characters.")
 
         # Validate subject format
-        if self.subject and self.subject[0].isupper():
-            errors.append("Subject should start with lowercase letter.")
+        if subject:
+            if subject[0].isupper():
+                errors.append("Subject should start with lowercase letter.")
 
-        if self.subject and self.subject.endswith("."):
-            errors.append("Subject should not end with a period.")
+            if subject[-1] == ".":
+                errors.append("Subject should not end with a period.")
 
         # Validate body line lengths
         if self.body:
@@ -113,7 +141,7 @@ class ConventionalCommit:
 
         # Validate scope format
         if self.scope:
-            if not re.match(r"^[a-z][a-z0-9-]*$", self.scope):
+            if not _SCOPE_FORMAT_RE.match(self.scope):
                 errors.append("Scope should be lowercase alphanumeric with hyphens.")
 
         return len(errors) == 0, errors
@@ -143,12 +171,16 @@ class ConventionalCommitParser:
         Returns:
             ConventionalCommit object or None if parsing fails.
         """
-        lines = message.strip().split("\n")
+        lines = message.strip().splitlines()
         if not lines:
             return None
 
-        # Parse header
+        # Parse header, skipping the regex for headers that cannot match
+        # (no type separator, or merge commits)
         header = lines[0]
+        if header.find(":") < 1 or header.startswith("Merge "):
+            return None
+
         match = cls.PATTERN.match(header)
         if not match:
             return None
@@ -169,10 +201,11 @@ class ConventionalCommitParser:
 
         if len(lines) > 2:
             # Skip blank line after header
-            remaining = "\n".join(lines[2:]) if lines[1] == "" else "\n".join(lines[1:])
+            remaining_lines = lines[2:] if lines[1] == "" else lines[1:]
 
             # Check for BREAKING CHANGE footer
-            if "BREAKING CHANGE:" in remaining:
+            if any("BREAKING CHANGE:" in line for line in remaining_lines):
+                remaining = "\n".join(remaining_lines)
                 parts = remaining.split("BREAKING CHANGE:", 1)
                 body = parts[0].strip() or None
                 footer_parts = parts[1].strip().split("\n", 1)
@@ -186,11 +219,9 @@ class ConventionalCommitParser:
                 footer_lines = []
                 in_footer = False
 
-                for line in remaining.split("\n"):
+                for line in remaining_lines:
                     # Check if this looks like a footer line
-                    if re.match(r"^[\w-]+(-by)?:\s", line, re.IGNORECASE) or re.match(
-                        r"^(Fixes|Closes|Resolves)\s+#\d+", line, re.IGNORECASE
-                    ):
+                    if _FOOTER_LINE_RE.match(line):
                         in_footer = True
                         footer_lines.append(line)
                     elif in_footer:
@@ -218,6 +249,14 @@ class CommitMessageFormatter:
     MAX_SUBJECT_LENGTH = 50
     MAX_BODY_LINE_LENGTH = 72
 
+    # Body lines starting with these (code fences, indents, bullets) are not wrapped
+    _PRESERVE_PREFIXES = ("```", "  ", "- ", "* ")
+
+    # Shared wrapper for long body lines; words and hyphenated terms are never split
+    _WRAPPER = textwrap.TextWrapper(
+        width=MAX_BODY_LINE_LENGTH, break_long_words=False, break_on_hyphens=False
+    )
+
     @classmethod
     def format_subject(cls, subject: str) -> str:
         """
@@ -258,7 +297,7 @@ class CommitMessageFormatter:
 
         for line in lines:
             # Preserve code blocks and bullet points
-            if line.startswith("```") or line.startswith("  ") or line.startswith("- ") or line.startswith("* "):
+            if line.startswith(cls._PRESERVE_PREFIXES):
                 formatted_lines.append(line)
             elif len(line) > cls.MAX_BODY_LINE_LENGTH:
                 # Wrap long lines
@@ -271,26 +310,9 @@ class CommitMessageFormatter:
     @classmethod
     def _wrap_line(cls, line: str) -> List[str]:
         """Wrap a single line to MAX_BODY_LINE_LENGTH."""
-        words = line.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            word_length = len(word)
-            if current_length + word_length + (1 if current_line else 0) <= cls.MAX_BODY_LINE_LENGTH:
-                current_line.append(word)
-                current_length += word_length + (1 if len(current_line) > 1 else 0)
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = word_length
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        return lines
+        # Collapse tabs, indentation and whitespace runs to single spaces first,
+        # as splitting into words did; TextWrapper would otherwise keep them
+        return cls._WRAPPER.wrap(" ".join(line.split()))
 
     @classmethod
     def format_bullet_list(cls, items: List[str]) -> str:
@@ -359,6 +381,16 @@ class ScopeExtractor:
         r"^\.": "config",
     }
 
+    # All patterns in one anchored scanner; alternatives are tried in order, so
+    # the first matching pattern wins as before. Group sN maps to the Nth scope.
+    _SCOPE_SCANNER = re.compile(
+        "|".join(
+            f"(?P<s{i}>{pattern[1:] if pattern.startswith('^') else pattern})"
+            for i, pattern in enumerate(SCOPE_PATTERNS)
+        )
+    )
+    _SCOPE_BY_GROUP = {f"s{i}": scope for i, scope in enumerate(SCOPE_PATTERNS.values())}
+
     @classmethod
     def extract_scope(cls, file_paths: List[str]) -> Optional[str]:
         """
@@ -376,33 +408,29 @@ class ScopeExtractor:
         if len(file_paths) == 1:
             return cls._scope_from_path(file_paths[0])
 
-        # Find common scope for multiple files
-        scopes = [cls._scope_from_path(path) for path in file_paths]
-        scopes = [s for s in scopes if s]  # Remove None values
+        # Find common scope for multiple files, ignoring paths without one
+        scope_counts = Counter(s for s in map(cls._scope_from_path, file_paths) if s)
 
-        if not scopes:
+        if not scope_counts:
             return None
 
         # Return the most common scope
-        scope_counts = {}
-        for scope in scopes:
-            scope_counts[scope] = scope_counts.get(scope, 0) + 1
-
-        most_common = max(scope_counts, key=scope_counts.get)
+        most_common, count = scope_counts.most_common(1)[0]
 
         # Only return if it's reasonably common
-        if scope_counts[most_common] >= len(file_paths) / 2:
+        if count >= len(file_paths) / 2:
             return most_common
 
         return None
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _scope_from_path(cls, path: str) -> Optional[str]:
-        """Extract scope from a single file path."""
+        """Extract scope from a single file path (memoized, as paths recur across commits)."""
         # Check against known patterns
-        for pattern, scope in cls.SCOPE_PATTERNS.items():
-            if re.match(pattern, path):
-                return scope
+        match = cls._SCOPE_SCANNER.match(path)
+        if match:
+            return cls._SCOPE_BY_GROUP[match.lastgroup]
 
         # Try to extract from first directory
         parts = path.split("/")
@@ -474,6 +502,33 @@ class CommitTypeDetector:
         ],
     }
 
+    # One case-insensitive alternation per commit type, compiled once
+    _COMPILED_TYPE_PATTERNS = [
+        (commit_type, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE))
+        for commit_type, patterns in TYPE_PATTERNS.items()
+    ]
+
+    # Diff keywords that hint at a commit type, in priority order
+    DIFF_KEYWORDS = {
+        CommitType.FIX: ["fix", "bug", "issue", "error", "crash"],
+        CommitType.FEAT: ["add", "new", "feature", "implement"],
+        CommitType.REFACTOR: ["refactor", "rename", "move", "restructure"],
+        CommitType.PERF: ["performance", "optimize", "speed", "cache"],
+    }
+
+    # All keywords in one scanner; the lookahead also reports overlapping
+    # keywords. re.ASCII limits case-insensitive matching to ASCII letters, so
+    # e.g. "ſ" or "İ" never match and every match lowercases to a keyword.
+    _DIFF_KEYWORD_RE = re.compile(
+        "(?=(" + "|".join(w for words in DIFF_KEYWORDS.values() for w in words) + "))",
+        re.IGNORECASE | re.ASCII,
+    )
+    _DIFF_KEYWORD_TYPES = {
+        word: (rank, commit_type)
+        for rank, (commit_type, words) in enumerate(DIFF_KEYWORDS.items())
+        for word in words
+    }
+
     @classmethod
     def detect_type(
         cls, file_paths: List[str], diff_content: Optional[str] = None
@@ -492,42 +547,36 @@ class CommitTypeDetector:
             return CommitType.CHORE
 
         # Check each file against patterns
-        type_matches = {}
-        for commit_type, patterns in cls.TYPE_PATTERNS.items():
-            for path in file_paths:
-                for pattern in patterns:
-                    if re.search(pattern, path, re.IGNORECASE):
-                        type_matches[commit_type] = type_matches.get(commit_type, 0) + 1
-                        break
+        type_matches = Counter()
+        matched = [False] * len(file_paths)
+        for commit_type, regex in cls._COMPILED_TYPE_PATTERNS:
+            for i, path in enumerate(file_paths):
+                if regex.search(path):
+                    type_matches[commit_type] += 1
+                    matched[i] = True
 
         # If we found matches, return the most common
         if type_matches:
-            return max(type_matches, key=type_matches.get)
+            return type_matches.most_common(1)[0][0]
 
         # Analyze diff content for hints
         if diff_content:
-            content_lower = diff_content.lower()
-
-            # Check for bug fix indicators
-            if any(word in content_lower for word in ["fix", "bug", "issue", "error", "crash"]):
-                return CommitType.FIX
-
-            # Check for feature indicators
-            if any(word in content_lower for word in ["add", "new", "feature", "implement"]):
-                return CommitType.FEAT
-
-            # Check for refactor indicators
-            if any(word in content_lower for word in ["refactor", "rename", "move", "restructure"]):
-                return CommitType.REFACTOR
-
-            # Check for performance indicators
-            if any(word in content_lower for word in ["performance", "optimize", "speed", "cache"]):
-                return CommitType.PERF
+            # Scan the diff once, keeping the highest-priority keyword seen
+            best = None
+            for match in cls._DIFF_KEYWORD_RE.finditer(diff_content):
+                rank, commit_type = cls._DIFF_KEYWORD_TYPES[match.group(1).lower()]
+                if rank == 0:
+                    return commit_type
+                if best is None or rank < best[0]:
+                    best = (rank, commit_type)
+
+            if best is not None:
+                return best[1]
 
         # Default to feat for new files, refactor for modifications
-        new_files = sum(1 for p in file_paths if "new" in p.lower() or not any(
-            re.search(pattern, p) for patterns in cls.TYPE_PATTERNS.values() for pattern in patterns
-        ))
+        new_files = sum(
+            1 for i, p in enumerate(file_paths) if not matched[i] or "new" in p.lower()
+        )
 
         if new_files > len(file_paths) / 2:
             return CommitType.FEAT
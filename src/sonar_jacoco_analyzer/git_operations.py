@@ -4,12 +4,51 @@ Local git operations using GitPython.
 
 import os
 import re
+from bisect import bisect_left
+from fnmatch import fnmatchcase
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from git import Repo, InvalidGitRepositoryError, GitCommandError
 
 
+# git diff --raw status letters mapped to FileChange statuses; anything else
+# (type changes, unmerged entries) is treated as a modification
+_STATUS_CODES = {"A": "A", "C": "A", "D": "D", "M": "M", "R": "R"}
+
+# Complexity score contributions: a value above THRESHOLDS[i - 1] (and not
+# above THRESHOLDS[i]) scores SCORES[i]
+_LINE_THRESHOLDS = (50, 100, 200, 500)
+_LINE_SCORES = (0, 5, 15, 30, 50)
+_FILE_THRESHOLDS = (2, 5, 10, 20)
+_FILE_SCORES = (0, 5, 10, 20, 30)
+_DIR_THRESHOLDS = (2, 5, 10)
+_DIR_SCORES = (0, 5, 10, 20)
+_TYPE_THRESHOLDS = (1, 3, 5)
+_TYPE_SCORES = (0, 5, 10, 15)
+
+# Paths passed per git add/reset invocation when staging many files
+_PATHSPEC_BATCH_SIZE = 500
+
+# Marks lazily loaded attributes that may legitimately be None
+_NOT_LOADED = object()
+
+# owner/name at the end of an SSH (git@host:owner/name.git) or HTTPS remote URL
+_REPO_URL_RE = re.compile(r"[/:]([^/]+/[^/]+?)(?:\.git)?$")
+
+
+def _matches_paths(path: str, patterns: List[str]) -> bool:
+    """Check whether a repository-relative path is, or is under, one of the patterns."""
+    for pattern in patterns:
+        pattern = pattern.rstrip("/")
+        if pattern in ("", ".") or path == pattern or path.startswith(pattern + "/"):
+            return True
+        if fnmatchcase(path, pattern):
+            return True
+    return False
+
+
 @dataclass
 class FileChange:
     """Information about a single file change."""
@@ -24,13 +63,40 @@ class FileChange:
 
 @dataclass
 class StagedChanges:
-    """Collection of staged changes."""
+    """
+    Collection of staged changes.
+
+    When built with a diff_loader instead of diff_content, the full diff text
+    is only generated the first time diff_content is read.
+    """
 
     files: List[FileChange]
     total_additions: int
     total_deletions: int
     total_files: int
-    diff_content: str
+
+    def __init__(
+        self,
+        files: List[FileChange],
+        total_additions: int,
+        total_deletions: int,
+        total_files: int,
+        diff_content: Optional[str] = None,
+        diff_loader: Optional[Callable[[], str]] = None,
+    ):
+        self.files = files
+        self.total_additions = total_additions
+        self.total_deletions = total_deletions
+        self.total_files = total_files
+        self._diff_content = diff_content
+        self._diff_loader = diff_loader
+
+    @property
+    def diff_content(self) -> str:
+        """Full diff text of the staged changes, loaded on first access."""
+        if self._diff_content is None:
+            self._diff_content = self._diff_loader() if self._diff_loader else ""
+        return self._diff_content
 
     @property
     def is_empty(self) -> bool:
@@ -108,105 +174,174 @@ class GitOperations:
                 "Please run this command from within a git repository."
             )
 
-    def get_staged_changes(self) -> StagedChanges:
+        # Last staged changes, keyed by the index/HEAD state and paths they
+        # were read for
+        self._staged_cache: Optional[Tuple[tuple, StagedChanges]] = None
+        self._remote_url: object = _NOT_LOADED
+
+    def get_staged_changes(
+        self, include_diff: bool = False, paths: Optional[List[str]] = None
+    ) -> StagedChanges:
         """
         Get all staged changes (git diff --cached).
 
+        Statuses and line counts come from a single
+        ``git diff --cached --raw --numstat`` call, so no per-file diff text
+        is generated or parsed. The full diff is loaded lazily unless
+        include_diff is set, in which case it is read by the same git call.
+
+        When paths are given, the diff still runs over the whole index and
+        the parsed changes are filtered afterwards: a pathspec would hide
+        the other side of a rename from git's rename detection.
+
+        Args:
+            include_diff: Also generate the full patch up front, for callers
+                that will read diff_content anyway.
+            paths: Only include changes under these paths: directories, files
+                or glob patterns relative to the repository root. A rename is
+                included if either its old or new path matches. If None, all
+                staged changes are included.
+
         Returns:
             StagedChanges object with file changes and diff content.
         """
-        # Get diff between HEAD and staging area
+        # Reuse the last result while neither the index nor HEAD has changed
+        state = self._index_state()
+        cache_key = None if state is None else (state, tuple(paths or ()))
+        if cache_key is not None and self._staged_cache and self._staged_cache[0] == cache_key:
+            return self._staged_cache[1]
+
+        # Without HEAD (initial commit) git compares the index to an empty tree
+        args = ["--cached", "-M", "-z", "--raw", "--numstat"]
+        if include_diff and not paths:
+            args += ["--patch", "--no-color"]
+        output = self.repo.git.diff(*args)
+
+        diff_content = None
+        if include_diff and not paths:
+            # The patch follows the NUL-terminated records after an empty one
+            output, _, diff_content = output.partition("\0\0")
+        files = self._parse_raw_numstat(output)
+
+        diff_paths = None
+        if paths:
+            files = [
+                f for f in files
+                if _matches_paths(f.file_path, paths)
+                or (f.old_path is not None and _matches_paths(f.old_path, paths))
+            ]
+            # Name both sides of each rename so the patch still shows it as one
+            diff_paths = [p for f in files for p in (f.old_path, f.file_path) if p is not None]
+            if include_diff:
+                diff_content = self._get_diff_content(diff_paths)
+
+        # Otherwise the full patch is only generated if diff_content is read
+        staged = StagedChanges(
+            files=files,
+            total_additions=sum(f.additions for f in files),
+            total_deletions=sum(f.deletions for f in files),
+            total_files=len(files),
+            diff_content=diff_content,
+            diff_loader=lambda: self._get_diff_content(diff_paths),
+        )
+
+        self._staged_cache = (cache_key, staged) if cache_key is not None else None
+        return staged
+
+    def _index_state(self) -> Optional[tuple]:
+        """
+        Get a cheap fingerprint of the index file and HEAD.
+
+        Returns:
+            Tuple of index mtime, index size and HEAD sha, or None if the
+            index does not exist yet.
+        """
         try:
-            staged_diff = self.repo.index.diff("HEAD")
-        except GitCommandError:
-            # No HEAD (initial commit scenario)
-            staged_diff = self.repo.index.diff(None)
+            stat = os.stat(self.repo.index.path)
+        except OSError:
+            return None
+
+        try:
+            head = self.repo.head.commit.hexsha
+        except ValueError:
+            # No commits yet
+            head = None
+
+        return (stat.st_mtime_ns, stat.st_size, head)
+
+    def invalidate(self) -> None:
+        """Discard cached staged changes after modifying the index or HEAD."""
+        self._staged_cache = None
+
+    def _parse_raw_numstat(self, output: str) -> List[FileChange]:
+        """
+        Parse NUL-separated ``--raw --numstat`` diff output into file changes.
+
+        Raw records (``:<modes> <shas> <status>``, then one path or, for
+        renames and copies, the old and new paths) come first, followed by
+        numstat records (``<adds>\t<dels>\t<path>``, with an empty path
+        followed by the old and new paths for renames). Binary files have
+        ``-`` for both counts.
+        """
+        tokens = output.split("\0")
+        changes = []
+        counts = {}
+
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token.startswith(":"):
+                status = token.split(" ")[4][:1]
+                if status in ("R", "C"):
+                    old_path, path = tokens[i + 1], tokens[i + 2]
+                    i += 3
+                else:
+                    old_path, path = None, tokens[i + 1]
+                    i += 2
+                changes.append((path, status, old_path))
+            elif token:
+                adds, dels, path = token.split("\t", 2)
+                if not path:
+                    # Rename: the old and new paths follow as separate records
+                    path = tokens[i + 2]
+                    i += 3
+                else:
+                    i += 1
+                counts[path] = (adds, dels)
+            else:
+                i += 1
 
         files = []
-        total_additions = 0
-        total_deletions = 0
-
-        for diff_item in staged_diff:
-            status = self._get_change_status(diff_item)
-            additions, deletions = self._count_diff_lines(diff_item)
-
-            file_change = FileChange(
-                file_path=diff_item.b_path or diff_item.a_path,
-                status=status,
-                additions=additions,
-                deletions=deletions,
-                is_binary=diff_item.b_blob and diff_item.b_blob.mime_type.startswith("application/"),
-                old_path=diff_item.a_path if diff_item.renamed else None,
+        for path, status, old_path in changes:
+            adds, dels = counts.get(path, ("0", "0"))
+            is_binary = adds == "-"
+            files.append(
+                FileChange(
+                    file_path=path,
+                    status=_STATUS_CODES.get(status, "M"),
+                    additions=0 if is_binary else int(adds),
+                    deletions=0 if is_binary else int(dels),
+                    is_binary=is_binary,
+                    old_path=old_path if status == "R" else None,
+                )
             )
-            files.append(file_change)
-            total_additions += additions
-            total_deletions += deletions
-
-        # Also check for new files in index
-        try:
-            new_files = self.repo.index.diff(None)
-            for diff_item in new_files:
-                if diff_item.new_file:
-                    additions, _ = self._count_diff_lines(diff_item)
-                    file_change = FileChange(
-                        file_path=diff_item.b_path or diff_item.a_path,
-                        status="A",
-                        additions=additions,
-                        deletions=0,
-                        is_binary=False,
-                    )
-                    files.append(file_change)
-                    total_additions += additions
-        except GitCommandError:
-            pass
 
-        # Get full diff content
-        diff_content = self._get_diff_content()
+        return files
 
-        return StagedChanges(
-            files=files,
-            total_additions=total_additions,
-            total_deletions=total_deletions,
-            total_files=len(files),
-            diff_content=diff_content,
-        )
+    def _get_diff_content(self, paths: Optional[List[str]] = None) -> str:
+        """
+        Get the full diff content for staged changes.
 
-    def _get_change_status(self, diff_item) -> str:
-        """Determine the status of a diff item."""
-        if diff_item.new_file:
-            return "A"
-        elif diff_item.deleted_file:
-            return "D"
-        elif diff_item.renamed:
-            return "R"
-        else:
-            return "M"
-
-    def _count_diff_lines(self, diff_item) -> Tuple[int, int]:
-        """Count additions and deletions in a diff."""
-        additions = 0
-        deletions = 0
+        Args:
+            paths: Only include these exact file paths. An empty list yields
+                an empty diff; None includes all staged changes.
+        """
+        if paths is not None and not paths:
+            return ""
 
         try:
-            diff_text = diff_item.diff
-            if diff_text:
-                if isinstance(diff_text, bytes):
-                    diff_text = diff_text.decode("utf-8", errors="replace")
-
-                for line in diff_text.split("\n"):
-                    if line.startswith("+") and not line.startswith("+++"):
-                        additions += 1
-                    elif line.startswith("-") and not line.startswith("---"):
-                        deletions += 1
-        except Exception:
-            pass
-
-        return additions, deletions
-
-    def _get_diff_content(self) -> str:
-        """Get the full diff content for staged changes."""
-        try:
-            return self.repo.git.diff("--cached", "--no-color")
+            pathspec = ["--", *(f":(literal){p}" for p in paths)] if paths else []
+            return self.repo.git.diff("--cached", "-M", "--no-color", *pathspec)
         except GitCommandError:
             # No HEAD (initial commit scenario)
             return self.repo.git.diff("--cached", "--no-color", "--no-index", "/dev/null")
@@ -221,14 +356,18 @@ class GitOperations:
         staged = self.get_staged_changes()
         return staged.files
 
-    def analyze_change_complexity(self) -> ChangeMetrics:
+    def analyze_change_complexity(self, paths: Optional[List[str]] = None) -> ChangeMetrics:
         """
         Analyze the complexity of staged changes.
 
+        Args:
+            paths: Only analyze changes under these paths. If None, all
+                staged changes are analyzed.
+
         Returns:
             ChangeMetrics object with complexity analysis.
         """
-        staged = self.get_staged_changes()
+        staged = self.get_staged_changes(paths=paths)
 
         if staged.is_empty:
             return ChangeMetrics(
@@ -243,23 +382,19 @@ class GitOperations:
                 complexity_score=0,
             )
 
-        files_added = sum(1 for f in staged.files if f.status == "A")
-        files_modified = sum(1 for f in staged.files if f.status == "M")
-        files_deleted = sum(1 for f in staged.files if f.status == "D")
-        files_renamed = sum(1 for f in staged.files if f.status == "R")
-
-        # Collect unique directories
+        # Tally statuses, unique directories and file types in one pass
+        status_counts: Counter = Counter()
+        file_types: Counter = Counter()
         directories = set()
         for f in staged.files:
-            dir_path = os.path.dirname(f.file_path)
+            status_counts[f.status] += 1
+            # git paths always use "/", so plain string splits match os.path
+            dir_path, _, name = f.file_path.rpartition("/")
             if dir_path:
                 directories.add(dir_path)
-
-        # Collect file types
-        file_types = {}
-        for f in staged.files:
-            ext = os.path.splitext(f.file_path)[1].lower() or "no_extension"
-            file_types[ext] = file_types.get(ext, 0) + 1
+            # Like os.path.splitext, leading dots (".gitignore") are not an extension
+            stem, dot, ext = name.rpartition(".")
+            file_types["." + ext.lower() if dot and stem.strip(".") else "no_extension"] += 1
 
         # Calculate complexity score
         complexity_score = self._calculate_complexity_score(
@@ -272,12 +407,12 @@ class GitOperations:
         return ChangeMetrics(
             total_lines_changed=staged.total_additions + staged.total_deletions,
             total_files=len(staged.files),
-            files_added=files_added,
-            files_modified=files_modified,
-            files_deleted=files_deleted,
-            files_renamed=files_renamed,
+            files_added=status_counts["A"],
+            files_modified=status_counts["M"],
+            files_deleted=status_counts["D"],
+            files_renamed=status_counts["R"],
             directories_affected=len(directories),
-            file_types=file_types,
+            file_types=dict(file_types),
             complexity_score=complexity_score,
         )
 
@@ -289,45 +424,14 @@ class GitOperations:
 
         Higher scores indicate more complex changes that might need splitting.
         """
-        score = 0
-
-        # Lines changed contribution
-        if lines > 500:
-            score += 50
-        elif lines > 200:
-            score += 30
-        elif lines > 100:
-            score += 15
-        elif lines > 50:
-            score += 5
-
-        # Files changed contribution
-        if files > 20:
-            score += 30
-        elif files > 10:
-            score += 20
-        elif files > 5:
-            score += 10
-        elif files > 2:
-            score += 5
-
-        # Directories affected contribution
-        if dirs > 10:
-            score += 20
-        elif dirs > 5:
-            score += 10
-        elif dirs > 2:
-            score += 5
-
-        # File types contribution (different types = potentially different concerns)
-        if types > 5:
-            score += 15
-        elif types > 3:
-            score += 10
-        elif types > 1:
-            score += 5
-
-        return score
+        # bisect_left counts thresholds strictly below each value
+        return (
+            _LINE_SCORES[bisect_left(_LINE_THRESHOLDS, lines)]
+            + _FILE_SCORES[bisect_left(_FILE_THRESHOLDS, files)]
+            + _DIR_SCORES[bisect_left(_DIR_THRESHOLDS, dirs)]
+            # Different file types = potentially different concerns
+            + _TYPE_SCORES[bisect_left(_TYPE_THRESHOLDS, types)]
+        )
 
     def validate_staged_changes(self) -> bool:
         """
@@ -339,8 +443,13 @@ class GitOperations:
         Raises:
             NoStagedChangesError: If no changes are staged.
         """
-        staged = self.get_staged_changes()
-        if staged.is_empty:
+        # --quiet exits with 1 on the first difference without producing a diff
+        status, _, stderr = self.repo.git.diff(
+            "--cached", "--quiet", with_extended_output=True, with_exceptions=False
+        )
+        if status not in (0, 1):
+            raise GitCommandError(["git", "diff", "--cached", "--quiet"], status, stderr)
+        if status == 0:
             raise NoStagedChangesError(
                 "No changes staged for commit.\n"
                 "Use 'git add <file>' to stage changes."
@@ -360,12 +469,14 @@ class GitOperations:
         try:
             self.validate_staged_changes()
 
-            # Create the commit
-            commit = self.repo.index.commit(message)
+            # Let git write the tree and commit from the index directly rather
+            # than loading every index entry into Python; hooks still run
+            self.repo.git.commit("--cleanup=verbatim", "-m", message)
+            self.invalidate()
 
             return CommitResult(
                 success=True,
-                sha=commit.hexsha,
+                sha=self.repo.head.commit.hexsha,
                 message=message,
             )
 
@@ -415,12 +526,16 @@ class GitOperations:
         Returns:
             Remote URL or None if not configured.
         """
-        try:
-            if "origin" in self.repo.remotes:
-                return self.repo.remotes.origin.url
-            return None
-        except Exception:
-            return None
+        # The remote does not change during a run, so read the config once
+        if self._remote_url is _NOT_LOADED:
+            try:
+                # A single config lookup instead of building Remote objects
+                self._remote_url = self.repo.config_reader().get_value(
+                    'remote "origin"', "url", None
+                )
+            except Exception:
+                self._remote_url = None
+        return self._remote_url
 
     def has_uncommitted_changes(self) -> bool:
         """
@@ -429,7 +544,49 @@ class GitOperations:
         Returns:
             True if there are uncommitted changes.
         """
-        return self.repo.is_dirty(untracked_files=True)
+        # Only the first status record is needed, so read one byte rather
+        # than listing every change; git is interrupted once the process
+        # handle goes out of scope
+        proc = self.repo.git.status(
+            "--porcelain", "-z", "--untracked-files=normal", as_process=True
+        )
+        return bool(proc.stdout.read(1))
+
+    def get_working_tree_changes(self) -> Tuple[List[str], List[str]]:
+        """
+        Get unstaged and untracked files from a single git status call.
+
+        Returns:
+            Tuple of (files with unstaged changes, untracked files).
+        """
+        try:
+            output = self.repo.git.status("--porcelain=v2", "-z", "--untracked-files=all")
+        except GitCommandError:
+            return [], []
+
+        unstaged: List[str] = []
+        untracked: List[str] = []
+        records = iter(output.split("\0"))
+        for record in records:
+            kind = record[:1]
+            if kind == "?":
+                untracked.append(record[2:])
+            elif kind == "1":
+                # 1 XY sub mH mI mW hH hI path
+                fields = record.split(" ", 8)
+                if fields[1][1] != ".":
+                    unstaged.append(fields[8])
+            elif kind == "2":
+                # 2 XY sub mH mI mW hH hI Xscore path, then the original path
+                fields = record.split(" ", 9)
+                next(records, None)
+                if fields[1][1] != ".":
+                    unstaged.append(fields[9])
+            elif kind == "u":
+                # Unmerged: u XY sub m1 m2 m3 mW h1 h2 h3 path
+                unstaged.append(record.split(" ", 10)[10])
+
+        return unstaged, untracked
 
     def get_unstaged_changes(self) -> List[str]:
         """
@@ -438,11 +595,7 @@ class GitOperations:
         Returns:
             List of file paths with unstaged changes.
         """
-        try:
-            unstaged = self.repo.index.diff(None)
-            return [d.a_path or d.b_path for d in unstaged]
-        except GitCommandError:
-            return []
+        return self.get_working_tree_changes()[0]
 
     def get_untracked_files(self) -> List[str]:
         """
@@ -451,7 +604,7 @@ class GitOperations:
         Returns:
             List of untracked file paths.
         """
-        return self.repo.untracked_files
+        return self.get_working_tree_changes()[1]
 
     def stage_files(self, files: List[str]) -> None:
         """
@@ -460,7 +613,11 @@ class GitOperations:
         Args:
             files: List of file paths to stage.
         """
-        self.repo.index.add(files)
+        # git updates the index itself instead of GitPython rewriting it from
+        # Python; batches keep each command line well under ARG_MAX
+        for i in range(0, len(files), _PATHSPEC_BATCH_SIZE):
+            self.repo.git.add("--", *files[i : i + _PATHSPEC_BATCH_SIZE])
+        self.invalidate()
 
     def unstage_files(self, files: List[str]) -> None:
         """
@@ -469,7 +626,10 @@ class GitOperations:
         Args:
             files: List of file paths to unstage.
         """
-        self.repo.index.reset(paths=files)
+        # Without HEAD (initial commit) this removes the paths from the index
+        for i in range(0, len(files), _PATHSPEC_BATCH_SIZE):
+            self.repo.git.reset("-q", "--", *files[i : i + _PATHSPEC_BATCH_SIZE])
+        self.invalidate()
 
     def get_repo_name(self) -> str:
         """
@@ -481,9 +641,16 @@ class GitOperations:
         remote_url = self.get_remote_url()
         if remote_url:
             # Extract repo name from URL
-            # Handle SSH format: git@github.com:user/repo.git
             # Handle HTTPS format: https://github.com/user/repo.git
-            match = re.search(r"[/:]([^/]+/[^/]+?)(?:\.git)?$", remote_url)
+            head, _, name = remote_url.rpartition("/")
+            if name.endswith(".git"):
+                name = name[:-4]
+            owner = head.rpartition("/")[2]
+            if "/" in head and owner and name:
+                return f"{owner}/{name}"
+
+            # Handle SSH format: git@github.com:user/repo.git
+            match = _REPO_URL_RE.search(remote_url)
             if match:
                 return match.group(1)
 
@@ -3,9 +3,13 @@ GitHub API client for repository, branch, and commit operations.
 """
 
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Iterator, List, Optional
 
 from github import Github, GithubException
 from github.Repository import Repository
@@ -13,7 +17,11 @@ from github.Branch import Branch
 from github.Commit import Commit
 
 
-@dataclass
+# Result records are immutable and use __slots__ where dataclasses support it (3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class RepositoryInfo:
     """Information about a GitHub repository."""
 
@@ -29,7 +37,7 @@ class RepositoryInfo:
     url: str
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class BranchInfo:
     """Information about a repository branch."""
 
@@ -39,7 +47,7 @@ class BranchInfo:
     commit_sha: str
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CommitInfo:
     """Information about a commit."""
 
@@ -49,12 +57,13 @@ class CommitInfo:
     author_name: str
     author_email: str
     date: datetime
-    additions: int
-    deletions: int
-    files_changed: int
+    # None unless stats were requested (they cost one API call per commit)
+    additions: Optional[int]
+    deletions: Optional[int]
+    files_changed: Optional[int]
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CommitDiff:
     """Diff information for a commit."""
 
@@ -92,7 +101,13 @@ class RepositoryNotFoundError(GitHubClientError):
 class GitHubClient:
     """Client for interacting with GitHub API."""
 
-    def __init__(self, token: Optional[str] = None, per_page: int = 30):
+    # Concurrent requests used when fetching several commit diffs
+    MAX_WORKERS = 8
+
+    # Seconds a fetched rate limit status is reused before asking again
+    RATE_LIMIT_CACHE_TTL = 5.0
+
+    def __init__(self, token: Optional[str] = None, per_page: int = 100):
         """
         Initialize GitHub client.
 
@@ -108,13 +123,17 @@ class GitHubClient:
             )
 
         self.per_page = min(per_page, 100)
-        self._github = Github(self.token, per_page=self.per_page)
+        # One pooled connection per concurrent diff request; PyGithub's default
+        # retry policy already waits out rate limits using Retry-After
+        self._github = Github(self.token, per_page=self.per_page, pool_size=self.MAX_WORKERS)
+
+        self._rate_limit_cache: Optional[tuple] = None
 
         # Validate token
         try:
             self._user = self._github.get_user()
-            # Force API call to validate token
-            _ = self._user.login
+            # Force API call to validate token; the login never changes
+            self._username: str = self._user.login
         except GithubException as e:
             if e.status == 401:
                 raise AuthenticationError("Invalid GitHub token.")
@@ -125,6 +144,7 @@ class GitHubClient:
         include_private: bool = True,
         sort: str = "updated",
         direction: str = "desc",
+        max_items: Optional[int] = None,
     ) -> List[RepositoryInfo]:
         """
         List all accessible repositories.
@@ -133,12 +153,31 @@ class GitHubClient:
             include_private: Include private repositories.
             sort: Sort field (created, updated, pushed, full_name).
             direction: Sort direction (asc, desc).
+            max_items: Maximum number of repositories to return. None returns all.
 
         Returns:
             List of RepositoryInfo objects.
         """
+        return list(islice(self.iter_repositories(include_private, sort, direction), max_items))
+
+    def iter_repositories(
+        self,
+        include_private: bool = True,
+        sort: str = "updated",
+        direction: str = "desc",
+    ) -> Iterator[RepositoryInfo]:
+        """
+        Iterate over accessible repositories, fetching pages only as needed.
+
+        Args:
+            include_private: Include private repositories.
+            sort: Sort field (created, updated, pushed, full_name).
+            direction: Sort direction (asc, desc).
+
+        Yields:
+            RepositoryInfo objects.
+        """
         try:
-            repos = []
             affiliation = "owner,collaborator,organization_member"
 
             for repo in self._user.get_repos(
@@ -147,23 +186,19 @@ class GitHubClient:
                 if not include_private and repo.private:
                     continue
 
-                repos.append(
-                    RepositoryInfo(
-                        name=repo.name,
-                        full_name=repo.full_name,
-                        description=repo.description,
-                        language=repo.language,
-                        stars=repo.stargazers_count,
-                        forks=repo.forks_count,
-                        updated_at=repo.updated_at,
-                        default_branch=repo.default_branch,
-                        private=repo.private,
-                        url=repo.html_url,
-                    )
+                yield RepositoryInfo(
+                    name=repo.name,
+                    full_name=repo.full_name,
+                    description=repo.description,
+                    language=repo.language,
+                    stars=repo.stargazers_count,
+                    forks=repo.forks_count,
+                    updated_at=repo.updated_at,
+                    default_branch=repo.default_branch,
+                    private=repo.private,
+                    url=repo.html_url,
                 )
 
-            return repos
-
         except GithubException as e:
             if e.status == 403:
                 raise RateLimitError("GitHub API rate limit exceeded.")
@@ -209,6 +244,7 @@ class GitHubClient:
         repo_name: str,
         branch_name: Optional[str] = None,
         limit: int = 50,
+        include_stats: bool = False,
     ) -> List[CommitInfo]:
         """
         List recent commits for a repository branch.
@@ -217,34 +253,54 @@ class GitHubClient:
             repo_name: Full repository name (owner/repo).
             branch_name: Branch name. If None, uses default branch.
             limit: Maximum number of commits to return.
+            include_stats: Also fetch additions, deletions and files changed.
+                The list endpoint does not return them, so this costs one
+                extra request per commit (made concurrently).
 
         Returns:
             List of CommitInfo objects.
         """
+        if not include_stats:
+            return list(islice(self.iter_commits(repo_name, branch_name), limit))
+
         try:
             repo = self._github.get_repo(repo_name)
             sha = branch_name or repo.default_branch
+            commits = list(repo.get_commits(sha=sha)[:limit])
+            if not commits:
+                return []
 
-            commits = []
-            for commit in repo.get_commits(sha=sha)[:limit]:
-                # Get detailed commit info
-                git_commit = commit.commit
-
-                commits.append(
-                    CommitInfo(
-                        sha=commit.sha,
-                        short_sha=commit.sha[:7],
-                        message=git_commit.message,
-                        author_name=git_commit.author.name if git_commit.author else "Unknown",
-                        author_email=git_commit.author.email if git_commit.author else "",
-                        date=git_commit.author.date if git_commit.author else datetime.now(),
-                        additions=commit.stats.additions if commit.stats else 0,
-                        deletions=commit.stats.deletions if commit.stats else 0,
-                        files_changed=len(commit.files) if commit.files else 0,
-                    )
-                )
+            workers = min(self.MAX_WORKERS, len(commits))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self._commit_info_with_stats, commits))
+
+        except GithubException as e:
+            if e.status == 404:
+                raise RepositoryNotFoundError(f"Repository or branch not found: {repo_name}/{branch_name}")
+            if e.status == 403:
+                raise RateLimitError("GitHub API rate limit exceeded.")
+            raise GitHubClientError(f"Failed to list commits: {e}")
 
-            return commits
+    def iter_commits(
+        self, repo_name: str, branch_name: Optional[str] = None
+    ) -> Iterator[CommitInfo]:
+        """
+        Iterate over a branch's commits, newest first, fetching pages only as needed.
+
+        Commits are built from the list response, so additions, deletions
+        and files changed are None.
+
+        Args:
+            repo_name: Full repository name (owner/repo).
+            branch_name: Branch name. If None, uses default branch.
+
+        Yields:
+            CommitInfo objects.
+        """
+        try:
+            repo = self._github.get_repo(repo_name)
+            for commit in repo.get_commits(sha=branch_name or repo.default_branch):
+                yield self._commit_info(commit)
 
         except GithubException as e:
             if e.status == 404:
@@ -253,6 +309,41 @@ class GitHubClient:
                 raise RateLimitError("GitHub API rate limit exceeded.")
             raise GitHubClientError(f"Failed to list commits: {e}")
 
+    @staticmethod
+    def _commit_info(
+        commit: Commit,
+        additions: Optional[int] = None,
+        deletions: Optional[int] = None,
+        files_changed: Optional[int] = None,
+    ) -> CommitInfo:
+        """Build a CommitInfo from data included in the list-commits response."""
+        git_commit = commit.commit
+        author = git_commit.author
+
+        return CommitInfo(
+            sha=commit.sha,
+            short_sha=commit.sha[:7],
+            message=git_commit.message,
+            author_name=author.name if author else "Unknown",
+            author_email=author.email if author else "",
+            date=author.date if author else datetime.now(),
+            additions=additions,
+            deletions=deletions,
+            files_changed=files_changed,
+        )
+
+    def _commit_info_with_stats(self, commit: Commit) -> CommitInfo:
+        """Build a CommitInfo, fetching the commit's stats and files."""
+        stats = commit.stats
+        files = commit.files
+
+        return self._commit_info(
+            commit,
+            additions=stats.additions if stats else 0,
+            deletions=stats.deletions if stats else 0,
+            files_changed=len(files) if files else 0,
+        )
+
     def get_commit_diff(self, repo_name: str, commit_sha: str) -> CommitDiff:
         """
         Get the diff for a specific commit.
@@ -311,29 +402,44 @@ class GitHubClient:
             commit_shas: List of commit SHAs.
 
         Returns:
-            List of CommitDiff objects.
+            List of CommitDiff objects, in the same order as commit_shas.
         """
-        diffs = []
-        for sha in commit_shas:
-            diff = self.get_commit_diff(repo_name, sha)
-            diffs.append(diff)
-        return diffs
+        if not commit_shas:
+            return []
+
+        # Each diff is a separate API round-trip, so fetch them concurrently
+        workers = min(self.MAX_WORKERS, len(commit_shas))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.get_commit_diff, repo_name, sha) for sha in commit_shas
+            ]
+            return [future.result() for future in futures]
 
     def get_rate_limit_status(self) -> dict:
         """
         Get current rate limit status.
 
+        The status is cached for RATE_LIMIT_CACHE_TTL seconds so that
+        frequent progress updates do not each make a request.
+
         Returns:
             Dictionary with rate limit information.
         """
+        now = time.monotonic()
+        cached = self._rate_limit_cache
+        if cached and now - cached[0] < self.RATE_LIMIT_CACHE_TTL:
+            return cached[1]
+
         rate = self._github.get_rate_limit()
-        return {
+        status = {
             "limit": rate.core.limit,
             "remaining": rate.core.remaining,
             "reset_time": rate.core.reset,
         }
+        self._rate_limit_cache = (now, status)
+        return status
 
     @property
     def username(self) -> str:
         """Get the authenticated user's username."""
-        return self._user.login
+        return self._username
@@ -7,18 +7,53 @@ Analyzes JaCoCo HTML coverage reports to extract:
 - Coverage statistics per class/file
 """
 
+import io
 import os
 import re
+import sys
 import zipfile
 import tempfile
 import shutil
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from html.parser import HTMLParser
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from functools import partial
+from typing import BinaryIO, Callable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
-@dataclass
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# Amount read and fed to the parser at a time when streaming source pages
+_SOURCE_READ_SIZE = 64 * 1024
+
+# Common locations of index.html relative to the extracted report
+_INDEX_LOCATIONS = (
+    ('index.html',),
+    ('jacoco', 'index.html'),
+    ('site', 'jacoco', 'index.html'),
+    ('target', 'site', 'jacoco', 'index.html'),
+    ('build', 'reports', 'jacoco', 'test', 'html', 'index.html'),
+)
+
+# Fewer source files than this are parsed in-process
+_PARALLEL_MIN_FILES = 4
+
+# Per-line records use __slots__ where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MissedBranch:
     """Represents a missed branch in the code."""
     file_path: str
@@ -28,7 +63,7 @@ class MissedBranch:
     source_line: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UncoveredLine:
     """Represents an uncovered line of code."""
     file_path: str
@@ -81,6 +116,9 @@ class JaCoCoSourceHTMLParser(HTMLParser):
         self.current_line_class = ""
         self.current_line_title = ""
         self.current_line_content = ""
+        # Text chunks of the current line, kept only for pc/nc lines
+        self.line_parts: List[str] = []
+        self.collect_line = False
         self.in_span = False
         self.span_class = ""
         self.span_title = ""
@@ -103,7 +141,8 @@ class JaCoCoSourceHTMLParser(HTMLParser):
                 self.current_line_number = int(span_id[1:])
                 self.current_line_class = self.span_class
                 self.current_line_title = self.span_title
-                self.current_line_content = ""
+                self.collect_line = 'pc' in self.span_class or 'nc' in self.span_class
+                self.line_parts = []
 
     def handle_endtag(self, tag):
         if tag == 'pre':
@@ -111,16 +150,22 @@ class JaCoCoSourceHTMLParser(HTMLParser):
 
         if tag == 'span' and self.in_span:
             self.in_span = False
-            # Process the completed line
-            if self.current_line_number > 0:
+            # Process the completed line; other lines are never reported
+            if self.current_line_number > 0 and self.collect_line:
+                self.current_line_content = ''.join(self.line_parts)
                 self._process_line()
 
     def handle_data(self, data):
-        if self.in_span and self.in_pre:
-            self.current_line_content += data
+        if self.collect_line and self.in_span and self.in_pre:
+            self.line_parts.append(data)
 
     def _process_line(self):
         """Process a completed source line and extract coverage info."""
+        # Most lines are fully covered or not executable; skip them early
+        line_class = self.current_line_class
+        if 'pc' not in line_class and 'nc' not in line_class:
+            return
+
         line_content = self.current_line_content.strip()
 
         # Skip empty lines
@@ -130,7 +175,9 @@ class JaCoCoSourceHTMLParser(HTMLParser):
         # Check for missed branches (partial coverage - yellow/orange background)
         # JaCoCo uses class "pc" for partially covered and has branch info in title
         if 'pc' in self.current_line_class:
-            branch_info = self.current_line_title or "Partially covered"
+            # Titles like "1 of 2 branches missed." repeat across a report,
+            # so share one string per distinct title
+            branch_info = sys.intern(self.current_line_title or "Partially covered")
             self.missed_branches.append(MissedBranch(
                 file_path=self.file_path,
                 class_name=self.class_name,
@@ -150,6 +197,62 @@ class JaCoCoSourceHTMLParser(HTMLParser):
             ))
 
 
+class JaCoCoSourceTarget:
+    """
+    lxml parser target for JaCoCo source code HTML files.
+    Receives parse events from libxml2 and extracts the same line-by-line
+    coverage information as JaCoCoSourceHTMLParser.
+    """
+
+    def __init__(self, file_path: str, class_name: str):
+        self.file_path = file_path
+        self.class_name = class_name
+        self.missed_branches: List[MissedBranch] = []
+        self.uncovered_lines: List[UncoveredLine] = []
+
+        self.current_line_number = 0
+        self.current_line_class = ""
+        self.current_line_title = ""
+        self.current_line_content = ""
+        self.line_parts: List[str] = []
+        self.in_pre = False
+
+    def start(self, tag, attrib):
+        if tag == 'pre':
+            self.in_pre = True
+        elif tag == 'span' and self.in_pre:
+            # Extract line number from id attribute (e.g., "L1", "L2")
+            span_id = attrib.get('id', '')
+            if span_id.startswith('L') and span_id[1:].isdigit():
+                line_class = attrib.get('class', '')
+                # Only partially covered or uncovered lines are reported, so
+                # don't collect text for the rest
+                if 'pc' not in line_class and 'nc' not in line_class:
+                    return
+                self.current_line_number = int(span_id[1:])
+                self.current_line_class = line_class
+                self.current_line_title = attrib.get('title', '')
+                self.line_parts = []
+
+    def end(self, tag):
+        if tag == 'pre':
+            self.in_pre = False
+        elif tag == 'span' and self.current_line_number > 0:
+            self.current_line_content = ''.join(self.line_parts)
+            self._process_line()
+            self.current_line_number = 0
+
+    def data(self, data):
+        if self.current_line_number > 0:
+            self.line_parts.append(data)
+
+    def close(self) -> Tuple[List[MissedBranch], List[UncoveredLine]]:
+        return self.missed_branches, self.uncovered_lines
+
+    # Same triage as the html.parser implementation
+    _process_line = JaCoCoSourceHTMLParser._process_line
+
+
 class JaCoCoIndexHTMLParser(HTMLParser):
     """
     Parser for JaCoCo index.html to extract overall coverage statistics
@@ -227,7 +330,6 @@ def find_7zip_executables() -> List[str]:
         List of paths to 7z executables found
     """
     import platform
-    import subprocess
 
     found_paths = []
 
@@ -268,20 +370,11 @@ def find_7zip_executables() -> List[str]:
             os.path.expanduser('~/.local/bin/7za'),
         ]
 
-        # Check PATH using 'which' command
+        # Check PATH (same lookup as the 'which' command, without spawning it)
         for cmd in ['7z', '7za', '7zr']:
-            try:
-                result = subprocess.run(
-                    ['which', cmd],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode == 0:
-                    path = result.stdout.strip()
-                    if path and path not in common_paths:
-                        common_paths.append(path)
-            except (FileNotFoundError, subprocess.SubprocessError):
-                pass
+            path = shutil.which(cmd)
+            if path and path not in common_paths:
+                common_paths.append(path)
 
     # Check which paths actually exist and are executable
     for path in common_paths:
@@ -361,6 +454,39 @@ def extract_archive(archive_path: str, extract_to: str) -> bool:
         raise ValueError(f"Unsupported archive format: {archive_path}")
 
 
+def _walk_files(root: str, rel_root: str = '') -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Recursively yield the files under a directory.
+
+    Visits entries in the same order as os.walk (a directory's files before
+    its subdirectories) and, like os.walk, does not follow symlinked
+    directories. Relative paths are built while walking, which avoids an
+    os.path.relpath call per file.
+
+    Args:
+        root: Directory to walk
+        rel_root: Path of root relative to the top of the walk
+
+    Yields:
+        (DirEntry, relative path) tuples
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append((entry.path, rel_root + entry.name + os.sep))
+                    continue
+                yield entry, rel_root + entry.name
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does by default
+        return
+
+    for path, rel_path in subdirs:
+        yield from _walk_files(path, rel_path)
+
+
 def find_jacoco_index(directory: str) -> Optional[str]:
     """
     Find the JaCoCo index.html file in the extracted directory.
@@ -372,30 +498,23 @@ def find_jacoco_index(directory: str) -> Optional[str]:
         Path to index.html or None if not found
     """
     # Common locations for JaCoCo reports
-    possible_paths = [
-        os.path.join(directory, 'index.html'),
-        os.path.join(directory, 'jacoco', 'index.html'),
-        os.path.join(directory, 'site', 'jacoco', 'index.html'),
-        os.path.join(directory, 'target', 'site', 'jacoco', 'index.html'),
-        os.path.join(directory, 'build', 'reports', 'jacoco', 'test', 'html', 'index.html'),
-    ]
-
-    for path in possible_paths:
+    for parts in _INDEX_LOCATIONS:
+        path = os.path.join(directory, *parts)
         if os.path.exists(path):
             return path
 
     # Search recursively for index.html
-    for root, dirs, files in os.walk(directory):
-        if 'index.html' in files:
+    for entry, _ in _walk_files(directory):
+        if entry.name == 'index.html':
             # Verify it's a JaCoCo report by checking content
-            index_path = os.path.join(root, 'index.html')
+            index_path = entry.path
             try:
-                with open(index_path, 'r', encoding='utf-8') as f:
-                    content = f.read(1000)  # Read first 1000 chars
-                    if 'jacoco' in content.lower() or 'coverage' in content.lower():
-                        return index_path
-            except (IOError, UnicodeDecodeError):
+                with open(index_path, 'rb') as f:
+                    head = f.read(1000)  # Read first 1000 bytes
+            except IOError:
                 continue
+            if _is_report_index(head):
+                return index_path
 
     return None
 
@@ -412,20 +531,88 @@ def find_source_html_files(base_dir: str) -> List[Tuple[str, str]]:
     """
     source_files = []
 
-    for root, dirs, files in os.walk(base_dir):
-        for file in files:
-            # JaCoCo source files end with .java.html or similar
-            if file.endswith('.html') and file != 'index.html':
-                # Skip package index files
-                if file in ('index.html', 'index.source.html'):
-                    continue
+    for entry, rel_path in _walk_files(base_dir):
+        file = entry.name
+        # JaCoCo source files end with .java.html or similar
+        if file.endswith('.html') and file != 'index.html':
+            # Skip package index files
+            if file in ('index.html', 'index.source.html'):
+                continue
+
+            # Extract class name from file name
+            class_name = file.replace('.html', '')
+            source_files.append((entry.path, class_name, rel_path))
+
+    return source_files
+
+
+def _is_report_index(head: bytes) -> bool:
+    """Check the first bytes of an index.html for signs of a coverage report."""
+    # Compare bytes; the page's encoding doesn't matter for ASCII words
+    head = head.lower()
+    return b'jacoco' in head or b'coverage' in head
+
+
+def _find_zip_index(zip_ref: zipfile.ZipFile) -> Optional[str]:
+    """
+    Find the JaCoCo index.html inside a zip archive.
+
+    Checks the same locations as find_jacoco_index, then any other
+    index.html that looks like a coverage report.
+
+    Args:
+        zip_ref: Open zip archive
+
+    Returns:
+        Member name of index.html or None if not found
+    """
+    names = zip_ref.namelist()
+    name_set = set(names)
+
+    for parts in _INDEX_LOCATIONS:
+        name = '/'.join(parts)
+        if name in name_set:
+            return name
+
+    for name in names:
+        if name == 'index.html' or name.endswith('/index.html'):
+            try:
+                with zip_ref.open(name) as f:
+                    head = f.read(1000)  # Read first 1000 bytes
+            except (IOError, zipfile.BadZipFile):
+                continue
+            if _is_report_index(head):
+                return name
+
+    return None
+
+
+def _find_zip_source_files(zip_ref: zipfile.ZipFile, index_dir: str) -> List[Tuple[str, str, str]]:
+    """
+    Find all source HTML files under a directory of a zip archive.
 
-                file_path = os.path.join(root, file)
-                # Extract class name from file name
-                class_name = file.replace('.html', '')
-                # Get relative path for context
-                rel_path = os.path.relpath(file_path, base_dir)
-                source_files.append((file_path, class_name, rel_path))
+    Zip counterpart of find_source_html_files.
+
+    Args:
+        zip_ref: Open zip archive
+        index_dir: Member directory containing index.html ('' for the root)
+
+    Returns:
+        List of (member_name, class_name, rel_path) tuples
+    """
+    prefix = index_dir + '/' if index_dir else ''
+    source_files = []
+
+    for name in zip_ref.namelist():
+        if not name.startswith(prefix) or name.endswith('/'):
+            continue
+
+        file = name.rpartition('/')[2]
+        # JaCoCo source files end with .java.html or similar; skip package index files
+        if file.endswith('.html') and file not in ('index.html', 'index.source.html'):
+            class_name = file.replace('.html', '')
+            rel_path = name[len(prefix):].replace('/', os.sep)
+            source_files.append((name, class_name, rel_path))
 
     return source_files
 
@@ -442,20 +629,298 @@ def parse_source_file(file_path: str, class_name: str) -> Tuple[List[MissedBranc
         Tuple of (missed_branches, uncovered_lines)
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except (IOError, UnicodeDecodeError) as e:
+        with open(file_path, 'rb') as f:
+            return _parse_source(f, file_path, class_name)
+    except IOError:
         return [], []
 
+
+def _parse_source(f: BinaryIO, file_path: str, class_name: str) -> Tuple[List[MissedBranch], List[UncoveredLine]]:
+    """
+    Parse a JaCoCo source HTML page from a binary stream.
+
+    Uses the fastest installed parser: selectolax, then lxml, then
+    html.parser. Read errors are left to the caller.
+
+    Args:
+        f: Binary file object positioned at the start of the page
+        file_path: Path recorded on the results
+        class_name: Name of the class
+
+    Returns:
+        Tuple of (missed_branches, uncovered_lines)
+    """
+    if LexborHTMLParser is not None:
+        return _parse_source_lexbor(f, file_path, class_name)
+    if lxml_etree is not None:
+        return _parse_source_lxml(f, file_path, class_name)
+
+    # Feed the page in chunks rather than reading it into one string
     parser = JaCoCoSourceHTMLParser(file_path, class_name)
     try:
-        parser.feed(content)
+        text = io.TextIOWrapper(f, encoding='utf-8')
+        for chunk in iter(lambda: text.read(_SOURCE_READ_SIZE), ''):
+            parser.feed(chunk)
     except Exception:
         return [], []
 
     return parser.missed_branches, parser.uncovered_lines
 
 
+def _parse_source_lexbor(f: BinaryIO, file_path: str, class_name: str) -> Tuple[List[MissedBranch], List[UncoveredLine]]:
+    """
+    Parse a JaCoCo source HTML page with selectolax's Lexbor backend.
+
+    Same result as JaCoCoSourceHTMLParser. Lexbor builds the whole page in
+    C and line spans are selected with a CSS query, which is the fastest
+    of the available parsers, at the cost of holding the page's DOM in
+    memory while it is parsed.
+
+    Args:
+        f: Binary file object positioned at the start of the page
+        file_path: Path recorded on the results
+        class_name: Name of the class
+
+    Returns:
+        Tuple of (missed_branches, uncovered_lines)
+    """
+    missed_branches = []
+    uncovered_lines = []
+
+    tree = LexborHTMLParser(f.read())
+
+    for span in tree.css('pre span[id^="L"]'):
+        attrs = span.attributes
+        line_class = attrs.get('class') or ''
+        # Only partially covered or uncovered lines are reported
+        if 'pc' not in line_class and 'nc' not in line_class:
+            continue
+
+        # Line spans have ids like "L1", "L2"
+        span_id = attrs['id']
+        if not span_id[1:].isdigit():
+            continue
+
+        line_content = span.text(deep=True).strip()
+        if not line_content:
+            continue
+
+        line_number = int(span_id[1:])
+
+        if 'pc' in line_class:
+            missed_branches.append(MissedBranch(
+                file_path=file_path,
+                class_name=class_name,
+                line_number=line_number,
+                branch_info=sys.intern(attrs.get('title') or "Partially covered"),
+                source_line=line_content
+            ))
+
+        if 'nc' in line_class:
+            uncovered_lines.append(UncoveredLine(
+                file_path=file_path,
+                class_name=class_name,
+                line_number=line_number,
+                source_line=line_content
+            ))
+
+    return missed_branches, uncovered_lines
+
+
+def _parse_source_lxml(f: BinaryIO, file_path: str, class_name: str) -> Tuple[List[MissedBranch], List[UncoveredLine]]:
+    """
+    Parse a JaCoCo source HTML page with lxml.
+
+    Same result as JaCoCoSourceHTMLParser, but tokenizing happens in
+    libxml2. The page is streamed into a parser target, so no element
+    tree is built for the page.
+
+    Args:
+        f: Binary file object positioned at the start of the page
+        file_path: Path recorded on the results
+        class_name: Name of the class
+
+    Returns:
+        Tuple of (missed_branches, uncovered_lines)
+    """
+    target = JaCoCoSourceTarget(file_path, class_name)
+    # JaCoCo writes UTF-8; decode as the other backends do, overriding any
+    # <?xml encoding?> declaration in the page
+    parser = lxml_etree.HTMLParser(target=target, encoding='utf-8')
+
+    try:
+        for chunk in iter(lambda: f.read(_SOURCE_READ_SIZE), b''):
+            parser.feed(chunk)
+        return parser.close()
+    except lxml_etree.LxmlError:
+        return [], []
+
+
+def _parse_report_files(entries: List[Tuple[str, str, str]]) -> List[Tuple[List[MissedBranch], List[UncoveredLine]]]:
+    """
+    Parse a batch of find_source_html_files entries.
+
+    Module-level so it can be sent to worker processes.
+
+    Args:
+        entries: (file_path, class_name, rel_path) tuples
+
+    Returns:
+        (missed_branches, uncovered_lines) per entry, with file paths
+        relative to the report directory
+    """
+    results = []
+    for file_path, class_name, rel_path in entries:
+        try:
+            with open(file_path, 'rb') as f:
+                results.append(_parse_source(f, rel_path, class_name))
+        except IOError:
+            results.append(([], []))
+    return results
+
+
+def _parse_zip_members(archive_path: str, entries: List[Tuple[str, str, str]]) -> List[Tuple[List[MissedBranch], List[UncoveredLine]]]:
+    """
+    Parse a batch of _find_zip_source_files entries straight from the archive.
+
+    Module-level so it can be sent to worker processes; the archive is
+    opened once per batch.
+
+    Args:
+        archive_path: Path to the zip archive
+        entries: (member_name, class_name, rel_path) tuples
+
+    Returns:
+        (missed_branches, uncovered_lines) per entry, with file paths
+        relative to the report directory
+    """
+    results = []
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        for name, class_name, rel_path in entries:
+            try:
+                with zip_ref.open(name) as f:
+                    results.append(_parse_source(f, rel_path, class_name))
+            except (IOError, zipfile.BadZipFile):
+                results.append(([], []))
+    return results
+
+
+def _parse_batch_columns(parse_batch: Callable[[list], list], entries: list) -> list:
+    """
+    Run a batch parser in a worker and return its results as columns.
+
+    Pickling thousands of dataclass instances back to the parent costs
+    far more than the parse itself; per-file columns of line numbers and
+    strings pickle an order of magnitude faster. File path and class name
+    are constant per entry, so they are restored from the entry instead.
+
+    Args:
+        parse_batch: Module-level function parsing a list of entries
+        entries: Entries to parse
+
+    Returns:
+        (branch_lines, branch_infos, branch_sources, uncovered_lines,
+        uncovered_sources) per entry
+    """
+    columns = []
+    for missed_branches, uncovered_lines in parse_batch(entries):
+        columns.append((
+            array('i', [mb.line_number for mb in missed_branches]),
+            [mb.branch_info for mb in missed_branches],
+            [mb.source_line for mb in missed_branches],
+            array('i', [ul.line_number for ul in uncovered_lines]),
+            [ul.source_line for ul in uncovered_lines],
+        ))
+    return columns
+
+
+def _from_columns(entry: Tuple[str, str, str], columns: tuple) -> Tuple[List[MissedBranch], List[UncoveredLine]]:
+    """Rebuild one entry's parse results from _parse_batch_columns output."""
+    _, class_name, rel_path = entry
+    branch_lines, branch_infos, branch_sources, line_numbers, line_sources = columns
+    return (
+        [
+            MissedBranch(rel_path, class_name, line_number, branch_info, source_line)
+            for line_number, branch_info, source_line
+            in zip(branch_lines, branch_infos, branch_sources)
+        ],
+        [
+            UncoveredLine(rel_path, class_name, line_number, source_line)
+            for line_number, source_line in zip(line_numbers, line_sources)
+        ],
+    )
+
+
+def _parse_in_batches(parse_batch: Callable[[list], list], entries: list) -> list:
+    """
+    Run a batch parser over report entries, in worker processes when worthwhile.
+
+    Files are independent, so when there are enough of them to outweigh
+    pool startup they are split into a few batches per CPU.
+
+    Args:
+        parse_batch: Module-level function parsing a list of entries
+        entries: (path, class_name, rel_path) tuples to parse
+
+    Returns:
+        Per-entry results, in the order of entries
+    """
+    workers = min(os.cpu_count() or 1, len(entries))
+    if workers > 1 and len(entries) >= _PARALLEL_MIN_FILES:
+        # A few batches per worker balances load without reopening the
+        # archive for every entry
+        size = -(-len(entries) // (workers * 4))
+        batches = [entries[i:i + size] for i in range(0, len(entries), size)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = executor.map(partial(_parse_batch_columns, parse_batch), batches)
+                return [
+                    _from_columns(entry, columns)
+                    for batch, batch_columns in zip(batches, parsed)
+                    for entry, columns in zip(batch, batch_columns)
+                ]
+        except (OSError, BrokenProcessPool):
+            # Process pools are unavailable in some sandboxes
+            pass
+
+    return parse_batch(entries)
+
+
+def _analyze_zip_report(archive_path: str) -> JaCoCoAnalysisResult:
+    """
+    Analyze a zipped JaCoCo report without extracting it.
+
+    Args:
+        archive_path: Path to the zip archive
+
+    Returns:
+        JaCoCoAnalysisResult with all missed branches and uncovered lines
+    """
+    result = JaCoCoAnalysisResult()
+    archive_path = os.path.abspath(archive_path)
+
+    try:
+        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+            index_name = _find_zip_index(zip_ref)
+            if not index_name:
+                raise ValueError("Could not find JaCoCo index.html in the provided location")
+
+            index_dir = index_name.rpartition('/')[0]
+            source_files = _find_zip_source_files(zip_ref, index_dir)
+    except zipfile.BadZipFile:
+        raise ValueError(f"Invalid or corrupted zip file: {archive_path}")
+
+    result.source_directory = os.path.join(archive_path, *index_dir.split('/')) if index_dir else archive_path
+    result.total_files_analyzed = len(source_files)
+
+    parsed = _parse_in_batches(partial(_parse_zip_members, archive_path), source_files)
+    for missed_branches, uncovered_lines in parsed:
+        result.missed_branches.extend(missed_branches)
+        result.uncovered_lines.extend(uncovered_lines)
+
+    return result
+
+
 def analyze_jacoco_report(archive_path: str = None, report_dir: str = None) -> JaCoCoAnalysisResult:
     """
     Analyze a JaCoCo HTML report.
@@ -474,6 +939,9 @@ def analyze_jacoco_report(archive_path: str = None, report_dir: str = None) -> J
         if archive_path:
             # Expand environment variables and user home directory in archive path
             archive_path = os.path.expandvars(os.path.expanduser(archive_path))
+            if archive_path.endswith('.zip'):
+                # Zip members are parsed straight from the archive
+                return _analyze_zip_report(archive_path)
             # Extract archive to temp directory
             temp_dir = tempfile.mkdtemp(prefix='jacoco_')
             extract_archive(archive_path, temp_dir)
@@ -497,15 +965,8 @@ def analyze_jacoco_report(archive_path: str = None, report_dir: str = None) -> J
         result.total_files_analyzed = len(source_files)
 
         # Parse each source file
-        for file_path, class_name, rel_path in source_files:
-            missed_branches, uncovered_lines = parse_source_file(file_path, class_name)
-
-            # Update file paths to be more readable
-            for mb in missed_branches:
-                mb.file_path = rel_path
-            for ul in uncovered_lines:
-                ul.file_path = rel_path
-
+        parsed = _parse_in_batches(_parse_report_files, source_files)
+        for missed_branches, uncovered_lines in parsed:
             result.missed_branches.extend(missed_branches)
             result.uncovered_lines.extend(uncovered_lines)
 
@@ -556,13 +1017,16 @@ def format_analysis_result(result: JaCoCoAnalysisResult) -> Dict:
     }
 
 
+def _new_file_bucket() -> Dict:
+    """Create the empty per-file entry used by _group_by_file."""
+    return {'missed_branches': [], 'uncovered_lines': []}
+
+
 def _group_by_file(result: JaCoCoAnalysisResult) -> Dict:
     """Group missed branches and uncovered lines by file."""
-    by_file = {}
+    by_file = defaultdict(_new_file_bucket)
 
     for mb in result.missed_branches:
-        if mb.file_path not in by_file:
-            by_file[mb.file_path] = {'missed_branches': [], 'uncovered_lines': []}
         by_file[mb.file_path]['missed_branches'].append({
             'line': mb.line_number,
             'branch_info': mb.branch_info,
@@ -570,11 +1034,9 @@ def _group_by_file(result: JaCoCoAnalysisResult) -> Dict:
         })
 
     for ul in result.uncovered_lines:
-        if ul.file_path not in by_file:
-            by_file[ul.file_path] = {'missed_branches': [], 'uncovered_lines': []}
         by_file[ul.file_path]['uncovered_lines'].append({
             'line': ul.line_number,
             'source': ul.source_line
         })
 
-    return by_file
+    return dict(by_file)
@@ -0,0 +1,168 @@
+"""
+Content-addressed cache for OpenAI commit message responses.
+
+Responses are keyed by a SHA-256 hash of the full request payload, so an
+identical diff sent with identical settings reuses the earlier answer.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# Default directory for the on-disk cache backend
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sonar_commit_cache")
+
+# Cache entries are stored as (expires_at, data)
+CacheEntry = Tuple[float, dict]
+
+
+class InMemoryLRU:
+    """In-memory cache backend with least-recently-used eviction."""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry, marking it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used if full."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+
+
+class DiskCache:
+    """On-disk cache backend storing one JSON file per entry."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Initialize the disk backend.
+
+        Args:
+            cache_dir: Directory to store cache entries in.
+        """
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Read an entry from disk."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                stored = json.load(f)
+            return stored["expires_at"], stored["data"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry to disk atomically."""
+        expires_at, data = entry
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": expires_at, "data": data}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from disk if present."""
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
+class LLMCache:
+    """TTL cache of parsed OpenAI responses with hit/miss tracking."""
+
+    def __init__(self, backend=None, ttl: int = 86400):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (InMemoryLRU or DiskCache). Defaults to InMemoryLRU.
+            ttl: Time-to-live for entries in seconds.
+        """
+        self.backend = backend if backend is not None else InMemoryLRU()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(payload: dict) -> str:
+        """Build a cache key from a JSON-serializable request payload."""
+        serialized = json.dumps(payload, sort_keys=True)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get cached data for a key.
+
+        Returns:
+            The cached data, or None on a miss or expired entry.
+        """
+        entry = self.backend.get(key)
+        if entry is not None:
+            expires_at, data = entry
+            if expires_at > time.time():
+                self.hits += 1
+                return data
+            self.backend.delete(key)
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, data: dict) -> None:
+        """Store data for a key."""
+        self.backend.set(key, (time.time() + self.ttl, data))
+
+    def stats(self) -> dict:
+        """Get cache hit/miss metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def create_llm_cache(backend: str = "memory", ttl: int = 86400) -> Optional[LLMCache]:
+    """
+    Create an LLM cache for the given backend name.
+
+    Args:
+        backend: Backend name: "memory", "disk", or "off".
+        ttl: Time-to-live for entries in seconds.
+
+    Returns:
+        LLMCache instance, or None if caching is disabled.
+    """
+    if backend == "disk":
+        return LLMCache(DiskCache(), ttl=ttl)
+    if backend == "memory":
+        return LLMCache(InMemoryLRU(), ttl=ttl)
+    return None
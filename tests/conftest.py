@@ -0,0 +1,27 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import git
+import gitlab
+import pytest
+from github.Requester import Requester
+
+
+def _refuse(what):
+    """Build a stand-in that fails any call reaching a real service."""
+    def refuse(*args, **kwargs):
+        raise RuntimeError(f"{what} in test; patch it out")
+
+    return refuse
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_network():
+    """Make unpatched GitHub, GitLab or git access fail fast instead of doing I/O."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ("requestJson", "requestMultipart", "requestBlob"):
+            mp.setattr(Requester, name, _refuse("GitHub API request"))
+        mp.setattr(gitlab.Gitlab, "http_request", _refuse("GitLab API request"))
+        mp.setattr(git.Repo, "__init__", _refuse("Real git repository"))
+        yield
@@ -3,9 +3,11 @@ Tests for the commit generator module.
 """
 
 import json
+import openai
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
+from sonar_jacoco_analyzer import commit_generator
 from sonar_jacoco_analyzer.commit_generator import (
     CommitGenerator,
     GeneratedCommit,
@@ -18,6 +20,18 @@ from sonar_jacoco_analyzer.commit_generator import (
 )
 from sonar_jacoco_analyzer.conventional_commit import CommitType
 from sonar_jacoco_analyzer.commit_config import CommitConfig
+from sonar_jacoco_analyzer.commit_splitter import FileCategory, SplitGroup
+from sonar_jacoco_analyzer.git_operations import FileChange
+
+
+def make_stream_response(content, chunk_size=16):
+    """Build a mocked streaming chat completion that yields content in chunks."""
+    if content is None:
+        return []
+    return [
+        Mock(choices=[Mock(delta=Mock(content=content[i:i + chunk_size]))])
+        for i in range(0, len(content), chunk_size)
+    ]
 
 
 class TestGeneratedCommit:
@@ -58,6 +72,15 @@ class TestGeneratedCommit:
         assert commit.body == "Handle null values properly."
         assert "fix(auth):" in commit.formatted_message
 
+    def test_from_dict_with_unhashable_values(self):
+        """Test that malformed responses bypass the formatting cache."""
+        data = {"type": "fix", "scope": ["auth"], "subject": "fix login bug"}
+
+        commit = GeneratedCommit.from_dict(data)
+
+        assert commit.subject == "fix login bug"
+        assert commit.formatted_message.startswith("fix(")
+
     def test_from_dict_breaking_change(self):
         """Test creating GeneratedCommit with breaking change."""
         data = {
@@ -117,7 +140,8 @@ class TestCommitGenerator:
         generator = CommitGenerator(config)
 
         assert generator.config == config
-        mock_openai.assert_called_once_with(api_key="test_key")
+        mock_openai.assert_called_once()
+        assert mock_openai.call_args.kwargs["api_key"] == "test_key"
 
     def test_init_without_api_key(self):
         """Test initialization without API key raises error."""
@@ -130,17 +154,14 @@ class TestCommitGenerator:
     def test_generate_commit_message(self, mock_openai):
         """Test generating commit message."""
         # Setup mock response
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(message=Mock(content=json.dumps({
-                "type": "feat",
-                "scope": "api",
-                "subject": "add new endpoint",
-                "body": None,
-                "breaking": False,
-                "breaking_description": None,
-            })))
-        ]
+        mock_response = make_stream_response(json.dumps({
+            "type": "feat",
+            "scope": "api",
+            "subject": "add new endpoint",
+            "body": None,
+            "breaking": False,
+            "breaking_description": None,
+        }))
         mock_openai.return_value.chat.completions.create.return_value = mock_response
 
         config = CommitConfig(
@@ -161,17 +182,14 @@ class TestCommitGenerator:
     @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
     def test_generate_commit_message_with_context(self, mock_openai):
         """Test generating commit message with additional context."""
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(message=Mock(content=json.dumps({
-                "type": "fix",
-                "scope": "auth",
-                "subject": "handle edge case",
-                "body": None,
-                "breaking": False,
-                "breaking_description": None,
-            })))
-        ]
+        mock_response = make_stream_response(json.dumps({
+            "type": "fix",
+            "scope": "auth",
+            "subject": "handle edge case",
+            "body": None,
+            "breaking": False,
+            "breaking_description": None,
+        }))
         mock_openai.return_value.chat.completions.create.return_value = mock_response
 
         config = CommitConfig(
@@ -196,17 +214,14 @@ class TestCommitGenerator:
     @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
     def test_generate_commit_message_truncates_long_diff(self, mock_openai):
         """Test that long diffs are truncated."""
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(message=Mock(content=json.dumps({
-                "type": "feat",
-                "scope": None,
-                "subject": "update code",
-                "body": None,
-                "breaking": False,
-                "breaking_description": None,
-            })))
-        ]
+        mock_response = make_stream_response(json.dumps({
+            "type": "feat",
+            "scope": None,
+            "subject": "update code",
+            "body": None,
+            "breaking": False,
+            "breaking_description": None,
+        }))
         mock_openai.return_value.chat.completions.create.return_value = mock_response
 
         config = CommitConfig(openai_api_key="test_key")
@@ -226,8 +241,7 @@ class TestCommitGenerator:
     @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
     def test_generate_commit_message_empty_response(self, mock_openai):
         """Test handling empty API response."""
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content=None))]
+        mock_response = make_stream_response(None)
         mock_openai.return_value.chat.completions.create.return_value = mock_response
 
         config = CommitConfig(openai_api_key="test_key")
@@ -242,8 +256,7 @@ class TestCommitGenerator:
     @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
     def test_generate_commit_message_invalid_json(self, mock_openai):
         """Test handling invalid JSON response."""
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content="not valid json"))]
+        mock_response = make_stream_response("not valid json")
         mock_openai.return_value.chat.completions.create.return_value = mock_response
 
         config = CommitConfig(openai_api_key="test_key")
@@ -255,6 +268,398 @@ class TestCommitGenerator:
                 file_paths=["test.py"],
             )
 
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_build_messages_reuses_system_message(self, mock_openai):
+        """Test that the system message is built once per generator."""
+        generator = CommitGenerator(CommitConfig(openai_api_key="test_key"))
+
+        first = generator._build_messages("+a", ["a.py"])
+        second = generator._build_messages("+b", ["b.py"])
+
+        assert first[0]["content"] is second[0]["content"]
+        assert "Examples:" in first[0]["content"]
+        assert first[1]["content"] != second[1]["content"]
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_build_messages_puts_stable_context_first(self, mock_openai):
+        """Test that shared context precedes per-call files and diff."""
+        generator = CommitGenerator(CommitConfig(openai_api_key="test_key"))
+        context = {"project_type": "github", "language": "Python"}
+
+        first = generator._build_messages("+a", ["a.py"], context)[1]["content"]
+        second = generator._build_messages("+b", ["b.py"], context)[1]["content"]
+
+        prefix = first[: first.index("Changed files:")]
+        assert "Primary language: Python" in prefix
+        assert second.startswith(prefix)
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_commit_message_stops_stream_when_complete(self, mock_openai):
+        """Test that the stream is closed once the JSON object is complete."""
+        chunks = make_stream_response(json.dumps({"type": "feat", "subject": "add stream"}))
+        trailing = Mock()
+        remaining = iter(chunks + [trailing])
+        stream = MagicMock()
+        stream.__iter__.return_value = remaining
+        mock_openai.return_value.chat.completions.create.return_value = stream
+
+        config = CommitConfig(openai_api_key="test_key")
+        generator = CommitGenerator(config)
+        commit = generator.generate_commit_message("+test", ["test.py"])
+
+        assert commit.subject == "add stream"
+        assert mock_openai.return_value.chat.completions.create.call_args.kwargs["stream"] is True
+        stream.close.assert_called_once()
+        assert next(remaining) is trailing
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_commit_message_without_streaming(self, mock_openai):
+        """Test generating a commit message with streaming disabled."""
+        mock_response = Mock()
+        mock_response.choices = [
+            Mock(message=Mock(content=json.dumps({"type": "docs", "subject": "add guide"})))
+        ]
+        mock_openai.return_value.chat.completions.create.return_value = mock_response
+
+        config = CommitConfig(openai_api_key="test_key", openai_stream=False)
+        generator = CommitGenerator(config)
+        commit = generator.generate_commit_message("+test", ["docs/guide.md"])
+
+        assert commit.type == CommitType.DOCS
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_commit_message_uses_cache_at_zero_temperature(self, mock_openai):
+        """Test that identical deterministic requests are served from cache."""
+        mock_response = make_stream_response(json.dumps({"type": "feat", "subject": "add cache"}))
+        mock_openai.return_value.chat.completions.create.return_value = mock_response
+
+        config = CommitConfig(openai_api_key="test_key", openai_temperature=0.0)
+        generator = CommitGenerator(config)
+
+        first = generator.generate_commit_message("+test", ["test.py"])
+        second = generator.generate_commit_message("+test", ["test.py"])
+
+        assert first.formatted_message == second.formatted_message
+        assert mock_openai.return_value.chat.completions.create.call_count == 1
+        assert generator.cache.stats()["hits"] == 1
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_commit_message_regenerate_bypasses_cache(self, mock_openai):
+        """Test that use_cache=False asks the API again and keeps the new answer."""
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = [
+            make_stream_response(json.dumps({"type": "feat", "subject": "add cache"})),
+            make_stream_response(json.dumps({"type": "feat", "subject": "add response cache"})),
+        ]
+
+        config = CommitConfig(openai_api_key="test_key", openai_temperature=0.0)
+        generator = CommitGenerator(config)
+
+        generator.generate_commit_message("+test", ["test.py"])
+        regenerated = generator.generate_commit_message("+test", ["test.py"], use_cache=False)
+
+        assert regenerated.subject == "add response cache"
+        assert create.call_count == 2
+        assert generator.generate_commit_message("+test", ["test.py"]).subject == (
+            "add response cache"
+        )
+
+    @patch("sonar_jacoco_analyzer.commit_generator.time.sleep")
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_commit_message_retries_rate_limit(self, mock_openai, mock_sleep):
+        """Test that rate-limit errors are retried with backoff."""
+        mock_response = make_stream_response(json.dumps({"type": "fix", "subject": "handle retry"}))
+        rate_limited = openai.RateLimitError(
+            "rate limited",
+            response=Mock(status_code=429, headers={"retry-after": "2"}),
+            body=None,
+        )
+        mock_openai.return_value.chat.completions.create.side_effect = [
+            rate_limited,
+            mock_response,
+        ]
+
+        config = CommitConfig(openai_api_key="test_key")
+        generator = CommitGenerator(config)
+        commit = generator.generate_commit_message(
+            diff_content="+test",
+            file_paths=["test.py"],
+        )
+
+        assert commit.type == CommitType.FIX
+        assert mock_openai.return_value.chat.completions.create.call_count == 2
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] >= 2
+
+    @patch("sonar_jacoco_analyzer.commit_generator.time.sleep")
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_commit_message_retries_exhausted(self, mock_openai, mock_sleep):
+        """Test that persistent connection errors surface as APIError."""
+        mock_openai.return_value.chat.completions.create.side_effect = (
+            openai.APIConnectionError(request=Mock())
+        )
+
+        config = CommitConfig(openai_api_key="test_key")
+        generator = CommitGenerator(config)
+
+        with pytest.raises(APIError):
+            generator.generate_commit_message(
+                diff_content="+test",
+                file_paths=["test.py"],
+            )
+
+        assert (
+            mock_openai.return_value.chat.completions.create.call_count
+            == CommitGenerator.MAX_ATTEMPTS
+        )
+        assert mock_sleep.call_count == CommitGenerator.MAX_ATTEMPTS - 1
+
+
+    @patch("sonar_jacoco_analyzer.commit_generator.time.sleep")
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_split_commits_batch(self, mock_openai, mock_sleep):
+        """Test generating split commits through the Batch API."""
+        client = mock_openai.return_value
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="in_progress")
+        client.batches.retrieve.return_value = Mock(
+            id="batch-1", status="completed", output_file_id="file-out"
+        )
+        output_line = json.dumps({
+            "custom_id": "grp-0",
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": json.dumps({
+                    "type": "feat",
+                    "subject": "add endpoint",
+                })}}]},
+            },
+        })
+        client.files.content.return_value = Mock(text=output_line)
+
+        groups = [
+            SplitGroup(
+                name="source",
+                description="Source changes",
+                files=[FileChange("src/api.py", "M", 3, 1)],
+                category=FileCategory.SOURCE,
+                suggested_type=CommitType.FEAT,
+            ),
+            SplitGroup(
+                name="docs",
+                description="Docs changes",
+                files=[FileChange("README.md", "M", 3, 1)],
+                category=FileCategory.DOCS,
+                suggested_type=CommitType.DOCS,
+            ),
+            SplitGroup(
+                name="test",
+                description="Test changes",
+                files=[FileChange("tests/test_api.py", "M", 5, 0)],
+                category=FileCategory.TEST,
+                suggested_type=CommitType.TEST,
+            ),
+        ]
+
+        generator = CommitGenerator(CommitConfig(openai_api_key="test_key"))
+        commits = generator.generate_split_commits_batch(groups)
+
+        assert client.batches.create.call_args.kwargs["completion_window"] == "24h"
+        assert len(commits) == 3
+        assert commits[0].subject == "add endpoint"
+        # Trivial groups are not submitted, as in generate_split_commits
+        submitted = client.files.create.call_args.kwargs["file"][1].decode().splitlines()
+        assert [json.loads(line)["custom_id"] for line in submitted] == ["grp-0", "grp-2"]
+        assert commits[1].subject == "update documentation"
+        # Group missing from the output falls back to a basic message
+        assert commits[2].confidence == 0.5
+        mock_sleep.assert_called_once()
+
+    @pytest.mark.parametrize("cancel_error", [None, openai.OpenAIError("gone")])
+    @patch("sonar_jacoco_analyzer.commit_generator.time.sleep")
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_split_commits_batch_timeout_cancels(
+        self, mock_openai, mock_sleep, cancel_error
+    ):
+        """Test that a batch still running at the timeout is cancelled."""
+        client = mock_openai.return_value
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="in_progress")
+        client.batches.cancel.side_effect = cancel_error
+
+        groups = [
+            SplitGroup(
+                name="source",
+                description="Source changes",
+                files=[FileChange("src/api.py", "M", 3, 1)],
+                category=FileCategory.SOURCE,
+                suggested_type=CommitType.FEAT,
+            ),
+        ]
+
+        generator = CommitGenerator(CommitConfig(openai_api_key="test_key"))
+        with pytest.raises(APIError, match="did not complete"):
+            generator.generate_split_commits_batch(groups, timeout=-1)
+
+        client.batches.cancel.assert_called_once_with("batch-1")
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_split_commits_batch_all_trivial(self, mock_openai):
+        """Test that no batch is submitted when every group is trivial."""
+        groups = [
+            SplitGroup(
+                name="docs",
+                description="Docs changes",
+                files=[FileChange("README.md", "M", 3, 1)],
+                category=FileCategory.DOCS,
+                suggested_type=CommitType.DOCS,
+            ),
+        ]
+
+        generator = CommitGenerator(CommitConfig(openai_api_key="test_key"))
+        commits = generator.generate_split_commits_batch(groups)
+
+        assert commits == generator.generate_split_commits(groups)
+        mock_openai.return_value.files.create.assert_not_called()
+        mock_openai.return_value.batches.create.assert_not_called()
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_split_commits_deduplicates_identical_groups(self, mock_openai):
+        """Test that groups with identical prompts share one API call."""
+        mock_openai.return_value.chat.completions.create.return_value = make_stream_response(
+            json.dumps({"type": "docs", "subject": "update readme"})
+        )
+
+        groups = [
+            SplitGroup(
+                name="source",
+                description="Source changes",
+                files=[FileChange("src/api.py", "M", 3, 1)],
+                category=FileCategory.SOURCE,
+                suggested_type=CommitType.FEAT,
+            )
+            for _ in range(3)
+        ]
+
+        generator = CommitGenerator(CommitConfig(openai_api_key="test_key"))
+        commits = generator.generate_split_commits(groups)
+
+        assert len(commits) == 3
+        assert all(c.subject == "update readme" for c in commits)
+        assert mock_openai.return_value.chat.completions.create.call_count == 1
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_generate_split_commits_skips_api_for_trivial_groups(self, mock_openai):
+        """Test that small docs groups get a template message without an API call."""
+        groups = [
+            SplitGroup(
+                name="docs",
+                description="Docs changes",
+                files=[FileChange("README.md", "M", 3, 1)],
+                category=FileCategory.DOCS,
+                suggested_type=CommitType.DOCS,
+                total_additions=3,
+                total_deletions=1,
+            ),
+        ]
+
+        generator = CommitGenerator(CommitConfig(openai_api_key="test_key"))
+        commits = generator.generate_split_commits(groups)
+
+        assert commits[0].subject == "update documentation"
+        mock_openai.return_value.chat.completions.create.assert_not_called()
+
+
+class TestJsonHelpers:
+    """Tests for the JSON serialization helpers."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, use_orjson):
+        """Test JSON round-trip with and without orjson."""
+        data = {"type": "feat", "scope": None, "breaking": False}
+        orjson_module = commit_generator.orjson if use_orjson else None
+
+        with patch.object(commit_generator, "orjson", orjson_module):
+            assert commit_generator._json_loads(commit_generator._json_dumps(data)) == data
+            assert "\n  " in commit_generator._json_dumps(data, indent=True)
+            with pytest.raises(json.JSONDecodeError):
+                commit_generator._json_loads("not valid json")
+
+
+class TestHttpClient:
+    """Tests for the pooled HTTP client."""
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    @patch("sonar_jacoco_analyzer.commit_generator.DefaultHttpxClient")
+    def test_client_uses_pooled_http_client(self, mock_http_client, mock_openai):
+        """Test that the OpenAI client shares one HTTP client that is closed on exit."""
+        with patch.object(commit_generator, "_HTTP2_AVAILABLE", False):
+            with CommitGenerator(CommitConfig(openai_api_key="test_key")):
+                pass
+
+        assert mock_http_client.call_args.kwargs["http2"] is False
+        assert mock_openai.call_args.kwargs["http_client"] is mock_http_client.return_value
+        # Retries are handled by CommitGenerator alone
+        assert mock_openai.call_args.kwargs["max_retries"] == 0
+        mock_http_client.return_value.close.assert_called_once()
+
+
+class TestTruncateDiff:
+    """Tests for diff truncation."""
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_truncates_by_characters_without_tokenizer(self, mock_openai):
+        """Test the character limit fallback when tiktoken is unavailable."""
+        with patch.object(commit_generator, "_get_encoding", return_value=None):
+            generator = CommitGenerator(CommitConfig(openai_api_key="test_key"))
+
+        truncated = generator._truncate_diff("x" * 10000)
+
+        assert truncated == "x" * 8000 + "\n... (truncated)"
+        assert generator._truncate_diff("short") == "short"
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_truncates_at_token_budget(self, mock_openai):
+        """Test that diffs are cut at the remaining context window budget."""
+        # One token per whitespace-separated word
+        encoding = Mock()
+        encoding.encode.side_effect = lambda text, **kwargs: text.split()
+        encoding.decode.side_effect = " ".join
+
+        config = CommitConfig(
+            openai_api_key="test_key", openai_context_window=2000, openai_max_tokens=100
+        )
+        with patch.object(commit_generator, "_get_encoding", return_value=encoding):
+            generator = CommitGenerator(config)
+
+        budget = 2000 - generator._sys_tokens - 512 - 100
+        truncated = generator._truncate_diff("word " * 5000)
+
+        assert truncated.split("\n")[0].split() == ["word"] * budget
+        assert truncated.endswith("\n... (truncated)")
+
+    @patch("sonar_jacoco_analyzer.commit_generator.OpenAI")
+    def test_multibyte_diff_under_budget_in_characters_is_tokenized(self, mock_openai):
+        """Test that a diff shorter than the budget in characters is still counted."""
+        # Worst case for byte-level BPE: one token per UTF-8 byte
+        encoding = Mock()
+        encoding.encode.side_effect = lambda text, **kwargs: list(text.encode("utf-8"))
+        encoding.decode.side_effect = lambda tokens: bytes(tokens).decode("utf-8", "ignore")
+
+        config = CommitConfig(
+            openai_api_key="test_key", openai_context_window=20000, openai_max_tokens=100
+        )
+        with patch.object(commit_generator, "_get_encoding", return_value=encoding):
+            generator = CommitGenerator(config)
+
+        budget = 20000 - generator._sys_tokens - 512 - 100
+        # Three bytes per character, so this is under budget in characters only
+        diff = "\u65e5" * (budget // 2)
+        truncated = generator._truncate_diff(diff)
+
+        assert truncated == "\u65e5" * (budget // 3) + "\n... (truncated)"
+        assert generator._truncate_diff("\u65e5" * (budget // 3)) == "\u65e5" * (budget // 3)
+
 
 class TestValidateConventionalCommit:
     """Tests for validate_conventional_commit function."""
@@ -3,7 +3,9 @@ Tests for the commit splitter module.
 """
 
 import pytest
+from unittest.mock import patch
 
+from sonar_jacoco_analyzer import commit_splitter
 from sonar_jacoco_analyzer.commit_splitter import (
     CommitSplitter,
     FileCategorizer,
@@ -113,6 +115,28 @@ class TestFileCategorizer:
             category = FileCategorizer.categorize(path)
             assert category == FileCategory.STYLE, f"Failed for {path}"
 
+    @pytest.mark.parametrize("use_hyperscan", [True, False])
+    def test_categorize_batch_matches_categorize(self, use_hyperscan):
+        """Test that batch categorization agrees with single-file categorization."""
+        if use_hyperscan and commit_splitter.hyperscan is None:
+            pytest.skip("hyperscan is not installed")
+
+        paths = [
+            "tests/test_api.py",
+            "README.md",
+            "config.json",
+            "Dockerfile",
+            "styles.css",
+            "src/app.py",
+            "bin/run",
+        ]
+
+        hyperscan_module = commit_splitter.hyperscan if use_hyperscan else None
+        with patch.object(commit_splitter, "hyperscan", hyperscan_module):
+            categories = FileCategorizer.categorize_batch(paths)
+
+        assert categories == [FileCategorizer.categorize(p) for p in paths]
+
 
 class TestComponentDetector:
     """Tests for ComponentDetector class."""
@@ -293,6 +317,40 @@ class TestCommitSplitter:
         assert proposal.should_split is True
         assert len(proposal.groups) >= 2
 
+    def test_analyze_categorizes_files_once(self):
+        """Test that files are categorized once per analysis."""
+        splitter = CommitSplitter(max_commit_size=10, complexity_threshold=50)
+
+        files = [
+            FileChange("src/app.py", "M", 20, 10, False),
+            FileChange("tests/test_app.py", "M", 20, 10, False),
+        ]
+        staged = StagedChanges(
+            files=files,
+            total_additions=40,
+            total_deletions=20,
+            total_files=2,
+            diff_content="",
+        )
+        metrics = ChangeMetrics(
+            total_lines_changed=60,
+            total_files=2,
+            files_added=0,
+            files_modified=2,
+            files_deleted=0,
+            files_renamed=0,
+            directories_affected=2,
+            complexity_score=10,
+        )
+
+        with patch.object(
+            FileCategorizer, "categorize_batch", wraps=FileCategorizer.categorize_batch
+        ) as mock_batch:
+            proposal = splitter.analyze(staged, metrics)
+
+        assert proposal.should_split is True
+        mock_batch.assert_called_once()
+
     def test_should_split_mixed_categories(self):
         """Test that mixed categories suggest split."""
         splitter = CommitSplitter(max_commit_size=500, complexity_threshold=100)
@@ -2,6 +2,8 @@
 Tests for the conventional commit module.
 """
 
+import re
+
 import pytest
 
 from sonar_jacoco_analyzer.conventional_commit import (
@@ -41,6 +43,10 @@ class TestCommitType:
         assert "fix" in all_types
         assert len(all_types) == 11
 
+    def test_commit_type_all_types_set(self):
+        """Test the set of type names matches all_types."""
+        assert CommitType.all_types_set() == frozenset(CommitType.all_types())
+
     def test_commit_type_properties(self):
         """Test CommitType properties."""
         feat = CommitType.FEAT
@@ -193,6 +199,17 @@ Includes login, logout, and refresh endpoints."""
         assert commit.body is not None
         assert "JWT-based" in commit.body
 
+    def test_parse_crlf_line_endings(self):
+        """Test parsing a message with Windows line endings."""
+        message = "fix(api): handle timeouts\r\n\r\nRetry failed requests.\r\nLog each retry.\r\n\r\nCloses #12"
+
+        commit = ConventionalCommitParser.parse(message)
+
+        assert commit is not None
+        assert commit.subject == "handle timeouts"
+        assert commit.body == "Retry failed requests.\nLog each retry."
+        assert commit.footer == "Closes #12"
+
     def test_parse_invalid_type(self):
         """Test parsing invalid commit type."""
         commit = ConventionalCommitParser.parse("invalid: some message")
@@ -231,6 +248,31 @@ class TestCommitMessageFormatter:
         assert "- First item" in formatted
         assert "- Second item" in formatted
 
+    def test_format_body_wraps_long_lines(self):
+        """Test that long body lines wrap at 72 characters without splitting words."""
+        body = " ".join(["Introduce"] * 20) + " " + "x" * 80
+        formatted = CommitMessageFormatter.format_body(body)
+        lines = formatted.split("\n")
+        assert all(len(line) <= 72 for line in lines[:-1])
+        assert lines[-1] == "x" * 80
+        assert " ".join(lines) == body
+
+    @pytest.mark.parametrize(
+        "separator",
+        [
+            pytest.param("\t", id="tab"),
+            pytest.param("   ", id="space-run"),
+            pytest.param(" \t ", id="mixed"),
+            pytest.param("\u00a0", id="no-break-space"),
+        ],
+    )
+    def test_format_body_wrap_collapses_whitespace(self, separator):
+        """Test that wrapped lines join words with single spaces, dropping indentation."""
+        body = "\t" + separator.join(["word"] * 30) + " "
+        formatted = CommitMessageFormatter.format_body(body)
+        lines = formatted.split("\n")
+        assert lines == [" ".join(["word"] * 14), " ".join(["word"] * 14), "word word"]
+
     def test_format_bullet_list(self):
         """Test formatting bullet list."""
         items = ["First item", "Second item", "Third item"]
@@ -292,6 +334,28 @@ class TestScopeExtractor:
 class TestCommitTypeDetector:
     """Tests for CommitTypeDetector."""
 
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "README.md",
+            "tests/test_api.py",
+            "src/Component.test.tsx",
+            ".github/workflows/ci.yml",
+            "Dockerfile",
+            "styles/main.SCSS",
+            ".eslintrc.json",
+            "src/app.py",
+        ],
+    )
+    def test_compiled_type_patterns_match_pattern_lists(self, path):
+        """Test that each type's alternation matches exactly when one of its patterns does."""
+        for commit_type, regex in CommitTypeDetector._COMPILED_TYPE_PATTERNS:
+            expected = any(
+                re.search(p, path, re.IGNORECASE)
+                for p in CommitTypeDetector.TYPE_PATTERNS[commit_type]
+            )
+            assert bool(regex.search(path)) == expected
+
     def test_detect_type_docs(self):
         """Test detecting docs commit type."""
         paths = ["README.md", "docs/guide.md"]
@@ -323,6 +387,31 @@ class TestCommitTypeDetector:
         commit_type = CommitTypeDetector.detect_type(paths, diff_content)
         assert commit_type == CommitType.FIX
 
+    def test_detect_type_diff_keyword_priority(self):
+        """Test that fix keywords win over earlier keywords of other types."""
+        paths = ["src/app.py"]
+        diff_content = "Add caching for lookups\nHandle timeout error"
+        commit_type = CommitTypeDetector.detect_type(paths, diff_content)
+        assert commit_type == CommitType.FIX
+
+    def test_detect_type_diff_keywords_ignore_case(self):
+        """Test that diff keywords match regardless of case."""
+        commit_type = CommitTypeDetector.detect_type(["src/app.py"], "OPTIMIZE Query Planner")
+        assert commit_type == CommitType.PERF
+
+    @pytest.mark.parametrize(
+        "diff_content",
+        [
+            pytest.param("+ improve \u017fpeed", id="long-s"),
+            pytest.param("+ \u0131ssue here", id="dotless-i"),
+            pytest.param("+ \u0130ssue here", id="dotted-capital-i"),
+        ],
+    )
+    def test_detect_type_diff_non_ascii_case_folding(self, diff_content):
+        """Test that letters case-folding to ASCII do not spell keywords, as with str.lower."""
+        commit_type = CommitTypeDetector.detect_type(["a.py"], diff_content)
+        assert commit_type == CommitType.FEAT
+
     def test_detect_type_empty_paths(self):
         """Test detecting type with empty paths."""
         commit_type = CommitTypeDetector.detect_type([])
@@ -2,17 +2,15 @@
 Tests for the git operations module.
 """
 
-import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import tempfile
+from unittest.mock import Mock, PropertyMock, patch
+
+from git import InvalidGitRepositoryError, Repo
 
 from sonar_jacoco_analyzer.git_operations import (
     GitOperations,
-    GitOperationsError,
     NotAGitRepositoryError,
     NoStagedChangesError,
-    CommitError,
     FileChange,
     StagedChanges,
     ChangeMetrics,
@@ -20,341 +18,506 @@ from sonar_jacoco_analyzer.git_operations import (
 )
 
 
-class TestFileChange:
-    """Tests for FileChange dataclass."""
-
-    def test_file_change_creation(self):
-        """Test creating a FileChange object."""
-        change = FileChange(
-            file_path="src/test.py",
-            status="M",
-            additions=10,
-            deletions=5,
-            is_binary=False,
-        )
-
-        assert change.file_path == "src/test.py"
-        assert change.status == "M"
-        assert change.additions == 10
-        assert change.deletions == 5
-        assert change.is_binary is False
-
-    def test_file_change_with_rename(self):
-        """Test FileChange with rename."""
-        change = FileChange(
-            file_path="src/new_name.py",
-            status="R",
-            additions=0,
-            deletions=0,
-            old_path="src/old_name.py",
-        )
-
-        assert change.status == "R"
-        assert change.old_path == "src/old_name.py"
-
-
-class TestStagedChanges:
-    """Tests for StagedChanges dataclass."""
-
-    def test_staged_changes_not_empty(self):
-        """Test StagedChanges with files."""
-        changes = StagedChanges(
-            files=[
-                FileChange("test.py", "M", 10, 5, False),
-            ],
-            total_additions=10,
-            total_deletions=5,
-            total_files=1,
-            diff_content="diff content",
-        )
-
-        assert changes.is_empty is False
-        assert changes.total_files == 1
-
-    def test_staged_changes_empty(self):
-        """Test empty StagedChanges."""
-        changes = StagedChanges(
-            files=[],
-            total_additions=0,
-            total_deletions=0,
-            total_files=0,
-            diff_content="",
-        )
-
-        assert changes.is_empty is True
-
-
-class TestChangeMetrics:
-    """Tests for ChangeMetrics dataclass."""
-
-    def test_change_metrics_creation(self):
-        """Test creating ChangeMetrics."""
-        metrics = ChangeMetrics(
-            total_lines_changed=100,
-            total_files=5,
-            files_added=2,
-            files_modified=2,
-            files_deleted=1,
-            files_renamed=0,
-            directories_affected=3,
-            file_types={".py": 3, ".js": 2},
-            complexity_score=25,
-        )
-
-        assert metrics.total_lines_changed == 100
-        assert metrics.total_files == 5
-        assert metrics.complexity_score == 25
-
-
-class TestCommitResult:
-    """Tests for CommitResult dataclass."""
-
-    def test_successful_commit_result(self):
-        """Test successful commit result."""
-        result = CommitResult(
-            success=True,
-            sha="abc123",
-            message="Test commit",
-        )
-
-        assert result.success is True
-        assert result.sha == "abc123"
-        assert result.error is None
-
-    def test_failed_commit_result(self):
-        """Test failed commit result."""
-        result = CommitResult(
-            success=False,
-            sha=None,
-            message="Test commit",
-            error="No staged changes",
-        )
-
-        assert result.success is False
-        assert result.sha is None
-        assert result.error == "No staged changes"
+class TestDataclasses:
+    """Tests for the git operations dataclasses."""
+
+    @pytest.mark.parametrize(
+        "cls, kwargs, expected",
+        [
+            pytest.param(
+                FileChange,
+                {
+                    "file_path": "src/test.py",
+                    "status": "M",
+                    "additions": 10,
+                    "deletions": 5,
+                    "is_binary": False,
+                },
+                {
+                    "file_path": "src/test.py",
+                    "status": "M",
+                    "additions": 10,
+                    "deletions": 5,
+                    "is_binary": False,
+                },
+                id="file_change",
+            ),
+            pytest.param(
+                FileChange,
+                {
+                    "file_path": "src/new_name.py",
+                    "status": "R",
+                    "additions": 0,
+                    "deletions": 0,
+                    "old_path": "src/old_name.py",
+                },
+                {"status": "R", "old_path": "src/old_name.py"},
+                id="file_change_rename",
+            ),
+            pytest.param(
+                StagedChanges,
+                {
+                    "files": [FileChange("test.py", "M", 10, 5, False)],
+                    "total_additions": 10,
+                    "total_deletions": 5,
+                    "total_files": 1,
+                    "diff_content": "diff content",
+                },
+                {"is_empty": False, "total_files": 1},
+                id="staged_changes",
+            ),
+            pytest.param(
+                StagedChanges,
+                {
+                    "files": [],
+                    "total_additions": 0,
+                    "total_deletions": 0,
+                    "total_files": 0,
+                    "diff_content": "",
+                },
+                {"is_empty": True},
+                id="staged_changes_empty",
+            ),
+            pytest.param(
+                ChangeMetrics,
+                {
+                    "total_lines_changed": 100,
+                    "total_files": 5,
+                    "files_added": 2,
+                    "files_modified": 2,
+                    "files_deleted": 1,
+                    "files_renamed": 0,
+                    "directories_affected": 3,
+                    "file_types": {".py": 3, ".js": 2},
+                    "complexity_score": 25,
+                },
+                {"total_lines_changed": 100, "total_files": 5, "complexity_score": 25},
+                id="change_metrics",
+            ),
+            pytest.param(
+                CommitResult,
+                {"success": True, "sha": "abc123", "message": "Test commit"},
+                {"success": True, "sha": "abc123", "error": None},
+                id="commit_result",
+            ),
+            pytest.param(
+                CommitResult,
+                {
+                    "success": False,
+                    "sha": None,
+                    "message": "Test commit",
+                    "error": "No staged changes",
+                },
+                {"success": False, "sha": None, "error": "No staged changes"},
+                id="commit_result_failed",
+            ),
+        ],
+    )
+    def test_creation(self, cls, kwargs, expected):
+        """Test constructing each dataclass and reading back its attributes."""
+        obj = cls(**kwargs)
+
+        for name, value in expected.items():
+            assert getattr(obj, name) == value
+            assert type(getattr(obj, name)) is type(value)
+
+
+# `git diff --cached --raw --numstat -z` output for one modified file
+_SINGLE_FILE_RAW_NUMSTAT = ":100644 100644 abc1234 def5678 M\0src/test.py\0" "2\t1\tsrc/test.py\0"
+
+# Attribute names for spec'd mock repositories; computed once, since passing
+# the class itself as spec makes Mock call dir() on it for every instance
+_REPO_ATTRIBUTES = dir(Repo)
+
+
+@pytest.fixture(scope="module")
+def _patched_repo_class():
+    """Patch git.Repo once for every GitOperations test in the module."""
+    with patch("sonar_jacoco_analyzer.git_operations.Repo") as repo_class:
+        yield repo_class
+
+
+@pytest.fixture
+def repo_class(_patched_repo_class):
+    """The patched Repo class, reset for each test."""
+    _patched_repo_class.reset_mock(return_value=True, side_effect=True)
+    return _patched_repo_class
+
+
+@pytest.fixture
+def make_git_ops(repo_class):
+    """Factory building GitOperations over a fresh mock repository."""
+    def _make(working_dir="/path/to/repo"):
+        mock_repo = Mock(spec=_REPO_ATTRIBUTES)
+        mock_repo.working_dir = working_dir
+        repo_class.return_value = mock_repo
+        return GitOperations(working_dir), mock_repo
+
+    return _make
 
 
 class TestGitOperations:
     """Tests for GitOperations class."""
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_init_valid_repo(self, mock_repo_class):
+    def test_init_valid_repo(self, repo_class, make_git_ops):
         """Test initializing with valid git repository."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-        mock_repo_class.return_value = mock_repo
-
-        git_ops = GitOperations("/path/to/repo")
+        git_ops, _ = make_git_ops()
 
         assert git_ops.repo_path == "/path/to/repo"
-        mock_repo_class.assert_called_once()
+        repo_class.assert_called_once()
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_init_invalid_repo(self, mock_repo_class):
+    def test_init_invalid_repo(self, repo_class):
         """Test initializing with invalid git repository."""
-        from git import InvalidGitRepositoryError as GitInvalidRepo
-        mock_repo_class.side_effect = GitInvalidRepo("Not a git repo")
+        repo_class.side_effect = InvalidGitRepositoryError("Not a git repo")
 
         with pytest.raises(NotAGitRepositoryError):
             GitOperations("/not/a/repo")
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_get_current_branch(self, mock_repo_class):
+    def test_get_current_branch(self, make_git_ops):
         """Test getting current branch name."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
+        git_ops, mock_repo = make_git_ops()
         mock_repo.active_branch.name = "feature-branch"
-        mock_repo_class.return_value = mock_repo
 
-        git_ops = GitOperations("/path/to/repo")
         branch = git_ops.get_current_branch()
 
         assert branch == "feature-branch"
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_get_current_branch_detached(self, mock_repo_class):
+    def test_get_current_branch_detached(self, make_git_ops):
         """Test getting current branch when HEAD is detached."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-        mock_repo.active_branch.name = property(lambda self: (_ for _ in ()).throw(TypeError()))
-        type(mock_repo).active_branch = property(lambda self: Mock(side_effect=TypeError()))
-        mock_repo_class.return_value = mock_repo
-
-        git_ops = GitOperations("/path/to/repo")
-        # Since active_branch raises TypeError, should return detached indicator
-        try:
-            branch = git_ops.get_current_branch()
-        except TypeError:
-            branch = "HEAD (detached)"
-
-        assert "HEAD" in branch or "detached" in branch.lower() or isinstance(branch, str)
-
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_get_remote_url(self, mock_repo_class):
+        git_ops, mock_repo = make_git_ops()
+        # GitPython raises TypeError from active_branch on a detached HEAD
+        type(mock_repo).active_branch = PropertyMock(side_effect=TypeError())
+
+        assert git_ops.get_current_branch() == "HEAD (detached)"
+
+    def test_get_remote_url(self, make_git_ops):
         """Test getting remote URL."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-        mock_remote = Mock()
-        mock_remote.url = "https://github.com/user/repo.git"
-        mock_repo.remotes = {"origin": mock_remote}
-        mock_repo_class.return_value = mock_repo
-
-        git_ops = GitOperations("/path/to/repo")
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.config_reader.return_value.get_value.return_value = "https://github.com/user/repo.git"
+
         url = git_ops.get_remote_url()
 
         assert url == "https://github.com/user/repo.git"
+        mock_repo.config_reader.return_value.get_value.assert_called_once_with(
+            'remote "origin"', "url", None
+        )
+
+        # The URL is read from the config only once
+        assert git_ops.get_remote_url() == url
+        mock_repo.config_reader.assert_called_once()
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_get_remote_url_no_origin(self, mock_repo_class):
+    def test_get_remote_url_no_origin(self, make_git_ops):
         """Test getting remote URL when no origin exists."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-        mock_repo.remotes = {}
-        mock_repo_class.return_value = mock_repo
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.config_reader.return_value.get_value.return_value = None
 
-        git_ops = GitOperations("/path/to/repo")
         url = git_ops.get_remote_url()
 
         assert url is None
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_has_uncommitted_changes(self, mock_repo_class):
+    def test_has_uncommitted_changes(self, make_git_ops):
         """Test checking for uncommitted changes."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-        mock_repo.is_dirty.return_value = True
-        mock_repo_class.return_value = mock_repo
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.git.status.return_value.stdout.read.return_value = b" "
 
-        git_ops = GitOperations("/path/to/repo")
         has_changes = git_ops.has_uncommitted_changes()
 
         assert has_changes is True
-        mock_repo.is_dirty.assert_called_once_with(untracked_files=True)
+        mock_repo.git.status.assert_called_once_with(
+            "--porcelain", "-z", "--untracked-files=normal", as_process=True
+        )
+        mock_repo.git.status.return_value.stdout.read.assert_called_once_with(1)
+
+    def test_has_uncommitted_changes_clean(self, make_git_ops):
+        """Test a clean working tree produces no status output."""
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.git.status.return_value.stdout.read.return_value = b""
+
+        assert git_ops.has_uncommitted_changes() is False
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_get_untracked_files(self, mock_repo_class):
+    def test_get_untracked_files(self, make_git_ops):
         """Test getting untracked files."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-        mock_repo.untracked_files = ["new_file.py", "another.txt"]
-        mock_repo_class.return_value = mock_repo
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.git.status.return_value = "? new_file.py\0? another.txt\0"
 
-        git_ops = GitOperations("/path/to/repo")
         untracked = git_ops.get_untracked_files()
 
         assert len(untracked) == 2
         assert "new_file.py" in untracked
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_get_repo_name_from_remote(self, mock_repo_class):
-        """Test getting repo name from remote URL."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-        mock_remote = Mock()
-        mock_remote.url = "https://github.com/user/myrepo.git"
-        mock_repo.remotes = {"origin": mock_remote}
-        mock_repo_class.return_value = mock_repo
-
-        git_ops = GitOperations("/path/to/repo")
-        name = git_ops.get_repo_name()
-
-        assert name == "user/myrepo"
-
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_get_repo_name_ssh_format(self, mock_repo_class):
-        """Test getting repo name from SSH remote URL."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-        mock_remote = Mock()
-        mock_remote.url = "git@github.com:user/myrepo.git"
-        mock_repo.remotes = {"origin": mock_remote}
-        mock_repo_class.return_value = mock_repo
-
-        git_ops = GitOperations("/path/to/repo")
-        name = git_ops.get_repo_name()
-
-        assert name == "user/myrepo"
-
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_get_repo_name_fallback(self, mock_repo_class):
-        """Test getting repo name falls back to directory name."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/my-project"
-        mock_repo.remotes = {}
-        mock_repo_class.return_value = mock_repo
-
-        git_ops = GitOperations("/path/to/my-project")
-        name = git_ops.get_repo_name()
-
-        assert name == "my-project"
-
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_analyze_change_complexity(self, mock_repo_class):
+    def test_get_working_tree_changes(self, make_git_ops):
+        """Test parsing unstaged and untracked files from porcelain v2 status."""
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.git.status.return_value = (
+            "1 .M N... 100644 100644 100644 abc1234 abc1234 src/modified file.py\0"
+            "1 M. N... 100644 100644 100644 abc1234 def5678 src/staged.py\0"
+            "1 .D N... 100644 100644 000000 abc1234 abc1234 gone.py\0"
+            "2 RM N... 100644 100644 100644 abc1234 abc1234 R100 new.py\0old.py\0"
+            "u UU N... 100644 100644 100644 100644 a1 b2 c3 conflict.py\0"
+            "? notes.txt\0"
+        )
+
+        unstaged, untracked = git_ops.get_working_tree_changes()
+
+        assert unstaged == ["src/modified file.py", "gone.py", "new.py", "conflict.py"]
+        assert untracked == ["notes.txt"]
+        mock_repo.git.status.assert_called_once_with(
+            "--porcelain=v2", "-z", "--untracked-files=all"
+        )
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://github.com/user/myrepo.git", "user/myrepo"),
+            ("git@github.com:user/myrepo.git", "user/myrepo"),
+            (None, "my-project"),
+        ],
+        ids=["https", "ssh", "no_origin_fallback"],
+    )
+    def test_get_repo_name(self, make_git_ops, url, expected):
+        """Test getting repo name from the origin URL in the git config."""
+        git_ops, mock_repo = make_git_ops("/path/to/my-project")
+        mock_repo.config_reader.return_value.get_value.return_value = url
+
+        assert git_ops.get_repo_name() == expected
+
+    @pytest.mark.parametrize(
+        "lines, files, dirs, types, expected",
+        [
+            (50, 2, 2, 1, 0),
+            (51, 3, 3, 2, 20),
+            (101, 6, 6, 4, 45),
+            (500, 20, 10, 5, 70),
+            (501, 21, 11, 6, 115),
+        ],
+    )
+    def test_calculate_complexity_score_thresholds(
+        self, make_git_ops, lines, files, dirs, types, expected
+    ):
+        """Test complexity score contributions at the threshold boundaries."""
+        git_ops, _ = make_git_ops()
+        assert git_ops._calculate_complexity_score(lines, files, dirs, types) == expected
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://github.com/user/myrepo.git", "user/myrepo"),
+            ("https://github.com/user/myrepo", "user/myrepo"),
+            ("git@github.com:user/myrepo.git", "user/myrepo"),
+            ("ssh://git@host:22/user/myrepo.git", "user/myrepo"),
+            ("https://github.com/user/myrepo/", "my-project"),
+        ],
+    )
+    def test_get_repo_name_url_formats(self, make_git_ops, url, expected):
+        """Test extracting owner/name from HTTPS and SSH remote URLs."""
+        git_ops, _ = make_git_ops("/path/to/my-project")
+        with patch.object(GitOperations, "get_remote_url", return_value=url):
+            assert git_ops.get_repo_name() == expected
+
+    def test_analyze_change_complexity(self, make_git_ops):
         """Test complexity analysis calculation."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-
-        # Mock staged changes
-        mock_diff_item = Mock()
-        mock_diff_item.new_file = False
-        mock_diff_item.deleted_file = False
-        mock_diff_item.renamed = False
-        mock_diff_item.b_path = "src/test.py"
-        mock_diff_item.a_path = "src/test.py"
-        mock_diff_item.diff = b"+line1\n+line2\n-old line"
-        mock_diff_item.b_blob = None
-
-        mock_repo.index.diff.return_value = [mock_diff_item]
-        mock_repo.git.diff.return_value = "diff content"
-        mock_repo_class.return_value = mock_repo
-
-        git_ops = GitOperations("/path/to/repo")
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.index.path = "/path/to/repo/.git/index"
+
+        # Mock staged changes (raw + numstat output, then full diff content)
+        mock_repo.git.diff.side_effect = [
+            _SINGLE_FILE_RAW_NUMSTAT,
+            "diff content",
+        ]
+
         metrics = git_ops.analyze_change_complexity()
 
         assert isinstance(metrics, ChangeMetrics)
-        assert metrics.total_files >= 0
+        assert metrics.total_files == 1
+        assert metrics.total_lines_changed == 3
+        assert metrics.files_modified == 1
         assert metrics.complexity_score >= 0
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_create_commit_success(self, mock_repo_class):
+    def test_analyze_change_complexity_tallies(self, make_git_ops):
+        """Test status, directory and file type tallies across several files."""
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.index.path = "/path/to/repo/.git/index"
+        mock_repo.git.diff.return_value = (
+            ":000000 100644 0000000 b680253 A\0src/a.py\0"
+            ":100644 100644 887a9ef 01a97af M\0src/b.py\0"
+            ":100644 000000 587be6b 0000000 D\0docs/c.md\0"
+            ":100644 100644 887a9ef 01a97af M\0Makefile\0"
+            ":100644 100644 887a9ef 01a97af M\0src/.gitignore\0"
+            "1\t0\tsrc/a.py\0"
+            "1\t1\tsrc/b.py\0"
+            "0\t1\tdocs/c.md\0"
+            "1\t0\tMakefile\0"
+            "1\t0\tsrc/.gitignore\0"
+        )
+
+        metrics = git_ops.analyze_change_complexity()
+
+        assert metrics.files_added == 1
+        assert metrics.files_modified == 3
+        assert metrics.files_deleted == 1
+        assert metrics.files_renamed == 0
+        assert metrics.directories_affected == 2
+        assert metrics.file_types == {".py": 2, ".md": 1, "no_extension": 2}
+
+    def test_get_staged_changes_parses_raw_numstat(self, make_git_ops):
+        """Test parsing statuses, renames and binary files from one diff call."""
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.index.path = "/path/to/repo/.git/index"
+        mock_repo.git.diff.side_effect = [
+            ":000000 100644 0000000 b680253 A\0added.py\0"
+            ":100644 100644 887a9ef 01a97af M\0image.png\0"
+            ":100644 000000 587be6b 0000000 D\0gone.py\0"
+            ":100644 100644 0fdf397 0fdf397 R100\0old.txt\0new.txt\0"
+            "3\t0\tadded.py\0"
+            "-\t-\timage.png\0"
+            "0\t4\tgone.py\0"
+            "0\t0\t\0old.txt\0new.txt\0",
+            "diff content",
+        ]
+
+        staged = git_ops.get_staged_changes()
+
+        assert [(f.file_path, f.status) for f in staged.files] == [
+            ("added.py", "A"),
+            ("image.png", "M"),
+            ("gone.py", "D"),
+            ("new.txt", "R"),
+        ]
+        assert staged.files[1].is_binary is True
+        assert staged.files[3].old_path == "old.txt"
+        assert staged.total_additions == 3
+        assert staged.total_deletions == 4
+        # The full diff is only generated when it is read
+        assert mock_repo.git.diff.call_count == 1
+        assert staged.diff_content == "diff content"
+        assert mock_repo.git.diff.call_count == 2
+
+    def test_get_staged_changes_include_diff(self, make_git_ops):
+        """Test reading records and the patch from a single diff call."""
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.index.path = "/path/to/repo/.git/index"
+        mock_repo.git.diff.return_value = (
+            ":100644 100644 abc1234 def5678 M\0src/test.py\0"
+            "1\t0\tsrc/test.py\0"
+            "\0diff --git a/src/test.py b/src/test.py\n+new line"
+        )
+
+        staged = git_ops.get_staged_changes(include_diff=True)
+
+        assert [f.file_path for f in staged.files] == ["src/test.py"]
+        assert staged.total_additions == 1
+        assert staged.diff_content == "diff --git a/src/test.py b/src/test.py\n+new line"
+        mock_repo.git.diff.assert_called_once()
+
+    def test_get_staged_changes_with_paths(self, make_git_ops):
+        """Test limiting staged changes to a set of paths."""
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.index.path = "/path/to/repo/.git/index"
+        mock_repo.git.diff.side_effect = [
+            _SINGLE_FILE_RAW_NUMSTAT + ":100644 100644 abc1234 def5678 M\0README.md\0"
+            "1\t0\tREADME.md\0",
+            "diff content",
+        ]
+
+        staged = git_ops.get_staged_changes(paths=["src"])
+
+        assert [f.file_path for f in staged.files] == ["src/test.py"]
+        # The index is diffed as a whole and filtered afterwards
+        assert "--" not in mock_repo.git.diff.call_args.args
+        assert staged.diff_content == "diff content"
+        assert mock_repo.git.diff.call_args.args[-2:] == ("--", ":(literal)src/test.py")
+
+    @pytest.mark.parametrize("paths", [["new.txt"], ["old.txt"], ["*.txt"]])
+    def test_get_staged_changes_with_paths_keeps_renames(self, make_git_ops, paths):
+        """Test a rename matched by either side is still reported as a rename."""
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.index.path = "/path/to/repo/.git/index"
+        mock_repo.git.diff.side_effect = [
+            ":100644 100644 0fdf397 0fdf397 R100\0old.txt\0new.txt\0"
+            ":100644 100644 abc1234 def5678 M\0src/test.py\0"
+            "0\t0\t\0old.txt\0new.txt\0"
+            "2\t1\tsrc/test.py\0",
+            "diff content",
+        ]
+
+        staged = git_ops.get_staged_changes(include_diff=True, paths=paths)
+
+        assert [(f.file_path, f.status, f.old_path) for f in staged.files] == [
+            ("new.txt", "R", "old.txt")
+        ]
+        # Both sides are named so git can pair them in the patch
+        assert mock_repo.git.diff.call_args.args[-3:] == (
+            "--",
+            ":(literal)old.txt",
+            ":(literal)new.txt",
+        )
+
+    def test_get_staged_changes_cached_until_index_changes(self, make_git_ops, tmp_path):
+        """Test staged changes are reused until the index is modified."""
+        index_path = tmp_path / "index"
+        index_path.write_bytes(b"index")
+
+        git_ops, mock_repo = make_git_ops(str(tmp_path))
+        mock_repo.index.path = str(index_path)
+        mock_repo.head.commit.hexsha = "abc123"
+        mock_repo.git.diff.return_value = _SINGLE_FILE_RAW_NUMSTAT
+
+        first = git_ops.get_staged_changes()
+        assert git_ops.get_staged_changes() is first
+        assert mock_repo.git.diff.call_count == 1
+
+        # Staging through GitOperations drops the cached result
+        git_ops.stage_files(["src/test.py"])
+        assert git_ops.get_staged_changes() is not first
+        assert mock_repo.git.diff.call_count == 2
+
+        # So does an index written by another process
+        index_path.write_bytes(b"index changed")
+        git_ops.get_staged_changes()
+        assert mock_repo.git.diff.call_count == 3
+
+    def test_stage_and_unstage_files_in_batches(self, make_git_ops):
+        """Test staging many files splits the paths across git invocations."""
+        git_ops, mock_repo = make_git_ops()
+        files = [f"file{i}.py" for i in range(1200)]
+        git_ops.stage_files(files)
+        git_ops.unstage_files(files[:2])
+
+        add_calls = mock_repo.git.add.call_args_list
+        assert [len(c.args) - 1 for c in add_calls] == [500, 500, 200]
+        assert all(c.args[0] == "--" for c in add_calls)
+        mock_repo.git.reset.assert_called_once_with("-q", "--", "file0.py", "file1.py")
+
+    def test_create_commit_success(self, make_git_ops):
         """Test successful commit creation."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
-
-        # Mock staged changes (non-empty)
-        mock_diff_item = Mock()
-        mock_diff_item.b_path = "test.py"
-        mock_diff_item.a_path = "test.py"
-        mock_diff_item.new_file = False
-        mock_diff_item.deleted_file = False
-        mock_diff_item.renamed = False
-        mock_diff_item.diff = b"+new line"
-        mock_diff_item.b_blob = None
-
-        mock_repo.index.diff.return_value = [mock_diff_item]
-        mock_repo.git.diff.return_value = "diff content"
-
-        mock_commit = Mock()
-        mock_commit.hexsha = "abc123"
-        mock_repo.index.commit.return_value = mock_commit
-        mock_repo_class.return_value = mock_repo
-
-        git_ops = GitOperations("/path/to/repo")
+        git_ops, mock_repo = make_git_ops()
+
+        # Mock staged changes (non-empty): git diff --cached --quiet exits with 1
+        mock_repo.git.diff.return_value = (1, "", "")
+
+        mock_repo.head.commit.hexsha = "abc123"
+
         result = git_ops.create_commit("Test commit message")
 
         assert result.success is True
         assert result.sha == "abc123"
+        mock_repo.git.commit.assert_called_once_with(
+            "--cleanup=verbatim", "-m", "Test commit message"
+        )
+
+    def test_validate_staged_changes_empty(self, make_git_ops):
+        """Test validation fails when git diff --cached --quiet finds no changes."""
+        git_ops, mock_repo = make_git_ops()
+        mock_repo.git.diff.return_value = (0, "", "")
+
+        with pytest.raises(NoStagedChangesError):
+            git_ops.validate_staged_changes()
 
-    @patch("sonar_jacoco_analyzer.git_operations.Repo")
-    def test_show_last_commit(self, mock_repo_class):
+    def test_show_last_commit(self, make_git_ops):
         """Test showing last commit."""
-        mock_repo = Mock()
-        mock_repo.working_dir = "/path/to/repo"
+        git_ops, mock_repo = make_git_ops()
         mock_repo.git.log.return_value = "commit abc123\nAuthor: Test\nDate: 2024-01-01"
-        mock_repo_class.return_value = mock_repo
 
-        git_ops = GitOperations("/path/to/repo")
         log = git_ops.show_last_commit()
 
         assert "commit" in log.lower() or "abc123" in log
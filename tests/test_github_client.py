@@ -3,7 +3,7 @@ Tests for the GitHub client module.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from datetime import datetime
 
 from sonar_jacoco_analyzer.github_client import (
@@ -19,134 +19,198 @@ from sonar_jacoco_analyzer.github_client import (
 )
 
 
+# Timestamp shared by the mocks and dataclasses below; datetimes are immutable
+_FIXED_DT = datetime(2024, 1, 1)
+
+
+def _mock_commit(sha="abc123def456", message="Test commit message", additions=10, deletions=5,
+                 files=()):
+    """Build a mock PyGithub Commit."""
+    commit = Mock()
+    commit.sha = sha
+    commit.commit.message = message
+    commit.commit.author.name = "Test Author"
+    commit.commit.author.email = "test@example.com"
+    commit.commit.author.date = _FIXED_DT
+    commit.stats.additions = additions
+    commit.stats.deletions = deletions
+    commit.files = list(files)
+    return commit
+
+
+def _setup_repositories(github, repo):
+    """Have the logged-in user own a single repository."""
+    listed = Mock()
+    listed.name = "test-repo"
+    listed.full_name = "testuser/test-repo"
+    listed.description = "A test repository"
+    listed.language = "Python"
+    listed.stargazers_count = 10
+    listed.forks_count = 2
+    listed.updated_at = _FIXED_DT
+    listed.default_branch = "main"
+    listed.private = False
+    listed.html_url = "https://github.com/testuser/test-repo"
+    github.return_value.get_user.return_value.get_repos.return_value = [listed]
+
+
+def _setup_branches(github, repo):
+    """Give the repository a single unprotected main branch."""
+    branch = Mock()
+    branch.name = "main"
+    branch.protected = False
+    branch.commit.sha = "abc123"
+    repo.get_branches.return_value = [branch]
+
+
+def _setup_commits(github, repo):
+    """Give the repository a single commit."""
+    repo.get_commits.return_value = [_mock_commit()]
+
+
+@pytest.fixture(scope="module")
+def _patched_github():
+    """Patch the PyGithub client once for every GitHubClient test in the module."""
+    with patch("sonar_jacoco_analyzer.github_client.Github") as github:
+        yield github
+
+
+@pytest.fixture
+def mock_github(_patched_github):
+    """The patched Github class, reset for each test and logged in as testuser."""
+    _patched_github.reset_mock(return_value=True, side_effect=True)
+    _patched_github.return_value.get_user.return_value.login = "testuser"
+    return _patched_github
+
+
+@pytest.fixture
+def client(mock_github):
+    """A GitHubClient over the patched Github class."""
+    return GitHubClient(token="test_token")
+
+
+@pytest.fixture
+def mock_repo(mock_github):
+    """The repository returned by Github.get_repo, with main as its default branch."""
+    repo = Mock()
+    repo.default_branch = "main"
+    mock_github.return_value.get_repo.return_value = repo
+    return repo
+
+
 class TestGitHubClient:
     """Tests for GitHubClient class."""
 
-    @patch("sonar_jacoco_analyzer.github_client.Github")
     def test_init_with_token(self, mock_github):
         """Test client initialization with explicit token."""
-        mock_user = Mock()
-        mock_user.login = "testuser"
-        mock_github.return_value.get_user.return_value = mock_user
-
         client = GitHubClient(token="test_token")
 
         assert client.token == "test_token"
         assert client.username == "testuser"
-        mock_github.assert_called_once_with("test_token", per_page=30)
+        mock_github.assert_called_once_with(
+            "test_token", per_page=100, pool_size=GitHubClient.MAX_WORKERS
+        )
 
-    @patch.dict("os.environ", {"GITHUB_TOKEN": "env_token"})
-    @patch("sonar_jacoco_analyzer.github_client.Github")
-    def test_init_with_env_token(self, mock_github):
+    def test_init_with_env_token(self, monkeypatch, mock_github):
         """Test client initialization with environment token."""
-        mock_user = Mock()
-        mock_user.login = "envuser"
-        mock_github.return_value.get_user.return_value = mock_user
+        monkeypatch.setenv("GITHUB_TOKEN", "env_token")
+        mock_github.return_value.get_user.return_value.login = "envuser"
 
         client = GitHubClient()
 
         assert client.token == "env_token"
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_init_without_token_raises(self):
+    def test_init_without_token_raises(self, monkeypatch):
         """Test that initialization without token raises error."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         with pytest.raises(AuthenticationError):
             GitHubClient()
 
-    @patch("sonar_jacoco_analyzer.github_client.Github")
-    def test_list_repositories(self, mock_github):
-        """Test listing repositories."""
-        # Setup mock
-        mock_user = Mock()
-        mock_user.login = "testuser"
-
-        mock_repo = Mock()
-        mock_repo.name = "test-repo"
-        mock_repo.full_name = "testuser/test-repo"
-        mock_repo.description = "A test repository"
-        mock_repo.language = "Python"
-        mock_repo.stargazers_count = 10
-        mock_repo.forks_count = 2
-        mock_repo.updated_at = datetime(2024, 1, 1)
-        mock_repo.default_branch = "main"
-        mock_repo.private = False
-        mock_repo.html_url = "https://github.com/testuser/test-repo"
-
-        mock_user.get_repos.return_value = [mock_repo]
-        mock_github.return_value.get_user.return_value = mock_user
-
-        client = GitHubClient(token="test_token")
-        repos = client.list_repositories()
-
-        assert len(repos) == 1
-        assert repos[0].name == "test-repo"
-        assert repos[0].full_name == "testuser/test-repo"
-        assert repos[0].language == "Python"
-        assert repos[0].stars == 10
-
-    @patch("sonar_jacoco_analyzer.github_client.Github")
-    def test_list_branches(self, mock_github):
-        """Test listing branches."""
-        mock_user = Mock()
-        mock_user.login = "testuser"
-
-        mock_repo = Mock()
-        mock_repo.default_branch = "main"
-
-        mock_branch = Mock()
-        mock_branch.name = "main"
-        mock_branch.protected = False
-        mock_branch.commit.sha = "abc123"
-
-        mock_repo.get_branches.return_value = [mock_branch]
-        mock_github.return_value.get_user.return_value = mock_user
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        client = GitHubClient(token="test_token")
-        branches = client.list_branches("testuser/test-repo")
-
-        assert len(branches) == 1
-        assert branches[0].name == "main"
-        assert branches[0].is_default is True
-
-    @patch("sonar_jacoco_analyzer.github_client.Github")
-    def test_list_commits(self, mock_github):
-        """Test listing commits."""
-        mock_user = Mock()
-        mock_user.login = "testuser"
-
-        mock_repo = Mock()
-        mock_repo.default_branch = "main"
-
-        mock_commit = Mock()
-        mock_commit.sha = "abc123def456"
-        mock_commit.commit.message = "Test commit message"
-        mock_commit.commit.author.name = "Test Author"
-        mock_commit.commit.author.email = "test@example.com"
-        mock_commit.commit.author.date = datetime(2024, 1, 1)
-        mock_commit.stats.additions = 10
-        mock_commit.stats.deletions = 5
-        mock_commit.files = []
-
-        mock_repo.get_commits.return_value = [mock_commit]
-        mock_github.return_value.get_user.return_value = mock_user
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        client = GitHubClient(token="test_token")
-        commits = client.list_commits("testuser/test-repo", "main", limit=10)
-
-        assert len(commits) == 1
-        assert commits[0].sha == "abc123def456"
-        assert commits[0].short_sha == "abc123d"
-        assert commits[0].message == "Test commit message"
-        assert commits[0].author_name == "Test Author"
-
-    @patch("sonar_jacoco_analyzer.github_client.Github")
-    def test_get_commit_diff(self, mock_github):
+    @pytest.mark.parametrize(
+        "method, args, setup, expected",
+        [
+            pytest.param(
+                "list_repositories",
+                (),
+                _setup_repositories,
+                {
+                    "name": "test-repo",
+                    "full_name": "testuser/test-repo",
+                    "language": "Python",
+                    "stars": 10,
+                },
+                id="repositories",
+            ),
+            pytest.param(
+                "list_branches",
+                ("testuser/test-repo",),
+                _setup_branches,
+                {"name": "main", "is_default": True},
+                id="branches",
+            ),
+            pytest.param(
+                "list_commits",
+                ("testuser/test-repo", "main", 10),
+                _setup_commits,
+                {
+                    "sha": "abc123def456",
+                    "short_sha": "abc123d",
+                    "message": "Test commit message",
+                    "author_name": "Test Author",
+                    # Stats need a request per commit, so they are not fetched by default
+                    "additions": None,
+                    "files_changed": None,
+                },
+                id="commits",
+            ),
+        ],
+    )
+    def test_list_methods(self, mock_github, mock_repo, client, method, args, setup, expected):
+        """Test each listing method maps the PyGithub objects it reads."""
+        setup(mock_github, mock_repo)
+
+        result = getattr(client, method)(*args)
+
+        assert len(result) == 1
+        for name, value in expected.items():
+            assert getattr(result[0], name) == value
+            assert type(getattr(result[0], name)) is type(value)
+
+    def test_list_repositories_max_items_stops_early(self, mock_github, client):
+        """Test that repositories past max_items are never read."""
+        consumed = []
+
+        def repos():
+            for i in range(100):
+                repo = Mock()
+                repo.name = f"repo-{i}"
+                repo.private = False
+                consumed.append(i)
+                yield repo
+
+        mock_github.return_value.get_user.return_value.get_repos.return_value = repos()
+
+        result = client.list_repositories(max_items=3)
+
+        assert [r.name for r in result] == ["repo-0", "repo-1", "repo-2"]
+        assert consumed == [0, 1, 2]
+
+    def test_list_commits_include_stats(self, mock_repo, client):
+        """Test listing commits with per-commit stats."""
+        mock_commits = [
+            _mock_commit(f"abc123def45{i}", additions=10 + i, files=[Mock()] * i)
+            for i in range(3)
+        ]
+        mock_repo.get_commits.return_value = mock_commits
+
+        commits = client.list_commits("testuser/test-repo", "main", include_stats=True)
+
+        assert [c.sha for c in commits] == [c.sha for c in mock_commits]
+        assert [c.additions for c in commits] == [10, 11, 12]
+        assert [c.files_changed for c in commits] == [0, 1, 2]
+
+    def test_get_commit_diff(self, mock_repo, client):
         """Test getting commit diff."""
-        mock_user = Mock()
-        mock_user.login = "testuser"
-
         mock_file = Mock()
         mock_file.filename = "test.py"
         mock_file.status = "modified"
@@ -155,18 +219,10 @@ class TestGitHubClient:
         mock_file.changes = 7
         mock_file.patch = "@@ -1,3 +1,4 @@\n+new line"
 
-        mock_commit = Mock()
-        mock_commit.sha = "abc123"
-        mock_commit.files = [mock_file]
-        mock_commit.stats.additions = 5
-        mock_commit.stats.deletions = 2
-
-        mock_repo = Mock()
-        mock_repo.get_commit.return_value = mock_commit
-        mock_github.return_value.get_user.return_value = mock_user
-        mock_github.return_value.get_repo.return_value = mock_repo
+        mock_repo.get_commit.return_value = _mock_commit(
+            "abc123", additions=5, deletions=2, files=[mock_file]
+        )
 
-        client = GitHubClient(token="test_token")
         diff = client.get_commit_diff("testuser/test-repo", "abc123")
 
         assert diff.sha == "abc123"
@@ -175,85 +231,93 @@ class TestGitHubClient:
         assert diff.additions == 5
         assert diff.deletions == 2
 
-    @patch("sonar_jacoco_analyzer.github_client.Github")
-    def test_get_rate_limit_status(self, mock_github):
-        """Test getting rate limit status."""
-        mock_user = Mock()
-        mock_user.login = "testuser"
+    def test_get_multiple_commit_diffs_preserves_order(self, mock_repo, client):
+        """Test concurrently fetched diffs are returned in request order."""
+        mock_repo.get_commit.side_effect = lambda sha: _mock_commit(sha, additions=1, deletions=0)
 
+        shas = [f"sha{i}" for i in range(20)]
+        diffs = client.get_multiple_commit_diffs("testuser/test-repo", shas)
+
+        assert [d.sha for d in diffs] == shas
+        assert client.get_multiple_commit_diffs("testuser/test-repo", []) == []
+
+    def test_get_rate_limit_status(self, mock_github, client):
+        """Test getting rate limit status."""
         mock_rate = Mock()
         mock_rate.core.limit = 5000
         mock_rate.core.remaining = 4999
-        mock_rate.core.reset = datetime(2024, 1, 1)
+        mock_rate.core.reset = _FIXED_DT
 
-        mock_github.return_value.get_user.return_value = mock_user
         mock_github.return_value.get_rate_limit.return_value = mock_rate
 
-        client = GitHubClient(token="test_token")
         status = client.get_rate_limit_status()
 
         assert status["limit"] == 5000
         assert status["remaining"] == 4999
 
+        # Repeated calls within the TTL reuse the fetched status
+        assert client.get_rate_limit_status() is status
+        mock_github.return_value.get_rate_limit.assert_called_once()
 
-class TestRepositoryInfo:
-    """Tests for RepositoryInfo dataclass."""
-
-    def test_repository_info_creation(self):
-        """Test creating a RepositoryInfo object."""
-        repo = RepositoryInfo(
-            name="test-repo",
-            full_name="user/test-repo",
-            description="Test description",
-            language="Python",
-            stars=100,
-            forks=20,
-            updated_at=datetime(2024, 1, 1),
-            default_branch="main",
-            private=False,
-            url="https://github.com/user/test-repo",
-        )
-
-        assert repo.name == "test-repo"
-        assert repo.full_name == "user/test-repo"
-        assert repo.stars == 100
-        assert repo.private is False
-
-
-class TestBranchInfo:
-    """Tests for BranchInfo dataclass."""
-
-    def test_branch_info_creation(self):
-        """Test creating a BranchInfo object."""
-        branch = BranchInfo(
-            name="main",
-            is_default=True,
-            is_protected=True,
-            commit_sha="abc123",
+        client._rate_limit_cache = (
+            client._rate_limit_cache[0] - GitHubClient.RATE_LIMIT_CACHE_TTL,
+            status,
         )
-
-        assert branch.name == "main"
-        assert branch.is_default is True
-        assert branch.is_protected is True
-
-
-class TestCommitInfo:
-    """Tests for CommitInfo dataclass."""
-
-    def test_commit_info_creation(self):
-        """Test creating a CommitInfo object."""
-        commit = CommitInfo(
-            sha="abc123def456",
-            short_sha="abc123d",
-            message="Test commit",
-            author_name="Test Author",
-            author_email="test@example.com",
-            date=datetime(2024, 1, 1),
-            additions=10,
-            deletions=5,
-            files_changed=3,
-        )
-
-        assert commit.sha == "abc123def456"
-        assert commit.short_sha == "abc123d"
-        assert commit.additions == 10
+        client.get_rate_limit_status()
+        assert mock_github.return_value.get_rate_limit.call_count == 2
+
+
+class TestDataclasses:
+    """Tests for the GitHub client dataclasses."""
+
+    @pytest.mark.parametrize(
+        "cls, kwargs, expected",
+        [
+            pytest.param(
+                RepositoryInfo,
+                {
+                    "name": "test-repo",
+                    "full_name": "user/test-repo",
+                    "description": "Test description",
+                    "language": "Python",
+                    "stars": 100,
+                    "forks": 20,
+                    "updated_at": _FIXED_DT,
+                    "default_branch": "main",
+                    "private": False,
+                    "url": "https://github.com/user/test-repo",
+                },
+                {"name": "test-repo", "full_name": "user/test-repo", "stars": 100, "private": False},
+                id="repository_info",
+            ),
+            pytest.param(
+                BranchInfo,
+                {"name": "main", "is_default": True, "is_protected": True, "commit_sha": "abc123"},
+                {"name": "main", "is_default": True, "is_protected": True},
+                id="branch_info",
+            ),
+            pytest.param(
+                CommitInfo,
+                {
+                    "sha": "abc123def456",
+                    "short_sha": "abc123d",
+                    "message": "Test commit",
+                    "author_name": "Test Author",
+                    "author_email": "test@example.com",
+                    "date": _FIXED_DT,
+                    "additions": 10,
+                    "deletions": 5,
+                    "files_changed": 3,
+                },
+                {"sha": "abc123def456", "short_sha": "abc123d", "additions": 10},
+                id="commit_info",
+            ),
+        ],
+    )
+    def test_creation(self, cls, kwargs, expected):
+        """Test constructing each dataclass and reading back its attributes."""
+        obj = cls(**kwargs)
+
+        for name, value in expected.items():
+            assert getattr(obj, name) == value
+            assert type(getattr(obj, name)) is type(value)
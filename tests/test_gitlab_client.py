@@ -3,8 +3,13 @@ Tests for the GitLab client module.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from unittest.mock import Mock, patch
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import gitlab
+from gitlab.exceptions import GitlabGetError
 
 from sonar_jacoco_analyzer.gitlab_client import (
     GitLabClient,
@@ -18,153 +23,374 @@ from sonar_jacoco_analyzer.gitlab_client import (
     CommitDiff,
 )
 
+# Timestamp shared by the dataclass tests below; datetimes are immutable
+_FIXED_DT = datetime(2024, 1, 1)
+
+# A listed project; the client only reads it, so tests can share one instance
+_SAMPLE_PROJECT = SimpleNamespace(
+    id=123,
+    name="test-project",
+    path_with_namespace="testuser/test-project",
+    description="A test project",
+    star_count=10,
+    forks_count=2,
+    last_activity_at="2024-01-01T00:00:00Z",
+    default_branch="main",
+    visibility="public",
+    web_url="https://gitlab.com/testuser/test-project",
+    languages=lambda: {"Python": 80, "JavaScript": 20},
+)
+
+# Attribute names for spec'd Gitlab instances. The managers (projects, user, ...)
+# are set in __init__, so they are read off an instance that never connects.
+_GITLAB_ATTRIBUTES = dir(gitlab.Gitlab("https://gitlab.com"))
+
+
+def _make_commit(sha, date, parent_ids=()):
+    """Build a listed commit with no stats."""
+    return SimpleNamespace(
+        id=sha,
+        short_id=sha[:7],
+        message="",
+        author_name=None,
+        author_email=None,
+        committed_date=date,
+        parent_ids=list(parent_ids),
+        stats={},
+    )
+
+
+def _setup_repositories(gitlab_instance, project):
+    """Have the instance list a single project."""
+    gitlab_instance.projects.list.return_value = [_SAMPLE_PROJECT]
+
+
+def _setup_branches(gitlab_instance, project):
+    """Give the project a single unprotected main branch."""
+    project.branches.list.return_value = [
+        SimpleNamespace(name="main", protected=False, commit={"id": "abc123"})
+    ]
+
+
+def _setup_commits(gitlab_instance, project):
+    """Give the project a single commit, listed with its stats."""
+    project.commits.list.return_value = [
+        SimpleNamespace(
+            id="abc123def456",
+            short_id="abc123d",
+            message="Test commit message",
+            author_name="Test Author",
+            author_email="test@example.com",
+            committed_date="2024-01-01T00:00:00Z",
+            stats={"additions": 10, "deletions": 5, "total": 15},
+        )
+    ]
+
+
+@pytest.fixture(scope="module")
+def _patched_gitlab():
+    """Patch python-gitlab's client once for every GitLabClient test in the module."""
+    with patch("sonar_jacoco_analyzer.gitlab_client.gitlab.Gitlab") as gitlab_class:
+        yield gitlab_class
+
+
+@pytest.fixture
+def mock_gitlab_class(_patched_gitlab):
+    """The patched Gitlab class, reset for each test and logged in as testuser."""
+    _patched_gitlab.reset_mock(return_value=True, side_effect=True)
+    _patched_gitlab.return_value = Mock(spec=_GITLAB_ATTRIBUTES)
+    _patched_gitlab.return_value.user.username = "testuser"
+    return _patched_gitlab
+
+
+@pytest.fixture
+def mock_gitlab(mock_gitlab_class):
+    """The Gitlab instance the client under test talks to."""
+    return mock_gitlab_class.return_value
+
+
+@pytest.fixture
+def client(mock_gitlab):
+    """A GitLabClient over the patched Gitlab class."""
+    return GitLabClient(token="test_token")
+
+
+@pytest.fixture
+def mock_project(mock_gitlab):
+    """The project returned by Gitlab.projects.get, with main as its default branch."""
+    project = Mock()
+    project.default_branch = "main"
+    mock_gitlab.projects.get.return_value = project
+    return project
+
+
+@pytest.fixture(scope="module")
+def default_client(_patched_gitlab):
+    """A self-hosted GitLabClient built once for tests that only read its attributes."""
+    return GitLabClient(token="test_token", url="https://gitlab.example.com")
+
 
 class TestGitLabClient:
     """Tests for GitLabClient class."""
 
-    @patch("sonar_jacoco_analyzer.gitlab_client.gitlab.Gitlab")
     def test_init_with_token(self, mock_gitlab_class):
         """Test client initialization with explicit token."""
-        mock_gitlab = Mock()
-        mock_user = Mock()
-        mock_user.username = "testuser"
-        mock_gitlab.user = mock_user
-        mock_gitlab_class.return_value = mock_gitlab
-
         client = GitLabClient(token="test_token", url="https://gitlab.com")
 
         assert client.token == "test_token"
         assert client.username == "testuser"
         mock_gitlab_class.assert_called_once_with(
-            "https://gitlab.com", private_token="test_token"
+            "https://gitlab.com", private_token="test_token", retry_transient_errors=True
         )
 
-    @patch.dict("os.environ", {"GITLAB_TOKEN": "env_token"})
-    @patch("sonar_jacoco_analyzer.gitlab_client.gitlab.Gitlab")
-    def test_init_with_env_token(self, mock_gitlab_class):
+    def test_init_with_env_token(self, mock_gitlab, monkeypatch):
         """Test client initialization with environment token."""
-        mock_gitlab = Mock()
-        mock_user = Mock()
-        mock_user.username = "envuser"
-        mock_gitlab.user = mock_user
-        mock_gitlab_class.return_value = mock_gitlab
+        monkeypatch.setenv("GITLAB_TOKEN", "env_token")
+        mock_gitlab.user.username = "envuser"
 
         client = GitLabClient()
 
         assert client.token == "env_token"
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_init_without_token_raises(self):
+    def test_init_without_token_raises(self, monkeypatch):
         """Test that initialization without token raises error."""
+        monkeypatch.delenv("GITLAB_TOKEN", raising=False)
         with pytest.raises(AuthenticationError):
             GitLabClient()
 
-    @patch("sonar_jacoco_analyzer.gitlab_client.gitlab.Gitlab")
-    def test_list_repositories(self, mock_gitlab_class):
-        """Test listing repositories (projects)."""
-        mock_gitlab = Mock()
-        mock_user = Mock()
-        mock_user.username = "testuser"
-        mock_gitlab.user = mock_user
-
-        mock_project = Mock()
-        mock_project.id = 123
-        mock_project.name = "test-project"
-        mock_project.path_with_namespace = "testuser/test-project"
-        mock_project.description = "A test project"
-        mock_project.star_count = 10
-        mock_project.forks_count = 2
-        mock_project.last_activity_at = "2024-01-01T00:00:00Z"
-        mock_project.default_branch = "main"
-        mock_project.visibility = "public"
-        mock_project.web_url = "https://gitlab.com/testuser/test-project"
-        mock_project.languages.return_value = {"Python": 80, "JavaScript": 20}
-
-        mock_gitlab.projects.list.return_value = [mock_project]
-        mock_gitlab_class.return_value = mock_gitlab
-
-        client = GitLabClient(token="test_token")
+    @pytest.mark.parametrize(
+        "method, args, setup, expected",
+        [
+            pytest.param(
+                "list_repositories",
+                (),
+                _setup_repositories,
+                {
+                    "name": "test-project",
+                    "full_name": "testuser/test-project",
+                    "language": "Python",
+                    "stars": 10,
+                },
+                id="repositories",
+            ),
+            pytest.param(
+                "list_branches",
+                (123,),
+                _setup_branches,
+                {"name": "main", "is_default": True},
+                id="branches",
+            ),
+            pytest.param(
+                "list_commits",
+                (123, "main", 10),
+                _setup_commits,
+                {
+                    "sha": "abc123def456",
+                    "short_sha": "abc123d",
+                    "message": "Test commit message",
+                    "author_name": "Test Author",
+                    "additions": 10,
+                    "deletions": 5,
+                    "date": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                },
+                id="commits",
+            ),
+        ],
+    )
+    def test_list_methods(self, mock_gitlab, mock_project, client, method, args, setup, expected):
+        """Test each listing method maps the python-gitlab objects it reads."""
+        setup(mock_gitlab, mock_project)
+
+        result = getattr(client, method)(*args)
+
+        assert len(result) == 1
+        for name, value in expected.items():
+            assert getattr(result[0], name) == value
+            assert type(getattr(result[0], name)) is type(value)
+
+    def test_list_repositories_single_page(self, mock_gitlab, client):
+        """Test the default 100 repositories are requested as a single page."""
+        _setup_repositories(mock_gitlab, None)
+
+        client.list_repositories()
+
+        assert mock_gitlab.projects.list.call_args.kwargs["per_page"] == 100
+
+    def test_list_repositories_max_items(self, mock_gitlab, client):
+        """Test limiting the number of repositories returned."""
+        projects = []
+        for i in range(5):
+            project = Mock()
+            project.id = i
+            project.last_activity_at = None
+            project.languages.return_value = {}
+            projects.append(project)
+
+        mock_gitlab.projects.list.return_value = projects
+
+        repos = client.list_repositories(max_items=3)
+
+        assert [r.id for r in repos] == [0, 1, 2]
+        assert mock_gitlab.projects.list.call_args.kwargs["per_page"] == 3
+
+    def test_iter_repositories_stops_early(self, mock_gitlab):
+        """Test that languages are only looked up for pages that are reached."""
+        projects = []
+        for i in range(5):
+            project = Mock()
+            project.id = i
+            project.last_activity_at = None
+            project.languages.return_value = {"Go": 1}
+            projects.append(project)
+
+        mock_gitlab.projects.list.return_value = iter(projects)
+
+        client = GitLabClient(token="test_token", per_page=2)
+        repos = client.iter_repositories()
+        first = next(repos)
+        repos.close()
+
+        assert first.id == 0
+        assert first.language == "Go"
+        assert [p.languages.called for p in projects] == [True, True, False, False, False]
+
+    def test_list_repositories_language_lookup_failure(self, mock_gitlab, client):
+        """Test a failed language lookup only affects that repository."""
+        projects = []
+        for i, languages in enumerate([{"Java": 90, "Kotlin": 10}, Exception("boom"), {}]):
+            project = Mock()
+            project.id = i
+            project.last_activity_at = None
+            if isinstance(languages, Exception):
+                project.languages.side_effect = languages
+            else:
+                project.languages.return_value = languages
+            projects.append(project)
+
+        mock_gitlab.projects.list.return_value = projects
+
         repos = client.list_repositories()
 
-        assert len(repos) == 1
-        assert repos[0].name == "test-project"
-        assert repos[0].full_name == "testuser/test-project"
-        assert repos[0].language == "Python"
-        assert repos[0].stars == 10
-
-    @patch("sonar_jacoco_analyzer.gitlab_client.gitlab.Gitlab")
-    def test_list_branches(self, mock_gitlab_class):
-        """Test listing branches."""
-        mock_gitlab = Mock()
-        mock_user = Mock()
-        mock_user.username = "testuser"
-        mock_gitlab.user = mock_user
-
-        mock_project = Mock()
-        mock_project.default_branch = "main"
-
-        mock_branch = Mock()
-        mock_branch.name = "main"
-        mock_branch.protected = False
-        mock_branch.commit = {"id": "abc123"}
-
-        mock_project.branches.list.return_value = [mock_branch]
-        mock_gitlab.projects.get.return_value = mock_project
-        mock_gitlab_class.return_value = mock_gitlab
-
-        client = GitLabClient(token="test_token")
-        branches = client.list_branches(123)
-
-        assert len(branches) == 1
-        assert branches[0].name == "main"
-        assert branches[0].is_default is True
-
-    @patch("sonar_jacoco_analyzer.gitlab_client.gitlab.Gitlab")
-    def test_list_commits(self, mock_gitlab_class):
-        """Test listing commits."""
-        mock_gitlab = Mock()
-        mock_user = Mock()
-        mock_user.username = "testuser"
-        mock_gitlab.user = mock_user
-
-        mock_project = Mock()
-        mock_project.default_branch = "main"
+        assert [r.language for r in repos] == ["Java", None, None]
 
-        mock_commit = Mock()
-        mock_commit.id = "abc123def456"
-        mock_commit.short_id = "abc123d"
-        mock_commit.message = "Test commit message"
-        mock_commit.author_name = "Test Author"
-        mock_commit.author_email = "test@example.com"
-        mock_commit.committed_date = "2024-01-01T00:00:00Z"
-
-        mock_full_commit = Mock()
-        mock_full_commit.stats = {"additions": 10, "deletions": 5, "total": 15}
-
-        mock_project.commits.list.return_value = [mock_commit]
-        mock_project.commits.get.return_value = mock_full_commit
-        mock_gitlab.projects.get.return_value = mock_project
-        mock_gitlab_class.return_value = mock_gitlab
-
-        client = GitLabClient(token="test_token")
+    def test_list_commits_with_stats(self, mock_gitlab, mock_project, client):
+        """Test stats come with the list response rather than one request per commit."""
+        _setup_commits(mock_gitlab, mock_project)
+
+        client.list_commits(123, "main", limit=10)
+
+        assert mock_project.commits.list.call_args.kwargs["with_stats"] is True
+        mock_project.commits.get.assert_not_called()
+
+    def test_list_commits_incremental(self, mock_project, client):
+        """Test repeated listings only fetch commits since the newest one seen."""
+        old = [
+            _make_commit("bbb", "2024-01-02T00:00:00Z", ["aaa"]),
+            _make_commit("aaa", "2024-01-01T00:00:00Z"),
+        ]
+        new = _make_commit("ccc", "2024-01-03T00:00:00Z", ["bbb"])
+
+        # Full listing, then the branch tip and the commits since the cached head
+        mock_project.commits.list.side_effect = [old, [new], [new, old[0]]]
+
+        assert [c.sha for c in client.list_commits(123, "main", limit=10)] == ["bbb", "aaa"]
+
+        commits = client.list_commits(123, "main", limit=10)
+        assert [c.sha for c in commits] == ["ccc", "bbb", "aaa"]
+        assert mock_project.commits.list.call_args.kwargs["since"] == "2024-01-02T00:00:00+00:00"
+
+        # The cached head is no longer on the branch (force-push): full refetch
+        client.invalidate_commit_cache(123)
+        assert client._commit_cache == {}
+        mock_project.commits.list.side_effect = [old, [new], [new], [new, old[1]]]
+        client.list_commits(123, "main", limit=10)
         commits = client.list_commits(123, "main", limit=10)
+        assert [c.sha for c in commits] == ["ccc", "aaa"]
+        assert "since" not in mock_project.commits.list.call_args.kwargs
+
+    def test_list_commits_unchanged_tip_reuses_cache(self, mock_project, client):
+        """Test an unchanged branch tip costs one single-commit request."""
+        old = [
+            _make_commit("bbb", "2024-01-02T00:00:00Z", ["aaa"]),
+            _make_commit("aaa", "2024-01-01T00:00:00Z"),
+        ]
+        mock_project.commits.list.side_effect = [old, [old[0]]]
 
-        assert len(commits) == 1
-        assert commits[0].sha == "abc123def456"
-        assert commits[0].short_sha == "abc123d"
-        assert commits[0].message == "Test commit message"
-        assert commits[0].author_name == "Test Author"
+        first = client.list_commits(123, "main", limit=10)
+        commits = client.list_commits(123, "main", limit=10)
 
-    @patch("sonar_jacoco_analyzer.gitlab_client.gitlab.Gitlab")
-    def test_get_commit_diff(self, mock_gitlab_class):
-        """Test getting commit diff."""
-        mock_gitlab = Mock()
-        mock_user = Mock()
-        mock_user.username = "testuser"
-        mock_gitlab.user = mock_user
+        assert commits == first
+        assert mock_project.commits.list.call_args.kwargs["per_page"] == 1
 
-        mock_project = Mock()
+    def test_list_commits_incremental_merge_of_older_commit(self, mock_project, client):
+        """Test a merge of commits dated before the cached head triggers a full refetch."""
+        old = [
+            _make_commit("bbb", "2024-01-02T00:00:00Z", ["aaa"]),
+            _make_commit("aaa", "2024-01-01T00:00:00Z"),
+        ]
+        # Committed on a side branch before bbb, so since=bbb's date omits it
+        side = _make_commit("sss", "2023-12-31T00:00:00Z", ["aaa"])
+        merge = _make_commit("mmm", "2024-01-03T00:00:00Z", ["bbb", "sss"])
+        mock_project.commits.list.side_effect = [
+            old,
+            [merge],
+            [merge, old[0]],
+            [merge, old[0], side, old[1]],
+        ]
 
+        client.list_commits(123, "main", limit=10)
+        commits = client.list_commits(123, "main", limit=10)
+
+        assert [c.sha for c in commits] == ["mmm", "bbb", "sss", "aaa"]
+        assert "since" not in mock_project.commits.list.call_args.kwargs
+
+    def test_list_commits_incremental_tip_dated_before_head(self, mock_project, client):
+        """Test a new tip with an older committer date is not missed."""
+        old = [
+            _make_commit("bbb", "2024-01-02T00:00:00Z", ["aaa"]),
+            _make_commit("aaa", "2024-01-01T00:00:00Z"),
+        ]
+        # Clock skew: committed on top of bbb but dated before it, so since omits it
+        skewed = _make_commit("kkk", "2024-01-01T12:00:00Z", ["bbb"])
+        mock_project.commits.list.side_effect = [old, [skewed], [old[0]], [skewed, *old]]
+
+        client.list_commits(123, "main", limit=10)
+        commits = client.list_commits(123, "main", limit=10)
+
+        assert [c.sha for c in commits] == ["kkk", "bbb", "aaa"]
+        assert "since" not in mock_project.commits.list.call_args.kwargs
+
+    def test_list_commits_cache_expires(self, mock_project, client):
+        """Test commit listings older than CACHE_TTL are fetched in full."""
+        old = [_make_commit("aaa", "2024-01-01T00:00:00Z")]
+        mock_project.commits.list.side_effect = [old, old]
+
+        client.list_commits(123, "main", limit=10)
+        fetched, limit, commits = client._commit_cache[(123, "main")]
+        client._commit_cache[(123, "main")] = (fetched - GitLabClient.CACHE_TTL, limit, commits)
+        client.list_commits(123, "main", limit=10)
+
+        assert mock_project.commits.list.call_count == 2
+        assert mock_project.commits.list.call_args.kwargs["per_page"] == 10
+
+    def test_rate_limit_error(self, mock_gitlab, client):
+        """Test a 429 response is reported as RateLimitError, not a missing project."""
+        mock_gitlab.projects.get.side_effect = GitlabGetError("Too Many Requests", 429)
+
+        with pytest.raises(RateLimitError):
+            client.list_branches(123)
+
+    def test_get_head_commit_sha(self, mock_project, client):
+        """Test getting the latest commit SHA with a one-item page."""
+        mock_project.commits.list.return_value = [SimpleNamespace(id="abc123def456")]
+
+        assert client.get_head_commit_sha(123) == "abc123def456"
+        mock_project.commits.list.assert_called_once_with(
+            ref_name="main", per_page=1, page=1, get_all=False
+        )
+
+    def test_get_commit_diff(self, mock_project, client):
+        """Test getting commit diff."""
         mock_commit = Mock()
         mock_commit.id = "abc123"
         mock_commit.diff.return_value = [
@@ -179,109 +405,180 @@ class TestGitLabClient:
         ]
 
         mock_project.commits.get.return_value = mock_commit
-        mock_gitlab.projects.get.return_value = mock_project
-        mock_gitlab_class.return_value = mock_gitlab
 
-        client = GitLabClient(token="test_token")
         diff = client.get_commit_diff(123, "abc123")
 
         assert diff.sha == "abc123"
         assert len(diff.files) == 1
         assert diff.files[0]["filename"] == "test.py"
+        assert diff.files[0]["additions"] == 1
+        assert diff.files[0]["deletions"] == 0
 
-    @patch("sonar_jacoco_analyzer.gitlab_client.gitlab.Gitlab")
-    def test_gitlab_url_property(self, mock_gitlab_class):
-        """Test gitlab_url property."""
-        mock_gitlab = Mock()
-        mock_user = Mock()
-        mock_user.username = "testuser"
-        mock_gitlab.user = mock_user
-        mock_gitlab_class.return_value = mock_gitlab
-
-        client = GitLabClient(token="test_token", url="https://gitlab.example.com")
-
-        assert client.gitlab_url == "https://gitlab.example.com"
-
-
-class TestRepositoryInfo:
-    """Tests for RepositoryInfo dataclass."""
-
-    def test_repository_info_creation(self):
-        """Test creating a RepositoryInfo object."""
-        repo = RepositoryInfo(
-            id=123,
-            name="test-project",
-            full_name="user/test-project",
-            description="Test description",
-            language="Python",
-            stars=100,
-            forks=20,
-            updated_at=datetime(2024, 1, 1),
-            default_branch="main",
-            private=False,
-            url="https://gitlab.com/user/test-project",
+    def test_get_commit_diff_joins_patches(self, mock_project, client):
+        """Files with a patch are joined with blank lines; empty diffs are skipped."""
+        mock_commit = Mock()
+        mock_commit.id = "abc123"
+        mock_commit.diff.return_value = [
+            {"new_path": "a.py", "old_path": "a.py", "diff": "@@ -1 +1 @@\n-x\n+y\n"},
+            {"new_path": "logo.png", "old_path": "logo.png", "diff": ""},
+            {
+                "new_path": "c.py",
+                "old_path": "b.py",
+                "renamed_file": True,
+                "diff": "@@ -0,0 +1 @@\n+z\n",
+            },
+        ]
+        mock_project.commits.get.return_value = mock_commit
+
+        diff = client.get_commit_diff(123, "abc123")
+
+        assert diff.patch == (
+            "--- a/a.py\n+++ b/a.py\n@@ -1 +1 @@\n-x\n+y\n"
+            "\n\n"
+            "--- a/b.py\n+++ b/c.py\n@@ -0,0 +1 @@\n+z\n"
         )
+        assert len(diff.files) == 3
+        assert diff.additions == 2
+        assert diff.deletions == 1
 
-        assert repo.id == 123
-        assert repo.name == "test-project"
-        assert repo.full_name == "user/test-project"
-        assert repo.stars == 100
-        assert repo.private is False
+    def test_count_changes(self):
+        """Test counting added and deleted lines in a patch."""
+        patch = "@@ -1,3 +1,3 @@\n-old\n+new\n+another\n context\n--- a/x\n+++ b/x"
 
+        assert GitLabClient._count_changes(patch) == (2, 1)
+        assert GitLabClient._count_changes("") == (0, 0)
 
-class TestBranchInfo:
-    """Tests for BranchInfo dataclass."""
+    def test_get_multiple_commit_diffs_preserves_order(self, mock_project, client):
+        """Test concurrently fetched diffs are returned in request order."""
 
-    def test_branch_info_creation(self):
-        """Test creating a BranchInfo object."""
-        branch = BranchInfo(
-            name="main",
-            is_default=True,
-            is_protected=True,
-            commit_sha="abc123",
-        )
+        def get_commit(sha):
+            commit = Mock()
+            commit.id = sha
+            commit.diff.return_value = []
+            return commit
+
+        mock_project.commits.get.side_effect = get_commit
+
+        shas = [f"sha{i}" for i in range(20)]
+        diffs = client.get_multiple_commit_diffs(123, shas)
 
-        assert branch.name == "main"
-        assert branch.is_default is True
-        assert branch.is_protected is True
+        assert [d.sha for d in diffs] == shas
+        assert client.get_multiple_commit_diffs(123, []) == []
 
+    def test_project_lookup_cached(self, mock_gitlab, mock_project, client):
+        """Test consecutive calls for the same project reuse one lookup."""
+        mock_project.branches.list.return_value = []
+        mock_project.commits.list.return_value = []
 
-class TestCommitInfo:
-    """Tests for CommitInfo dataclass."""
+        client.list_branches(123)
+        client.list_commits(123, "main")
+        mock_gitlab.projects.get.assert_called_once_with(123)
+
+        # Expired entries are fetched again
+        client._project_cache[123] = (
+            client._project_cache[123][0] - GitLabClient.CACHE_TTL,
+            mock_project,
+        )
+        client.list_branches(123)
+        assert mock_gitlab.projects.get.call_count == 2
 
-    def test_commit_info_creation(self):
-        """Test creating a CommitInfo object."""
+    def test_gitlab_url_property(self, default_client):
+        """Test gitlab_url property."""
+        assert default_client.gitlab_url == "https://gitlab.example.com"
+
+
+class TestDataclasses:
+    """Tests for the GitLab client dataclasses."""
+
+    @pytest.mark.parametrize(
+        "cls, kwargs, expected",
+        [
+            pytest.param(
+                RepositoryInfo,
+                {
+                    "id": 123,
+                    "name": "test-project",
+                    "full_name": "user/test-project",
+                    "description": "Test description",
+                    "language": "Python",
+                    "stars": 100,
+                    "forks": 20,
+                    "updated_at": _FIXED_DT,
+                    "default_branch": "main",
+                    "private": False,
+                    "url": "https://gitlab.com/user/test-project",
+                },
+                {
+                    "id": 123,
+                    "name": "test-project",
+                    "full_name": "user/test-project",
+                    "stars": 100,
+                    "private": False,
+                },
+                id="repository_info",
+            ),
+            pytest.param(
+                BranchInfo,
+                {"name": "main", "is_default": True, "is_protected": True, "commit_sha": "abc123"},
+                {"name": "main", "is_default": True, "is_protected": True},
+                id="branch_info",
+            ),
+            pytest.param(
+                CommitInfo,
+                {
+                    "sha": "abc123def456",
+                    "short_sha": "abc123d",
+                    "message": "Test commit",
+                    "author_name": "Test Author",
+                    "author_email": "test@example.com",
+                    "date": _FIXED_DT,
+                    "additions": 10,
+                    "deletions": 5,
+                    "files_changed": 3,
+                },
+                {"sha": "abc123def456", "short_sha": "abc123d", "additions": 10},
+                id="commit_info",
+            ),
+            pytest.param(
+                CommitDiff,
+                {
+                    "sha": "abc123",
+                    "files": [{"filename": "test.py", "status": "modified"}],
+                    "patch": "diff content",
+                    "additions": 10,
+                    "deletions": 5,
+                },
+                {
+                    "sha": "abc123",
+                    "files": [{"filename": "test.py", "status": "modified"}],
+                    "additions": 10,
+                    "deletions": 5,
+                },
+                id="commit_diff",
+            ),
+        ],
+    )
+    def test_creation(self, cls, kwargs, expected):
+        """Test constructing each dataclass and reading back its attributes."""
+        obj = cls(**kwargs)
+
+        for name, value in expected.items():
+            assert getattr(obj, name) == value
+            assert type(getattr(obj, name)) is type(value)
+
+    def test_commit_info_is_immutable(self):
+        """Cached CommitInfo objects are shared, so they cannot be modified."""
         commit = CommitInfo(
             sha="abc123def456",
             short_sha="abc123d",
             message="Test commit",
             author_name="Test Author",
             author_email="test@example.com",
-            date=datetime(2024, 1, 1),
+            date=_FIXED_DT,
             additions=10,
             deletions=5,
             files_changed=3,
         )
 
-        assert commit.sha == "abc123def456"
-        assert commit.short_sha == "abc123d"
-        assert commit.additions == 10
-
-
-class TestCommitDiff:
-    """Tests for CommitDiff dataclass."""
-
-    def test_commit_diff_creation(self):
-        """Test creating a CommitDiff object."""
-        diff = CommitDiff(
-            sha="abc123",
-            files=[{"filename": "test.py", "status": "modified"}],
-            patch="diff content",
-            additions=10,
-            deletions=5,
-        )
-
-        assert diff.sha == "abc123"
-        assert len(diff.files) == 1
-        assert diff.additions == 10
-        assert diff.deletions == 5
+        with pytest.raises(FrozenInstanceError):
+            commit.additions = 11
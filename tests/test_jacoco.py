@@ -0,0 +1,214 @@
+"""
+Tests for the JaCoCo report analyzer module.
+"""
+
+import os
+import zipfile
+
+import pytest
+
+from sonar_jacoco_analyzer import jacoco
+from sonar_jacoco_analyzer.jacoco import analyze_jacoco_report
+
+# A source page as JaCoCo renders it: fully covered (fc), partially covered
+# (pc) and not covered (nc) lines, entities, non-ASCII text and an nc line
+# with only whitespace
+_SOURCE_PAGE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"'
+    ' "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd"><html xmlns="http://www.w3.org/1999/xhtml"'
+    ' lang="en"><head><meta http-equiv="Content-Type" content="text/html;charset=UTF-8"/>'
+    '<title>Foo.java</title></head><body><h1>Foo.java</h1>'
+    '<pre class="source lang-java linenums">'
+    '<span class="fc" id="L1">package demo;</span>\n'
+    '\n'
+    '<span class="pc bpc" id="L3" title="1 of 2 branches missed.">'
+    '        if (a &lt; b &amp;&amp; c) {</span>\n'
+    '<span class="nc" id="L4">            log(&quot;café — 日本&quot;);</span>\n'
+    '<span class="nc" id="L5">   </span>\n'
+    '<span class="nc bnc" id="L6" title="2 of 2 branches missed.">        while (x) {</span>\n'
+    '<span class="pc" id="L7">        y();</span>\n'
+    '<span class="fc" id="L8">    }</span>\n'
+    '</pre></body></html>'
+)
+
+_INDEX_PAGE = (
+    '<html><head><title>JaCoCo Coverage Report</title></head><body><table><tbody>'
+    '<tr><td><a href="demo/index.html">demo</a></td><td>50%</td></tr>'
+    '</tbody></table></body></html>'
+)
+
+# (line, branch info, source) and (line, source) for each source page
+_EXPECTED_BRANCHES = [
+    (3, "1 of 2 branches missed.", "if (a < b && c) {"),
+    (7, "Partially covered", "y();"),
+]
+_EXPECTED_LINES = [
+    (4, 'log("café — 日本");'),
+    (6, "while (x) {"),
+]
+
+# The report sits below the top level, so it is found by searching
+_REPORT_DIR = ("out", "coverage")
+
+
+def _report_members(file_count):
+    """Member paths and contents of a report with file_count source pages."""
+    base = "/".join(_REPORT_DIR)
+    members = [
+        (f"{base}/index.html", _INDEX_PAGE),
+        (f"{base}/demo/index.html", "<html><body>package</body></html>"),
+        (f"{base}/demo/index.source.html", "<html><body>sources</body></html>"),
+    ]
+    members.extend(
+        (f"{base}/demo/Foo{i}.java.html", _SOURCE_PAGE) for i in range(file_count)
+    )
+    return members
+
+
+def _build_report(tmp_path, layout, file_count):
+    """Write the report under tmp_path and return the analyze_jacoco_report kwargs."""
+    members = _report_members(file_count)
+    if layout == "zip":
+        archive = tmp_path / "report.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            for name, content in members:
+                zf.writestr(name, content.encode("utf-8"))
+        return {"archive_path": str(archive)}
+
+    root = tmp_path / "report"
+    for name, content in members:
+        path = root.joinpath(*name.split("/"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content.encode("utf-8"))
+    return {"report_dir": str(root)}
+
+
+def _summarize(result):
+    """
+    Reduce a result to comparable tuples, grouped per source file.
+
+    Files come in directory listing order, which depends on the file system,
+    so they are sorted by path; lines keep their order within a file.
+    """
+    def by_file(records):
+        return sorted(records, key=lambda record: record[0])
+
+    return (
+        by_file((mb.file_path, mb.class_name, mb.line_number, mb.branch_info, mb.source_line)
+                for mb in result.missed_branches),
+        by_file((ul.file_path, ul.class_name, ul.line_number, ul.source_line)
+                for ul in result.uncovered_lines),
+    )
+
+
+def _expected(file_count):
+    """The summary every backend and layout should produce."""
+    branches, lines = [], []
+    for i in range(file_count):
+        rel_path = os.path.join("demo", f"Foo{i}.java.html")
+        class_name = f"Foo{i}.java"
+        branches.extend((rel_path, class_name, *b) for b in _EXPECTED_BRANCHES)
+        lines.extend((rel_path, class_name, *ln) for ln in _EXPECTED_LINES)
+    return branches, lines
+
+
+@pytest.fixture(params=["lexbor", "lxml", "html.parser"])
+def backend(request, monkeypatch):
+    """Force one of the source page parsers by hiding the faster ones."""
+    if request.param == "lexbor" and jacoco.LexborHTMLParser is None:
+        pytest.skip("selectolax is not installed")
+    if request.param == "lxml" and jacoco.lxml_etree is None:
+        pytest.skip("lxml is not installed")
+
+    if request.param != "lexbor":
+        monkeypatch.setattr(jacoco, "LexborHTMLParser", None)
+    if request.param == "html.parser":
+        monkeypatch.setattr(jacoco, "lxml_etree", None)
+    return request.param
+
+
+class TestAnalyzeJacocoReport:
+    """Tests for analyze_jacoco_report."""
+
+    @pytest.mark.parametrize("layout", ["directory", "zip"])
+    def test_backends_agree(self, tmp_path, backend, layout):
+        """Test every parser reports the same lines from a directory or a zip."""
+        result = analyze_jacoco_report(**_build_report(tmp_path, layout, 1))
+
+        assert result.total_files_analyzed == 1
+        assert _summarize(result) == _expected(1)
+
+    @pytest.mark.parametrize("layout", ["directory", "zip"])
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_parallel_matches_serial(self, tmp_path, monkeypatch, layout, workers):
+        """Test parsing in worker processes keeps results and their order."""
+        monkeypatch.setattr(os, "cpu_count", lambda: workers)
+        pools = []
+
+        class RecordingPool(jacoco.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(jacoco, "ProcessPoolExecutor", RecordingPool)
+        file_count = jacoco._PARALLEL_MIN_FILES + 1
+
+        result = analyze_jacoco_report(**_build_report(tmp_path, layout, file_count))
+
+        assert len(pools) == (1 if workers > 1 else 0)
+        assert result.total_files_analyzed == file_count
+        assert _summarize(result) == _expected(file_count)
+        if layout == "zip":
+            # Archive members are listed in a fixed order, which results follow
+            expected_paths = [record[0] for record in _expected(file_count)[0]]
+            assert [mb.file_path for mb in result.missed_branches] == expected_paths
+
+    def test_serial_below_parallel_threshold(self, tmp_path, monkeypatch):
+        """Test that small reports are parsed without a process pool."""
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(jacoco, "ProcessPoolExecutor", no_pool)
+        file_count = jacoco._PARALLEL_MIN_FILES - 1
+
+        result = analyze_jacoco_report(**_build_report(tmp_path, "zip", file_count))
+
+        assert _summarize(result) == _expected(file_count)
+
+    def test_pool_unavailable_falls_back_to_serial(self, tmp_path, monkeypatch):
+        """Test that a failing process pool still parses every file in-process."""
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+        def broken_pool(*args, **kwargs):
+            raise OSError("no semaphores")
+
+        monkeypatch.setattr(jacoco, "ProcessPoolExecutor", broken_pool)
+        file_count = jacoco._PARALLEL_MIN_FILES
+
+        result = analyze_jacoco_report(**_build_report(tmp_path, "directory", file_count))
+
+        assert _summarize(result) == _expected(file_count)
+
+    def test_zip_source_directory_points_into_archive(self, tmp_path):
+        """Test the zip result names the report directory inside the archive."""
+        kwargs = _build_report(tmp_path, "zip", 1)
+
+        result = analyze_jacoco_report(**kwargs)
+
+        assert result.source_directory == os.path.join(kwargs["archive_path"], *_REPORT_DIR)
+
+    @pytest.mark.parametrize("layout", ["directory", "zip"])
+    def test_missing_index_raises(self, tmp_path, layout):
+        """Test that a location without a coverage index is rejected."""
+        kwargs = _build_report(tmp_path, layout, 0)
+        if layout == "zip":
+            with zipfile.ZipFile(kwargs["archive_path"], "w") as zf:
+                zf.writestr("notes.txt", "no report here")
+        else:
+            os.remove(os.path.join(kwargs["report_dir"], *_REPORT_DIR, "index.html"))
+
+        with pytest.raises(ValueError, match="index.html"):
+            analyze_jacoco_report(**kwargs)
@@ -0,0 +1,84 @@
+"""
+Tests for the LLM response cache module.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from sonar_jacoco_analyzer.llm_cache import (
+    DiskCache,
+    InMemoryLRU,
+    LLMCache,
+    create_llm_cache,
+)
+
+
+class TestLLMCache:
+    """Tests for LLMCache class."""
+
+    def test_make_key_is_order_independent(self):
+        """Test that keys do not depend on dict ordering."""
+        key1 = LLMCache.make_key({"model": "gpt-4o", "temp": 0})
+        key2 = LLMCache.make_key({"temp": 0, "model": "gpt-4o"})
+
+        assert key1 == key2
+        assert len(key1) == 64
+
+    def test_get_set_tracks_hits_and_misses(self):
+        """Test cache lookups and hit/miss counters."""
+        cache = LLMCache()
+
+        assert cache.get("key") is None
+        cache.set("key", {"type": "feat"})
+        assert cache.get("key") == {"type": "feat"}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_expired_entry_is_a_miss(self):
+        """Test that expired entries are not returned."""
+        cache = LLMCache(ttl=10)
+
+        with patch("sonar_jacoco_analyzer.llm_cache.time.time", return_value=1000.0):
+            cache.set("key", {"type": "feat"})
+        with patch("sonar_jacoco_analyzer.llm_cache.time.time", return_value=1011.0):
+            assert cache.get("key") is None
+
+        assert cache.misses == 1
+
+    def test_in_memory_lru_evicts_oldest(self):
+        """Test that the LRU backend evicts least recently used entries."""
+        backend = InMemoryLRU(max_entries=2)
+        backend.set("a", (1.0, {}))
+        backend.set("b", (1.0, {}))
+        backend.get("a")
+        backend.set("c", (1.0, {}))
+
+        assert backend.get("a") is not None
+        assert backend.get("b") is None
+        assert backend.get("c") is not None
+
+    def test_disk_cache_round_trip(self, tmp_path):
+        """Test that the disk backend persists entries."""
+        cache = LLMCache(DiskCache(str(tmp_path)))
+        cache.set("key", {"type": "fix"})
+
+        reloaded = LLMCache(DiskCache(str(tmp_path)))
+        assert reloaded.get("key") == {"type": "fix"}
+
+
+@pytest.mark.parametrize(
+    "backend,expected",
+    [("memory", InMemoryLRU), ("disk", DiskCache), ("off", None)],
+)
+def test_create_llm_cache(backend, expected):
+    """Test creating caches from backend names."""
+    cache = create_llm_cache(backend)
+
+    if expected is None:
+        assert cache is None
+    else:
+        assert isinstance(cache.backend, expected)